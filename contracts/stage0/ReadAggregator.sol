@@ -0,0 +1,56 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+/**
+ * @title ReadAggregator
+ * @dev Multicall-style helper that executes many view calls in a single eth_call
+ * @author Base Learning Curriculum
+ */
+contract ReadAggregator {
+    // A single read: the target contract and ABI-encoded calldata
+    struct Call {
+        address target;
+        bool allowFailure;
+        bytes callData;
+    }
+
+    // The outcome of a single read
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    // Custom errors for gas-efficient error handling
+    error CallFailed(uint256 index);
+
+    /**
+     * @dev Executes every call with staticcall and returns all results
+     * @param calls The reads to perform, in order
+     * @return blockNumber The block the reads were executed at
+     * @return results One result per call, in the same order
+     * Requirements:
+     * - Calls with allowFailure == false must succeed
+     */
+    function aggregate(Call[] calldata calls)
+        external
+        view
+        returns (uint256 blockNumber, Result[] memory results)
+    {
+        blockNumber = block.number;
+        results = new Result[](calls.length);
+
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory returnData) = calls[i].target.staticcall(calls[i].callData);
+            if (!success && !calls[i].allowFailure) revert CallFailed(i);
+            results[i] = Result({ success: success, returnData: returnData });
+        }
+    }
+
+    /**
+     * @dev Returns the current block number
+     * @return The current block number
+     */
+    function getBlockNumber() external view returns (uint256) {
+        return block.number;
+    }
+}
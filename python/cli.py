@@ -9,23 +9,45 @@ Author: Base Learning Curriculum
 """
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
-console = Console()
+from python.console import console
+from python.instrumentation import enable_profiling, enable_rpc_stats
 
 
 @click.group()
 @click.version_option(version="0.1.0")
-def main():
+@click.option("--rpc-stats", is_flag=True, help="Print per-method JSON-RPC statistics on exit")
+@click.option(
+    "--rpc-stats-file",
+    type=click.Path(dir_okay=False),
+    help="Write JSON-RPC statistics to a file in Prometheus text format",
+)
+@click.option(
+    "--profile", is_flag=True, help="Profile the command (time per phase, functions, memory)"
+)
+@click.option(
+    "--profile-out",
+    type=click.Path(dir_okay=False),
+    help="Dump cProfile statistics to a .pstats file (implies profiling)",
+)
+@click.option(
+    "--profile-memory/--no-profile-memory",
+    default=True,
+    help="Trace allocations while profiling (slows imports; on by default)",
+)
+@click.pass_context
+def main(ctx, rpc_stats, rpc_stats_file, profile, profile_out, profile_memory):
     """
     Base Learning Curriculum CLI
 
     A comprehensive toolkit for learning Base L2 development,
     including smart contract interaction, web3 tools, and utilities.
     """
-    pass
+    if rpc_stats or rpc_stats_file:
+        enable_rpc_stats(ctx, rpc_stats, rpc_stats_file)
+    # Registered last so that it reports (and stops profiling) before the statistics print
+    if profile or profile_out:
+        enable_profiling(ctx, profile, profile_out, profile_memory)
 
 
 @main.group()
@@ -39,6 +61,9 @@ def stage0():
 @click.option("--abi-path", help="Path to contract ABI JSON file")
 def info(contract_address, abi_path):
     """Get comprehensive contract information."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     from python.stage0.hello_base import HelloBaseClient
 
     try:
@@ -87,9 +112,63 @@ def update(contract_address, new_message, abi_path):
         console.print(f"[red]❌ Error: {e}[/red]")
 
 
+@main.group()
+def wallet():
+    """Keystore unlock agent commands."""
+    pass
+
+
+@wallet.command()
+@click.argument("keystore", required=False)
+@click.option("--ttl", default=900, show_default=True, help="Seconds to keep the key unlocked")
+def unlock(keystore, ttl):
+    """Decrypt KEYSTORE (default: KEYSTORE_PATH) once and serve it to later commands."""
+    import os
+
+    from python.common import keyagent
+    from python.common.wallet import unlock_keystore
+
+    keystore = keystore or os.getenv("KEYSTORE_PATH")
+    if not keystore:
+        console.print("[red]❌ Error: pass a keystore or set KEYSTORE_PATH[/red]")
+        return
+    try:
+        account = unlock_keystore(keystore)
+        keyagent.add_key(account.address, account.key.hex(), ttl)
+        console.print(f"[green]🔓 Unlocked {account.address} for {ttl}s[/green]")
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+
+
+@wallet.command()
+def lock():
+    """Stop the unlock agent and forget every unlocked key."""
+    from python.common import keyagent
+
+    if keyagent.stop_agent():
+        console.print("[green]🔒 Unlock agent stopped[/green]")
+    else:
+        console.print("[yellow]No unlock agent running[/yellow]")
+
+
+@wallet.command()
+def status():
+    """Show the accounts held by the unlock agent."""
+    from python.common import keyagent
+
+    accounts = keyagent.agent_status()
+    if not accounts:
+        console.print("[yellow]No unlocked accounts[/yellow]")
+        return
+    for address, remaining in accounts.items():
+        console.print(f"[cyan]{address}[/cyan] unlocked for {remaining:.0f}s more")
+
+
 @main.command()
 def setup():
     """Show setup instructions for the curriculum."""
+    from rich.panel import Panel
+
     instructions = """
 🔧 Base Learning Curriculum Setup
 
@@ -121,6 +200,8 @@ def setup():
 @main.command()
 def version():
     """Show version information."""
+    from rich.panel import Panel
+
     version_info = """
 Base Learning Curriculum v0.1.0
 
@@ -3,9 +3,44 @@ Common utilities for Base L2 development.
 
 This module provides shared utilities for RPC connections,
 wallet management, and other common blockchain operations.
+
+Exports are imported on first access, so that submodules which do not need
+web3 (the keystore agent, bulk signing) load without it.
 """
 
-from .rpc import RPC, get_rpc
-from .wallet import load_account
+import importlib
+
+_EXPORTS = {
+    "EndpointPool": "pool",
+    "RPC": "rpc",
+    "ProviderRegistry": "rpc",
+    "get_async_rpc": "rpc",
+    "get_async_web3": "rpc",
+    "get_registry": "rpc",
+    "get_rpc": "rpc",
+    "get_web3": "rpc",
+    "load_account": "wallet",
+    "pinned": "pool",
+}
+
+__all__ = [
+    "EndpointPool",
+    "RPC",
+    "ProviderRegistry",
+    "get_async_rpc",
+    "get_async_web3",
+    "get_registry",
+    "get_rpc",
+    "get_web3",
+    "load_account",
+    "pinned",
+]
+
 
-__all__ = ["RPC", "get_rpc", "load_account"]
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,381 @@
+"""
+ABI registry built from Foundry build artifacts.
+
+Reads ``out/<Name>.sol/<Name>.json`` (or any ABI / artifact file) once,
+precomputes function selectors, event topics and eth_abi codecs, and keeps a
+compact copy of just the ABI in the cache directory. Foundry artifacts also
+carry bytecode, source maps and the AST, so later runs load the small cache
+instead; an entry is reused while the artifact's mtime and size are unchanged,
+or while its content hash still matches after a rebuild touched it.
+
+Clients get ready-to-use contract factories from :meth:`ContractSpec.factory`,
+built once per Web3 instance, and hot view calls can bypass the contract
+stack altogether with :meth:`FunctionCodec.call`.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from eth_abi.decoding import ContextFramesBytesIO
+from eth_abi.registry import registry as abi_codecs
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector, to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3._utils.abi import abi_to_signature, get_abi_input_types, get_abi_output_types
+from web3._utils.error_formatters_utils import raise_contract_logic_error_on_revert
+from web3.contract.contract import Contract
+from web3.types import RPCEndpoint
+
+# ABI entry types kept in the compact cache
+_ABI_TYPES = ("constructor", "function", "event", "error", "fallback", "receive")
+
+# Bumped whenever the cache layout changes
+_CACHE_VERSION = 1
+
+
+def default_out_dir() -> Path:
+    """Foundry's build output directory (FOUNDRY_OUT, else ``out/`` at the repository root)."""
+    configured = os.getenv("FOUNDRY_OUT")
+    if configured:
+        return Path(configured)
+    return Path(__file__).resolve().parents[2] / "out"
+
+
+class FunctionCodec:
+    """
+    Precomputed selector and eth_abi codecs for one contract function.
+
+    Decoded addresses are checksummed, matching web3's ``.call()`` results.
+    """
+
+    def __init__(self, abi: Dict[str, Any], selector: Optional[bytes] = None):
+        """
+        Initialize the codec.
+
+        Args:
+            abi: ABI entry of the function
+            selector: Precomputed 4-byte selector (computed from the ABI if omitted)
+        """
+        self.abi = abi
+        self.name = abi["name"]
+        self.signature = abi_to_signature(abi)
+        self.selector = selector or function_abi_to_4byte_selector(abi)
+        self.input_types = get_abi_input_types(abi)
+        self.output_types = get_abi_output_types(abi)
+        self._encoder = abi_codecs.get_tuple_encoder(*self.input_types)
+        self._decoder = abi_codecs.get_tuple_decoder(*self.output_types)
+        self._no_args_data: Optional[str] = None
+
+    def encode_call(self, *args: Any) -> bytes:
+        """Calldata for calling the function with ``args``."""
+        return self.selector + self._encoder(args)
+
+    def call(self, w3: Web3, address: str, *args: Any, block_identifier: Any = "latest") -> Any:
+        """
+        Call the function with a raw ``eth_call`` straight to the provider.
+
+        Skips web3's contract machinery and middleware (ABI lookup, argument
+        validation and normalization, formatters); calldata of argument-less
+        functions is encoded once and reused.
+
+        Args:
+            w3: Web3 instance whose provider receives the call
+            address: Contract address
+            args: Function arguments, already in their ABI types
+            block_identifier: Block number (int) or tag
+
+        Returns:
+            The decoded result, like ``ContractFunction.call()``
+
+        Raises:
+            ContractLogicError: If the call reverts
+            ValueError: If the node returns any other error
+        """
+        if args:
+            data = "0x" + self.encode_call(*args).hex()
+        else:
+            if self._no_args_data is None:
+                self._no_args_data = "0x" + self.encode_call().hex()
+            data = self._no_args_data
+        block = hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+        response = w3.provider.make_request(
+            RPCEndpoint("eth_call"), [{"to": address, "data": data}, block]
+        )
+        if "error" in response:
+            raise_contract_logic_error_on_revert(response)
+            raise ValueError(response["error"])
+        return self.decode_output(HexBytes(response["result"]))
+
+    def decode_output(self, data: bytes) -> Any:
+        """
+        Decode the return data of a call.
+
+        Returns:
+            The single return value, or a tuple when the function returns several
+        """
+        values = self._decode(data)
+        return values[0] if len(values) == 1 else values
+
+    def _decode(self, data: bytes) -> Tuple[Any, ...]:
+        values = self._decoder(ContextFramesBytesIO(data))
+        return tuple(
+            _checksum(value) if typ in ("address", "address[]") else value
+            for typ, value in zip(self.output_types, values)
+        )
+
+
+def _checksum(value: Any) -> Any:
+    if isinstance(value, str):
+        return to_checksum_address(value)
+    return [to_checksum_address(v) for v in value]
+
+
+class ContractSpec:
+    """
+    A contract's ABI with its selectors, topics and codecs precomputed.
+
+    Functions are looked up by name (the first overload wins) or by full
+    signature, e.g. ``updateMessage(string)``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        abi: List[Dict[str, Any]],
+        selectors: Optional[Dict[str, str]] = None,
+        topics: Optional[Dict[str, str]] = None,
+        source: Optional[Path] = None,
+    ):
+        """
+        Initialize the spec.
+
+        Args:
+            name: Contract name
+            abi: The contract ABI
+            selectors: Precomputed selector hex per function signature
+            topics: Precomputed topic hex per event signature
+            source: Artifact file the ABI was read from, if any
+        """
+        self.name = name
+        self.abi = abi
+        self.source = source
+        self.functions: Dict[str, FunctionCodec] = {}
+        self.topics: Dict[str, bytes] = {}
+        selectors = selectors or {}
+        topics = topics or {}
+
+        for entry in abi:
+            if entry.get("type") == "function":
+                signature = abi_to_signature(entry)
+                selector = selectors.get(signature)
+                codec = FunctionCodec(entry, bytes.fromhex(selector) if selector else None)
+                self.functions[signature] = codec
+                self.functions.setdefault(entry["name"], codec)
+            elif entry.get("type") == "event":
+                signature = abi_to_signature(entry)
+                topic = topics.get(signature)
+                topic_bytes = bytes.fromhex(topic) if topic else event_abi_to_log_topic(entry)
+                self.topics[signature] = topic_bytes
+                self.topics.setdefault(entry["name"], topic_bytes)
+
+        self._factories: "weakref.WeakKeyDictionary[Any, Type[Contract]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def function(self, name: str) -> FunctionCodec:
+        """The codec of a function, by name or full signature."""
+        try:
+            return self.functions[name]
+        except KeyError:
+            raise ValueError(f"{self.name} has no function {name!r}") from None
+
+    def topic(self, event: str) -> bytes:
+        """The topic0 of an event, by name or full signature."""
+        try:
+            return self.topics[event]
+        except KeyError:
+            raise ValueError(f"{self.name} has no event {event!r}") from None
+
+    def factory(self, w3: Union[Web3, AsyncWeb3]) -> Type[Contract]:
+        """The web3 contract factory for this ABI, built once per (Async)Web3 instance."""
+        factory = self._factories.get(w3)
+        if factory is None:
+            with self._lock:
+                factory = self._factories.get(w3)
+                if factory is None:
+                    factory = self._factories[w3] = w3.eth.contract(abi=self.abi)
+        return factory
+
+    def at(self, w3: Union[Web3, AsyncWeb3], address: str) -> Contract:
+        """A contract instance bound to ``address``."""
+        return self.factory(w3)(address=address)
+
+    def _compact(self) -> Dict[str, Any]:
+        """The cache entry for this spec: the ABI plus precomputed selectors and topics."""
+        return {
+            "name": self.name,
+            "abi": self.abi,
+            "selectors": {
+                sig: codec.selector.hex() for sig, codec in self.functions.items() if "(" in sig
+            },
+            "topics": {sig: topic.hex() for sig, topic in self.topics.items() if "(" in sig},
+        }
+
+
+class AbiRegistry:
+    """
+    Loads contract specs from Foundry artifacts through a compact on-disk cache.
+
+    Specs are memoized in memory per artifact path and re-validated with one
+    ``stat`` per lookup.
+    """
+
+    def __init__(self, out_dir: Optional[Path] = None, cache_path: Optional[Path] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            out_dir: Foundry build output directory (default: :func:`default_out_dir`)
+            cache_path: Compact cache file (default: abi-cache.json in the cache directory)
+        """
+        if cache_path is None:
+            from python.common.event_index import default_cache_dir
+
+            cache_path = default_cache_dir() / "abi-cache.json"
+        self.out_dir = Path(out_dir) if out_dir else default_out_dir()
+        self.cache_path = Path(cache_path)
+        self._specs: Dict[str, Tuple[Tuple[int, int], ContractSpec]] = {}
+        self._inline: Dict[str, ContractSpec] = {}
+        self._disk: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def artifact_path(self, name: str) -> Path:
+        """Where Foundry writes the artifact of contract ``name``."""
+        return self.out_dir / f"{name}.sol" / f"{name}.json"
+
+    def spec(
+        self, name: str, fallback_abi: Optional[Sequence[Dict[str, Any]]] = None
+    ) -> ContractSpec:
+        """
+        Get the spec of a contract built by Foundry.
+
+        Args:
+            name: Contract name, e.g. ``HelloBase``
+            fallback_abi: ABI to use when the contract has not been built
+
+        Returns:
+            The contract spec
+        """
+        path = self.artifact_path(name)
+        if path.exists():
+            return self.load(path)
+        if fallback_abi is None:
+            raise FileNotFoundError(f"No Foundry artifact for {name} at {path}; run `forge build`")
+        with self._lock:
+            spec = self._inline.get(name)
+            if spec is None:
+                spec = self._inline[name] = ContractSpec(name, list(fallback_abi))
+            return spec
+
+    def load(self, path: os.PathLike) -> ContractSpec:
+        """
+        Get the spec of an ABI file: a Foundry/Hardhat artifact or a bare ABI list.
+
+        Args:
+            path: The JSON file
+
+        Returns:
+            The contract spec
+        """
+        path = Path(path).resolve()
+        key = str(path)
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            memo = self._specs.get(key)
+            if memo is not None and memo[0] == stamp:
+                return memo[1]
+            spec = self._load_cached(path, key, stamp)
+            self._specs[key] = (stamp, spec)
+            return spec
+
+    def clear(self) -> None:
+        """Forget every loaded spec and delete the on-disk cache."""
+        with self._lock:
+            self._specs.clear()
+            self._inline.clear()
+            self._disk = {}
+            try:
+                self.cache_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _load_cached(self, path: Path, key: str, stamp: Tuple[int, int]) -> ContractSpec:
+        disk = self._read_disk()
+        entry = disk.get(key)
+        if entry is not None and tuple(entry["stamp"]) == stamp:
+            return self._from_entry(entry, path)
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry is not None and entry["sha256"] == digest:
+            # Touched but unchanged (e.g. a rebuild): refresh the stamp only
+            entry["stamp"] = list(stamp)
+            self._write_disk()
+            return self._from_entry(entry, path)
+
+        document = json.loads(raw)
+        abi = document["abi"] if isinstance(document, dict) else document
+        abi = [item for item in abi if item.get("type", "function") in _ABI_TYPES]
+        name = path.stem
+        spec = ContractSpec(name, abi, source=path)
+        disk[key] = {"stamp": list(stamp), "sha256": digest, **spec._compact()}
+        self._write_disk()
+        return spec
+
+    @staticmethod
+    def _from_entry(entry: Dict[str, Any], path: Path) -> ContractSpec:
+        return ContractSpec(
+            entry["name"], entry["abi"], entry["selectors"], entry["topics"], source=path
+        )
+
+    def _read_disk(self) -> Dict[str, Any]:
+        if self._disk is None:
+            try:
+                cache = json.loads(self.cache_path.read_text())
+            except (OSError, ValueError):
+                cache = {}
+            if cache.get("version") != _CACHE_VERSION:
+                cache = {"version": _CACHE_VERSION, "entries": {}}
+            self._disk = cache["entries"]
+        return self._disk
+
+    def _write_disk(self) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {"version": _CACHE_VERSION, "entries": self._disk}, f, separators=(",", ":")
+                )
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+
+_registry: Optional[AbiRegistry] = None
+
+
+def get_abi_registry() -> AbiRegistry:
+    """Return the process-wide ABI registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = AbiRegistry()
+    return _registry
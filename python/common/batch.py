@@ -0,0 +1,305 @@
+"""
+JSON-RPC batching helpers.
+
+Collects several JSON-RPC requests (including encoded contract view calls)
+and sends them to the node in a single HTTP round trip.
+"""
+
+import itertools
+import json
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.method_formatters import receipt_formatter
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import async_make_post_request, make_post_request
+from web3.contract.contract import ContractFunction
+from web3.datastructures import AttributeDict
+from web3.exceptions import BadFunctionCallOutput
+
+from python.common.rpc import AsyncSessionHTTPProvider, SessionHTTPProvider
+
+BlockIdentifier = Any
+
+_request_ids = itertools.count(1)
+
+
+def send_batch(
+    w3: Web3, requests: List[Tuple[str, List[Any]]], allow_failure: bool = False
+) -> List[Any]:
+    """
+    Send raw JSON-RPC requests to the node in one HTTP round trip.
+
+    Args:
+        w3: Web3 instance whose HTTP provider should receive the batch
+        requests: List of (method, params) pairs
+        allow_failure: Return None for failed requests instead of raising
+
+    Returns:
+        The raw ``result`` of each request (None for failures), in request order
+
+    Raises:
+        ValueError: If the node rejects the batch or any request in it fails
+    """
+    if not requests:
+        return []
+
+    provider = w3.provider
+    ids, data = _encode_batch(requests)
+    if isinstance(provider, SessionHTTPProvider):
+        raw = provider.post(data)
+    else:
+        raw = make_post_request(provider.endpoint_uri, data, **provider.get_request_kwargs())
+    return _decode_batch(raw, ids, allow_failure)
+
+
+async def async_send_batch(
+    w3: AsyncWeb3, requests: List[Tuple[str, List[Any]]], allow_failure: bool = False
+) -> List[Any]:
+    """
+    Like :func:`send_batch`, through an AsyncWeb3's HTTP provider.
+
+    Args:
+        w3: AsyncWeb3 instance whose HTTP provider should receive the batch
+        requests: List of (method, params) pairs
+        allow_failure: Return None for failed requests instead of raising
+
+    Returns:
+        The raw ``result`` of each request (None for failures), in request order
+
+    Raises:
+        ValueError: If the node rejects the batch or any request in it fails
+    """
+    if not requests:
+        return []
+
+    provider = w3.provider
+    ids, data = _encode_batch(requests)
+    if isinstance(provider, AsyncSessionHTTPProvider):
+        raw = await provider.post(data)
+    else:
+        raw = await async_make_post_request(
+            provider.endpoint_uri, data, **provider.get_request_kwargs()
+        )
+    return _decode_batch(raw, ids, allow_failure)
+
+
+def _encode_batch(requests: List[Tuple[str, List[Any]]]) -> Tuple[List[int], bytes]:
+    ids = [next(_request_ids) for _ in requests]
+    payload = [
+        {"jsonrpc": "2.0", "id": rid, "method": method, "params": params}
+        for rid, (method, params) in zip(ids, requests)
+    ]
+    return ids, json.dumps(payload).encode()
+
+
+def _decode_batch(raw: bytes, ids: List[int], allow_failure: bool) -> List[Any]:
+    responses = json.loads(raw)
+
+    # Nodes without batch support answer with a single error object
+    if not isinstance(responses, list):
+        raise ValueError(responses.get("error", responses))
+
+    by_id = {response.get("id"): response for response in responses}
+    results = []
+    for rid in ids:
+        response = by_id.get(rid)
+        if response is None:
+            raise ValueError(f"Missing response for batched request {rid}")
+        if "error" in response:
+            if not allow_failure:
+                raise ValueError(response["error"])
+            results.append(None)
+            continue
+        results.append(response.get("result"))
+    return results
+
+
+class RPCBatch:
+    """
+    A batch of JSON-RPC requests answered in a single round trip.
+
+    Requests are queued with :meth:`add` or :meth:`add_call`; each returns the
+    index of its result in the list produced by :meth:`execute`.
+    """
+
+    def __init__(self, w3: Union[Web3, AsyncWeb3]):
+        """
+        Initialize an empty batch.
+
+        Args:
+            w3: Web3 instance used for transport and ABI decoding (an AsyncWeb3
+                for :meth:`async_execute`)
+        """
+        self.w3 = w3
+        self._requests: List[Tuple[str, List[Any]]] = []
+        self._formatters: List[Optional[Callable[[Any], Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def add(
+        self, method: str, params: List[Any], formatter: Optional[Callable[[Any], Any]] = None
+    ) -> int:
+        """
+        Queue a raw JSON-RPC request.
+
+        Args:
+            method: JSON-RPC method name, e.g. ``eth_getBalance``
+            params: JSON-serializable parameters
+            formatter: Optional callable applied to the raw result
+
+        Returns:
+            Index of this request's result
+        """
+        self._requests.append((method, params))
+        self._formatters.append(formatter)
+        return len(self._requests) - 1
+
+    def add_call(
+        self, function: ContractFunction, block_identifier: BlockIdentifier = "latest"
+    ) -> int:
+        """
+        Queue a contract view call; its result is ABI-decoded like ``.call()``.
+
+        Args:
+            function: A bound contract function, e.g. ``contract.functions.getMessage()``
+            block_identifier: Block number (int) or tag to execute the call at
+
+        Returns:
+            Index of this call's result
+        """
+        tx = {"to": function.address, "data": function._encode_transaction_data()}
+        return self.add(
+            "eth_call",
+            [tx, to_block_param(block_identifier)],
+            lambda result: decode_call_result(self.w3, function.abi, result),
+        )
+
+    def add_balance(self, address: str, block_identifier: BlockIdentifier = "latest") -> int:
+        """
+        Queue an ``eth_getBalance`` request; its result is the balance in wei.
+
+        Args:
+            address: Account address
+            block_identifier: Block number (int) or tag
+
+        Returns:
+            Index of this request's result
+        """
+        return self.add(
+            "eth_getBalance", [address, to_block_param(block_identifier)], lambda r: int(r, 16)
+        )
+
+    def add_receipt(self, tx_hash: str) -> int:
+        """
+        Queue an ``eth_getTransactionReceipt`` request.
+
+        Its result is formatted like ``w3.eth.get_transaction_receipt()``, or is
+        None while the transaction is not mined.
+
+        Args:
+            tx_hash: Transaction hash
+
+        Returns:
+            Index of this request's result
+        """
+        return self.add(
+            "eth_getTransactionReceipt",
+            [tx_hash],
+            lambda r: AttributeDict.recursive(receipt_formatter(r)),
+        )
+
+    def execute(self, allow_failure: bool = False) -> List[Any]:
+        """
+        Send every queued request in one round trip and clear the batch.
+
+        Args:
+            allow_failure: Return None for failed requests instead of raising
+
+        Returns:
+            Formatted results in the order the requests were queued
+
+        Raises:
+            ValueError: If the node rejects the batch or any request in it fails
+            EmptyReturnData: If a view call returned no data
+        """
+        requests, formatters = self._requests, self._formatters
+        self._requests, self._formatters = [], []
+        return _format(formatters, send_batch(self.w3, requests, allow_failure), allow_failure)
+
+    async def async_execute(self, allow_failure: bool = False) -> List[Any]:
+        """
+        :meth:`execute` for a batch built on an AsyncWeb3.
+
+        Args:
+            allow_failure: Return None for failed requests instead of raising
+
+        Returns:
+            Formatted results in the order the requests were queued
+
+        Raises:
+            ValueError: If the node rejects the batch or any request in it fails
+            EmptyReturnData: If a view call returned no data
+        """
+        requests, formatters = self._requests, self._formatters
+        self._requests, self._formatters = [], []
+        raw = await async_send_batch(self.w3, requests, allow_failure)
+        return _format(formatters, raw, allow_failure)
+
+
+def _format(
+    formatters: List[Optional[Callable[[Any], Any]]], results: List[Any], allow_failure: bool
+) -> List[Any]:
+    formatted = []
+    for fmt, result in zip(formatters, results):
+        try:
+            formatted.append(fmt(result) if fmt and result is not None else result)
+        except EmptyReturnData:
+            # The call did not fail on the node, but it did not read anything either
+            if not allow_failure:
+                raise
+            formatted.append(None)
+    return formatted
+
+
+def to_block_param(block_identifier: BlockIdentifier) -> str:
+    """Convert a block number or tag to its JSON-RPC representation."""
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+    return str(block_identifier)
+
+
+class EmptyReturnData(BadFunctionCallOutput):
+    """A view call returned no data, as calls to an address without code do."""
+
+
+def decode_call_result(w3: Web3, fn_abi: Any, result: Union[str, bytes]) -> Any:
+    """
+    Decode raw ``eth_call`` output the same way ``ContractFunction.call()`` does.
+
+    Args:
+        w3: Web3 instance providing the ABI codec
+        fn_abi: ABI entry of the called function
+        result: Return data, hex-encoded or raw bytes
+
+    Returns:
+        The single decoded value, or a list of values for multi-output functions
+
+    Raises:
+        EmptyReturnData: If the function has outputs but ``result`` is empty
+    """
+    output_types = get_abi_output_types(fn_abi)
+    data = HexBytes(result)
+    if output_types and not data:
+        raise EmptyReturnData(
+            f"{fn_abi.get('name', 'call')}() returned no data; is a contract deployed at "
+            "the target address on this chain?"
+        )
+    decoded = w3.codec.decode(output_types, data)
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
@@ -0,0 +1,280 @@
+"""
+Persistent SQLite index of decoded contract events.
+
+Stores decoded logs per (chain, contract) together with the last block that
+was synced, so repeat queries only fetch blocks that are new since the last
+run. Every sync re-fetches the most recent ``reorg_depth`` blocks to drop logs
+from blocks that were reorganized away. A sync reads the head and scans up to
+it on one endpoint of a pool (see :func:`~python.common.pool.pinned`).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+from web3.contract.contract import Contract
+from web3.datastructures import AttributeDict
+
+from python.common.logs import LogScanner
+from python.common.pool import pinned
+
+DEFAULT_REORG_DEPTH = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    event TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    transaction_index INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    block_hash TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (chain_id, address, block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_by_name ON events (chain_id, address, event, block_number);
+CREATE TABLE IF NOT EXISTS sync_state (
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    last_block INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, address)
+);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Directory for on-disk caches (BASE_CACHE_DIR, else $XDG_CACHE_HOME/base-learning)."""
+    configured = os.getenv("BASE_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    xdg = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(xdg) / "base-learning"
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return HexBytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    return value
+
+
+class EventIndex:
+    """
+    A local, incrementally synced store of decoded contract events.
+
+    Rows are keyed by chain id and contract address, so one database file can
+    index any number of contracts across networks.
+    """
+
+    def __init__(self, path: Optional[str] = None, reorg_depth: int = DEFAULT_REORG_DEPTH):
+        """
+        Open (or create) an event index.
+
+        Args:
+            path: SQLite file path (default: ``<cache dir>/events.sqlite``)
+            reorg_depth: Blocks below the last synced block re-fetched on every sync
+        """
+        if path is None:
+            cache_dir = default_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            path = str(cache_dir / "events.sqlite")
+        self.path = path
+        self.reorg_depth = reorg_depth
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def last_synced_block(self, chain_id: int, address: str) -> Optional[int]:
+        """
+        Get the last block synced for a contract.
+
+        Args:
+            chain_id: Chain the contract lives on
+            address: Contract address
+
+        Returns:
+            The block number, or None if the contract was never synced
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT last_block FROM sync_state WHERE chain_id = ? AND address = ?",
+                (chain_id, address.lower()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(
+        self,
+        contract: Contract,
+        event_names: Sequence[str],
+        scanner: LogScanner,
+        chain_id: int,
+        start_block: int = 0,
+    ) -> int:
+        """
+        Fetch and store events emitted since the last sync.
+
+        Args:
+            contract: Contract whose events should be indexed
+            event_names: Names of the events to index, e.g. ``["MessageUpdated"]``
+            scanner: Log scanner used to fetch the new block range
+            chain_id: Chain the contract lives on
+            start_block: First block to scan when the contract was never synced
+
+        Returns:
+            The block number the index is now synced to
+        """
+        address = contract.address.lower()
+        events = {
+            HexBytes(event_abi_to_log_topic(event.abi)): event
+            for event in (contract.events[name]() for name in event_names)
+        }
+        # Head, scan and bookkeeping on one endpoint: with a pool, a lagging node
+        # must not scan up to a head it has not reached (the gap would be lost)
+        with pinned():
+            head = contract.w3.eth.block_number
+
+            last = self.last_synced_block(chain_id, address)
+            from_block = (
+                start_block if last is None else max(start_block, last - self.reorg_depth + 1)
+            )
+            if last is not None and from_block > head:
+                return last
+
+            logs = scanner.get_logs(
+                address=contract.address,
+                topics=[[topic.hex() for topic in events]],
+                from_block=from_block,
+                to_block=head,
+            )
+
+            rows = []
+            for log in logs:
+                event = events.get(HexBytes(log["topics"][0]))
+                if event is None:
+                    continue
+                decoded = event.process_log(log)
+                rows.append(
+                    (
+                        chain_id,
+                        address,
+                        decoded.event,
+                        decoded.blockNumber,
+                        decoded.logIndex,
+                        decoded.transactionIndex,
+                        decoded.transactionHash.hex(),
+                        decoded.blockHash.hex(),
+                        json.dumps({k: _to_json(v) for k, v in decoded.args.items()}),
+                    )
+                )
+
+            # Replace everything from the rollback point so reorged logs disappear
+            with self._lock, self._db:
+                self._db.execute(
+                    "DELETE FROM events WHERE chain_id = ? AND address = ? AND block_number >= ?",
+                    (chain_id, address, from_block),
+                )
+                self._db.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (chain_id, address, head)
+                )
+            return head
+
+    def get_events(
+        self,
+        chain_id: int,
+        address: str,
+        event_name: str,
+        from_block: int = 0,
+        to_block: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[AttributeDict]:
+        """
+        Read indexed events in chain order.
+
+        Args:
+            chain_id: Chain the contract lives on
+            address: Contract address
+            event_name: Event name, e.g. ``MessageUpdated``
+            from_block: Starting block number
+            to_block: Ending block number (default: no upper bound)
+            limit: Return only the most recent ``limit`` events
+
+        Returns:
+            Events shaped like web3's decoded event data
+        """
+        query = (
+            "SELECT event, block_number, log_index, transaction_index, transaction_hash, "
+            "block_hash, args FROM events WHERE chain_id = ? AND address = ? AND event = ? "
+            "AND block_number BETWEEN ? AND ? ORDER BY block_number DESC, log_index DESC"
+        )
+        params: List[Any] = [chain_id, address.lower(), event_name, from_block]
+        params.append(to_block if to_block is not None else 2**62)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [self._to_event(address, row) for row in reversed(rows)]
+
+    def count(
+        self,
+        chain_id: int,
+        address: str,
+        event_name: str,
+        from_block: int = 0,
+        to_block: Optional[int] = None,
+    ) -> int:
+        """
+        Count indexed events.
+
+        Args:
+            chain_id: Chain the contract lives on
+            address: Contract address
+            event_name: Event name
+            from_block: Starting block number
+            to_block: Ending block number (default: no upper bound)
+
+        Returns:
+            Number of matching events
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT COUNT(*) FROM events WHERE chain_id = ? AND address = ? AND event = ? "
+                "AND block_number BETWEEN ? AND ?",
+                (
+                    chain_id,
+                    address.lower(),
+                    event_name,
+                    from_block,
+                    to_block if to_block is not None else 2**62,
+                ),
+            ).fetchone()
+        return row[0]
+
+    @staticmethod
+    def _to_event(address: str, row: Sequence[Any]) -> AttributeDict:
+        event, block_number, log_index, tx_index, tx_hash, block_hash, args = row
+        return AttributeDict(
+            {
+                "args": AttributeDict(json.loads(args)),
+                "event": event,
+                "logIndex": log_index,
+                "transactionIndex": tx_index,
+                "transactionHash": HexBytes(tx_hash),
+                "address": address,
+                "blockHash": HexBytes(block_hash),
+                "blockNumber": block_number,
+            }
+        )
@@ -0,0 +1,165 @@
+"""
+EIP-1559 fee oracle.
+
+Quotes ``maxFeePerGas``/``maxPriorityFeePerGas`` from one ``eth_feeHistory``
+request, which returns both recent priority-fee percentiles and the base fee
+of the next block. A quote belongs to the head block its history ends at: it
+is refetched as soon as a newer block is observed (:meth:`FeeOracle.observe_block`,
+fed e.g. by mined receipts), and otherwise after at most ``max_age`` seconds,
+so any number of transactions built within a block cost no extra round trips.
+"""
+
+import os
+import statistics
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from web3 import AsyncWeb3, Web3
+
+from python.common.watch import BASE_BLOCK_TIME
+
+DEFAULT_PERCENTILE = 50
+
+
+@dataclass(frozen=True)
+class FeeQuote:
+    block_number: int
+    base_fee: int
+    max_priority_fee: int
+    max_fee: int
+
+    def tx_params(self) -> Dict[str, int]:
+        """Fee fields for a type-2 transaction."""
+        return {"maxFeePerGas": self.max_fee, "maxPriorityFeePerGas": self.max_priority_fee}
+
+
+class FeeOracle:
+    """
+    Caches fee history and derives EIP-1559 fees from it.
+
+    Works with either a Web3 (use :meth:`quote`) or an AsyncWeb3 (use
+    :meth:`async_quote`) instance; both share the same cached quote.
+    """
+
+    def __init__(
+        self,
+        w3: Union[Web3, AsyncWeb3],
+        percentile: Optional[float] = None,
+        history_blocks: int = 10,
+        base_fee_multiplier: float = 2.0,
+        min_priority_fee: int = 1,
+        max_age: float = BASE_BLOCK_TIME,
+    ):
+        """
+        Initialize the fee oracle.
+
+        Args:
+            w3: Web3 or AsyncWeb3 instance to query
+            percentile: Priority-fee percentile of recent blocks to pay
+                (default: env FEE_PERCENTILE or 50)
+            history_blocks: Blocks of fee history the priority fee is taken over
+            base_fee_multiplier: Headroom on the next base fee for ``maxFeePerGas``
+            min_priority_fee: Lowest priority fee quoted, in wei
+            max_age: Longest a quote is reused while no newer block has been observed
+        """
+        if percentile is None:
+            percentile = float(os.getenv("FEE_PERCENTILE", DEFAULT_PERCENTILE))
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.w3 = w3
+        self.percentile = percentile
+        self.history_blocks = history_blocks
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee = min_priority_fee
+        self.max_age = max_age
+        self.fetches = 0
+
+        self._quote: Optional[FeeQuote] = None
+        self._fetched_at = 0.0
+        self._head: Optional[int] = None  # newest block number observed
+        self._lock = threading.Lock()
+
+    def quote(self) -> FeeQuote:
+        """Return the fee quote for the next block, refetching once a newer block is known."""
+        with self._lock:
+            if self._stale():
+                history = self.w3.eth.fee_history(self.history_blocks, "latest", [self.percentile])
+                self._store(history)
+            return self._quote
+
+    async def async_quote(self) -> FeeQuote:
+        """Async counterpart of :meth:`quote`; shares the same cache."""
+        if self._stale():
+            history = await self.w3.eth.fee_history(
+                self.history_blocks, "latest", [self.percentile]
+            )
+            with self._lock:
+                self._store(history)
+        return self._quote
+
+    def tx_params(self) -> Dict[str, int]:
+        """Fee fields for the next transaction (see :meth:`FeeQuote.tx_params`)."""
+        return self.quote().tx_params()
+
+    async def async_tx_params(self) -> Dict[str, int]:
+        """Async counterpart of :meth:`tx_params`."""
+        return (await self.async_quote()).tx_params()
+
+    def observe_block(self, number: int) -> None:
+        """Record a block number learned elsewhere (a receipt, a log watcher)."""
+        with self._lock:
+            if self._head is None or number > self._head:
+                self._head = number
+
+    def invalidate(self) -> None:
+        """Drop the cached quote, e.g. after a transaction was underpriced."""
+        with self._lock:
+            self._quote = None
+
+    def _stale(self) -> bool:
+        quote = self._quote
+        if quote is None:
+            return True
+        if self._head is not None and self._head > quote.block_number:
+            # Fee data of an older block than one already seen
+            return True
+        # No newer block known: cap the age, in case none is being observed
+        return time.monotonic() - self._fetched_at >= self.max_age
+
+    def _store(self, history: Any) -> None:
+        """Derive a quote from an ``eth_feeHistory`` result."""
+        rewards = [block[0] for block in history["reward"] if block]
+        priority = int(statistics.median(rewards)) if rewards else 0
+        priority = max(self.min_priority_fee, priority)
+        # The last base fee in the history is the one for the next block
+        base_fee = history["baseFeePerGas"][-1]
+        newest = history["oldestBlock"] + len(history["baseFeePerGas"]) - 2
+        self._quote = FeeQuote(
+            block_number=newest,
+            base_fee=base_fee,
+            max_priority_fee=priority,
+            max_fee=int(base_fee * self.base_fee_multiplier) + priority,
+        )
+        self._fetched_at = time.monotonic()
+        if self._head is None or newest > self._head:
+            self._head = newest
+        self.fetches += 1
+
+
+_oracles: "weakref.WeakKeyDictionary[Any, FeeOracle]" = weakref.WeakKeyDictionary()
+
+
+def get_fee_oracle(w3: Union[Web3, AsyncWeb3]) -> FeeOracle:
+    """
+    Return the shared fee oracle for a Web3 instance, creating it on first use.
+
+    Web3 instances come from the provider registry (one per URL), so every
+    client talking to the same endpoint shares one cached quote.
+    """
+    oracle = _oracles.get(w3)
+    if oracle is None:
+        oracle = _oracles.setdefault(w3, FeeOracle(w3))
+    return oracle
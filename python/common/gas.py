@@ -0,0 +1,157 @@
+"""
+Memoized gas-limit estimation.
+
+Calls ``eth_estimateGas`` the first time a function is sent with calldata of
+a given size bucket and reuses the estimate, plus a safety margin, for later
+transactions of similar size. Estimates for a contract are dropped when its
+code hash changes; the code is re-checked at most once per ``code_ttl``
+seconds, so most sends need no estimation round trip at all.
+
+Gas can also depend on contract state the calldata does not show (HelloBase
+pays more to write storage words that were empty), so a memoized limit may
+run out. Senders :meth:`GasEstimator.forget` the estimate when that happens
+and estimate again.
+"""
+
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple, Union
+
+from eth_utils import keccak, to_checksum_address
+from web3 import AsyncWeb3, Web3
+from web3.contract.contract import ContractFunction
+
+DEFAULT_MARGIN = 1.25
+
+# (contract address, function selector, calldata size bucket)
+GasKey = Tuple[str, str, int]
+
+
+class GasEstimator:
+    """
+    Caches gas estimates per function and calldata-size bucket.
+
+    Works with either a Web3 (use :meth:`estimate`) or an AsyncWeb3 (use
+    :meth:`async_estimate`) instance; both share the same memo.
+    """
+
+    def __init__(
+        self,
+        w3: Union[Web3, AsyncWeb3],
+        margin: float = DEFAULT_MARGIN,
+        bucket_size: int = 32,
+        code_ttl: float = 300,
+    ):
+        """
+        Initialize the gas estimator.
+
+        Args:
+            w3: Web3 or AsyncWeb3 instance to query
+            margin: Multiplier applied to every estimate
+            bucket_size: Calldata bytes per size bucket (one ABI word by default)
+            code_ttl: Seconds between checks of a contract's code hash
+        """
+        self.w3 = w3
+        self.margin = margin
+        self.bucket_size = bucket_size
+        self.code_ttl = code_ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._estimates: Dict[GasKey, int] = {}
+        self._code_hashes: Dict[str, Tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def estimate(self, function: ContractFunction, sender: str, value: int = 0) -> int:
+        """
+        Return a gas limit for sending ``function`` from ``sender``.
+
+        Args:
+            function: A bound contract function, e.g. ``contract.functions.updateMessage(m)``
+            sender: Address the transaction will be sent from
+            value: Wei sent along with the call
+
+        Returns:
+            The memoized or freshly estimated gas, including the safety margin
+        """
+        key = self._key(function)
+        if self._code_expired(key[0]):
+            self._check_code(key[0], self.w3.eth.get_code(key[0]))
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        gas = function.estimate_gas({"from": sender, "value": value})
+        return self._store(key, gas)
+
+    async def async_estimate(self, function: Any, sender: str, value: int = 0) -> int:
+        """Async counterpart of :meth:`estimate`; shares the same memo."""
+        key = self._key(function)
+        if self._code_expired(key[0]):
+            self._check_code(key[0], await self.w3.eth.get_code(key[0]))
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        gas = await function.estimate_gas({"from": sender, "value": value})
+        return self._store(key, gas)
+
+    def forget(self, function: Any) -> None:
+        """Drop the memoized estimate ``function`` would use, e.g. after it ran out of gas."""
+        with self._lock:
+            self._estimates.pop(self._key(function), None)
+
+    def clear(self, address: Optional[str] = None) -> None:
+        """Forget memoized estimates, for one contract or for all of them."""
+        with self._lock:
+            if address is None:
+                self._estimates.clear()
+                self._code_hashes.clear()
+                return
+            address = to_checksum_address(address)
+            self._estimates = {k: v for k, v in self._estimates.items() if k[0] != address}
+            self._code_hashes.pop(address, None)
+
+    def _key(self, function: Any) -> GasKey:
+        data = bytes.fromhex(function._encode_transaction_data()[2:])
+        bucket = -(-len(data[4:]) // self.bucket_size)
+        return (function.address, data[:4].hex(), bucket)
+
+    def _code_expired(self, address: str) -> bool:
+        entry = self._code_hashes.get(address)
+        return entry is None or time.monotonic() - entry[1] >= self.code_ttl
+
+    def _check_code(self, address: str, code: bytes) -> None:
+        """Record the contract's code hash, dropping its estimates if the code changed."""
+        code_hash = keccak(code)
+        with self._lock:
+            previous = self._code_hashes.get(address)
+            if previous is not None and previous[0] != code_hash:
+                self._estimates = {k: v for k, v in self._estimates.items() if k[0] != address}
+            self._code_hashes[address] = (code_hash, time.monotonic())
+
+    def _lookup(self, key: GasKey) -> Optional[int]:
+        with self._lock:
+            gas = self._estimates.get(key)
+            if gas is not None:
+                self.hits += 1
+            return gas
+
+    def _store(self, key: GasKey, estimate: int) -> int:
+        gas = int(estimate * self.margin)
+        with self._lock:
+            self.misses += 1
+            # Keep the largest limit seen for the bucket
+            gas = max(gas, self._estimates.get(key, 0))
+            self._estimates[key] = gas
+        return gas
+
+
+_estimators: "weakref.WeakKeyDictionary[Any, GasEstimator]" = weakref.WeakKeyDictionary()
+
+
+def get_gas_estimator(w3: Union[Web3, AsyncWeb3]) -> GasEstimator:
+    """Return the shared gas estimator for a Web3 instance, creating it on first use."""
+    estimator = _estimators.get(w3)
+    if estimator is None:
+        estimator = _estimators.setdefault(w3, GasEstimator(w3))
+    return estimator
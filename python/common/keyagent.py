@@ -0,0 +1,230 @@
+"""
+Short-lived unlock agent for keystore accounts.
+
+Decrypting a JSON keystore runs scrypt, which takes hundreds of milliseconds
+by design. ``base-cli wallet unlock`` pays that once and hands the key to a
+small background process that serves it to later CLI invocations over a Unix
+socket, until its time-to-live runs out or ``base-cli wallet lock`` stops it.
+
+The socket lives in a directory only the current user can access
+($XDG_RUNTIME_DIR or a per-user temp directory, or KEY_AGENT_SOCK), like an
+ssh-agent socket: any process of the same user can fetch the unlocked key
+while the agent runs, so keep the TTL short. The agent creates that directory
+itself (mode 0700); both sides refuse a directory or socket that is a symlink,
+belongs to another user or is open to group or others, so that nobody else can
+plant a socket at the predictable path and receive the key.
+"""
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_TTL = 900
+
+# Seconds a client waits for the agent to answer or to come up
+_TIMEOUT = 5.0
+
+
+def agent_available() -> bool:
+    """Whether this platform supports the agent (it needs Unix sockets)."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path() -> Path:
+    """Path of the agent socket (KEY_AGENT_SOCK, else a private per-user location)."""
+    configured = os.getenv("KEY_AGENT_SOCK")
+    if configured:
+        return Path(configured)
+    runtime = os.getenv("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "base-learning" / "key-agent.sock"
+    return Path(tempfile.gettempdir()) / f"base-learning-{os.getuid()}" / "key-agent.sock"
+
+
+def _check_private(path: Path, directory: bool) -> None:
+    """Raise unless ``path`` is this user's own directory (0700) or socket (no group/other bits)."""
+    st = os.lstat(path)
+    kind = "directory" if directory else "socket"
+    expected = stat.S_ISDIR(st.st_mode) if directory else stat.S_ISSOCK(st.st_mode)
+    if not expected:
+        raise RuntimeError(f"Refusing to use the unlock agent: {path} is not a {kind}")
+    if st.st_uid != os.getuid():
+        raise RuntimeError(f"Refusing to use the unlock agent: {path} belongs to another user")
+    mode = stat.S_IMODE(st.st_mode)
+    if (directory and mode != 0o700) or (not directory and mode & 0o077):
+        raise RuntimeError(
+            f"Refusing to use the unlock agent: {kind} {path} has mode {mode:o}, "
+            f"expected {'700' if directory else '600'}"
+        )
+
+
+def _runtime_dir(path: Path) -> None:
+    """Create the socket's directory (0700), or check an existing one is private."""
+    try:
+        os.mkdir(path.parent, 0o700)
+    except FileExistsError:
+        pass
+    else:
+        # Ours, so the mode can be fixed up against an unusual umask
+        os.chmod(path.parent, 0o700)
+    _check_private(path.parent, directory=True)
+
+
+def _request(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to the running agent; None if no agent is listening.
+
+    Raises:
+        RuntimeError: If the socket or its directory is not private to this user
+    """
+    if not agent_available():
+        return None
+    path = socket_path()
+    if not os.path.lexists(path.parent) or not os.path.lexists(path):
+        return None
+    # Once the directory is ours and private, nobody else can swap the socket
+    _check_private(path.parent, directory=True)
+    _check_private(path, directory=False)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def fetch_key(address: str) -> Optional[str]:
+    """
+    Ask the agent for the unlocked key of an address.
+
+    Args:
+        address: Account address (any case, with or without 0x)
+
+    Returns:
+        The hex private key, or None if no agent holds it
+    """
+    reply = _request({"op": "get", "address": _normalize(address)})
+    return reply.get("key") if reply else None
+
+
+def agent_status() -> Optional[Dict[str, float]]:
+    """Seconds left per unlocked address, or None if no agent is running."""
+    reply = _request({"op": "status"})
+    return reply.get("accounts") if reply else None
+
+
+def stop_agent() -> bool:
+    """Stop the agent, forgetting every unlocked key. Returns whether one was running."""
+    return _request({"op": "stop"}) is not None
+
+
+def add_key(address: str, private_key: str, ttl: float = DEFAULT_TTL) -> None:
+    """
+    Hand an unlocked key to the agent, starting the agent if needed.
+
+    Args:
+        address: Account address of the key
+        private_key: Hex private key
+        ttl: Seconds the agent keeps the key
+    """
+    if not agent_available():
+        raise RuntimeError("The unlock agent needs Unix domain sockets")
+    message = {"op": "add", "address": _normalize(address), "key": private_key, "ttl": ttl}
+    if _request(message) is not None:
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "python.common.keyagent"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + _TIMEOUT
+    while time.monotonic() < deadline:
+        if _request(message) is not None:
+            return
+        time.sleep(0.05)
+    raise RuntimeError(f"Unlock agent did not start on {socket_path()}")
+
+
+def _normalize(address: str) -> str:
+    address = address.lower()
+    return address if address.startswith("0x") else "0x" + address
+
+
+def serve() -> None:
+    """Run the agent until every key has expired or it is told to stop."""
+    path = socket_path()
+    _runtime_dir(path)
+    if os.path.lexists(path):
+        # A stale socket of an agent that died; only ours can be in a private directory
+        _check_private(path, directory=False)
+        path.unlink()
+
+    keys: Dict[str, Any] = {}  # address -> (private key, expiry)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(str(path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        # Exit on its own if nobody adds a key shortly after start
+        idle_deadline = time.monotonic() + _TIMEOUT * 2
+        try:
+            while True:
+                now = time.monotonic()
+                keys = {a: entry for a, entry in keys.items() if entry[1] > now}
+                deadline = max((entry[1] for entry in keys.values()), default=idle_deadline)
+                if deadline <= now:
+                    return
+                server.settimeout(deadline - now)
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    conn.settimeout(_TIMEOUT)
+                    try:
+                        request = json.loads(conn.makefile("rb").readline() or b"{}")
+                    except (OSError, ValueError):
+                        continue
+                    op = request.get("op")
+                    if op == "get":
+                        entry = keys.get(request.get("address"))
+                        reply: Dict[str, Any] = {"key": entry[0] if entry else None}
+                    elif op == "add":
+                        expiry = time.monotonic() + float(request.get("ttl", DEFAULT_TTL))
+                        keys[request["address"]] = (request["key"], expiry)
+                        reply = {"ok": True}
+                    elif op == "status":
+                        now = time.monotonic()
+                        reply = {"accounts": {a: entry[1] - now for a, entry in keys.items()}}
+                    elif op == "stop":
+                        conn.sendall(b'{"ok": true}\n')
+                        return
+                    else:
+                        reply = {"error": f"unknown op {op!r}"}
+                    try:
+                        conn.sendall(json.dumps(reply).encode() + b"\n")
+                    except OSError:
+                        pass
+        finally:
+            if path.exists():
+                path.unlink()
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,317 @@
+"""
+Chunked eth_getLogs scanner.
+
+Splits a block range into chunks, fetches them concurrently with a bounded
+worker pool and returns the logs in chain order. The chunk size adapts to the
+provider: it grows while responses are small and shrinks (splitting the failed
+chunk) when the provider reports too many results or times out.
+:class:`AsyncLogScanner` does the same over an AsyncWeb3 with ``asyncio.gather``.
+
+A scan resolves "latest" once and then only asks for blocks up to it, so with
+an endpoint pool it runs :func:`~python.common.pool.pinned` to one endpoint: a
+lagging one could otherwise answer for blocks it does not have yet.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from web3 import AsyncWeb3, Web3
+
+from python.common.pool import pinned
+
+# Fragments of the errors providers return when a getLogs range is too large
+# (geth/Infura, Alchemy, QuickNode, Ankr, Erigon, Nethermind, ...)
+RANGE_ERROR_HINTS = (
+    "query returned more than",
+    "response size exceeded",
+    "response size should not",
+    "block range",
+    "blocks range",
+    "range too large",
+    "range is too large",
+    "range is too wide",
+    "ranges over",
+    "is limited to a",
+    "logs matched by query exceeds",
+    "query timeout exceeded",
+    "timed out",
+)
+
+# Rate limit and quota errors, which some providers share codes (-32005) and words
+# ("exceeded", "limit") with range errors; splitting would only send more requests
+RATE_LIMIT_HINTS = (
+    "rate limit",
+    "too many requests",
+    "request limit",
+    "daily request count",
+    "quota",
+    "capacity",
+    "compute units",
+    "throughput",
+)
+
+
+def is_range_error(error: Exception) -> bool:
+    """Return True if a getLogs error means the block range should be split."""
+    if isinstance(error, (requests.exceptions.Timeout, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, ValueError):
+        detail = error.args[0] if error.args else ""
+        if isinstance(detail, dict):
+            detail = detail.get("message", "")
+        message = str(detail).lower()
+        if any(hint in message for hint in RATE_LIMIT_HINTS):
+            return False
+        return any(hint in message for hint in RANGE_ERROR_HINTS)
+    return False
+
+
+class BaseLogScanner:
+    """
+    Adaptive chunk sizing shared by :class:`LogScanner` and :class:`AsyncLogScanner`.
+
+    One scanner can be reused across queries; the chunk size it has learned
+    for the provider carries over from one query to the next. A rejected chunk
+    also lowers the ceiling the chunk size may grow back to.
+    """
+
+    def __init__(
+        self,
+        w3: Any,
+        chunk_size: int = 5_000,
+        min_chunk_size: int = 1,
+        max_chunk_size: int = 500_000,
+        target_results: int = 2_000,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            w3: Web3 (or, for the async scanner, AsyncWeb3) instance to query
+            chunk_size: Initial number of blocks per eth_getLogs request
+            min_chunk_size: Smallest chunk the scanner will shrink to
+            max_chunk_size: Largest chunk the scanner will grow to
+            target_results: Logs per response the chunk size is tuned towards
+            max_workers: Maximum concurrent eth_getLogs requests
+        """
+        self.w3 = w3
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_results = target_results
+        self.max_workers = max_workers
+        self._ceiling = max_chunk_size
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _criteria(address: Optional[str], topics: Optional[Sequence[Any]]) -> Dict[str, Any]:
+        criteria: Dict[str, Any] = {}
+        if address:
+            criteria["address"] = address
+        if topics:
+            criteria["topics"] = list(topics)
+        return criteria
+
+    def _next_ranges(self, cursor: int, end: int) -> List[Tuple[int, int]]:
+        """Carve up to ``max_workers`` consecutive chunks starting at ``cursor``."""
+        ranges = []
+        size = self.chunk_size
+        while cursor <= end and len(ranges) < self.max_workers:
+            stop = min(cursor + size - 1, end)
+            ranges.append((cursor, stop))
+            cursor = stop + 1
+        return ranges
+
+    def _split(self, start: int, stop: int) -> int:
+        """Shrink the chunk size after ``start..stop`` was rejected; the midpoint to split at."""
+        span = stop - start + 1
+        with self._lock:
+            self._ceiling = max(self.min_chunk_size, min(self._ceiling, span // 2))
+        self._resize(span // 2)
+        return (start + stop) // 2
+
+    def _tune(self, span: int, results: int) -> None:
+        """Grow or shrink the chunk size from a successful response."""
+        if results > self.target_results:
+            self._resize(span * self.target_results / results)
+        elif results < self.target_results // 2 and span >= self.chunk_size:
+            self._resize(self.chunk_size * 2)
+
+    def _resize(self, size: float) -> None:
+        with self._lock:
+            self.chunk_size = int(max(self.min_chunk_size, min(self._ceiling, size)))
+
+
+class LogScanner(BaseLogScanner):
+    """Fetches logs over large block ranges in adaptive, concurrent chunks."""
+
+    w3: Web3
+
+    def get_logs(
+        self,
+        address: Optional[str] = None,
+        topics: Optional[Sequence[Any]] = None,
+        from_block: int = 0,
+        to_block: Any = "latest",
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every log matching the filter between two blocks (inclusive).
+
+        Args:
+            address: Contract address to filter on
+            topics: Topic filter, as accepted by eth_getLogs
+            from_block: Starting block number
+            to_block: Ending block number or a tag such as 'latest'
+
+        Returns:
+            Raw logs ordered by block number and log index
+        """
+        with pinned():
+            end = self._resolve_block(to_block)
+            if end < from_block:
+                return []
+
+            criteria = self._criteria(address, topics)
+
+            logs: List[Dict[str, Any]] = []
+            cursor = from_block
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while cursor <= end:
+                    ranges = self._next_ranges(cursor, end)
+                    # Workers run in copies of this context, so they share the pin
+                    contexts = [copy_context() for _ in ranges]
+                    for chunk in pool.map(
+                        lambda r, context: context.run(self._fetch, criteria, *r), ranges, contexts
+                    ):
+                        logs.extend(chunk)
+                    cursor = ranges[-1][1] + 1
+            return logs
+
+    def get_recent_logs(
+        self,
+        count: int,
+        address: Optional[str] = None,
+        topics: Optional[Sequence[Any]] = None,
+        from_block: int = 0,
+        to_block: Any = "latest",
+        initial_window: int = 1_000,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the most recent ``count`` logs by scanning backwards from ``to_block``.
+
+        Windows start at ``initial_window`` blocks and double after every request
+        (up to the largest range the provider accepts), so the cost depends on
+        how recent the logs are rather than on the length of the chain.
+
+        Args:
+            count: Number of logs wanted
+            address: Contract address to filter on
+            topics: Topic filter, as accepted by eth_getLogs
+            from_block: Lowest block to scan back to
+            to_block: Block number or tag to start scanning back from
+            initial_window: Size of the first (most recent) window in blocks
+
+        Returns:
+            Up to ``count`` raw logs, ordered by block number and log index
+        """
+        with pinned():
+            end = self._resolve_block(to_block)
+            criteria = self._criteria(address, topics)
+
+            logs: List[Dict[str, Any]] = []
+            window = max(1, initial_window)
+            while end >= from_block and len(logs) < count:
+                start = max(from_block, end - window + 1)
+                logs = self._fetch(criteria, start, end) + logs
+                end = start - 1
+                window = min(window * 2, self._ceiling)
+        return logs[-count:] if count > 0 else []
+
+    def _resolve_block(self, block: Any) -> int:
+        if isinstance(block, int):
+            return block
+        if block == "latest":
+            return self.w3.eth.block_number
+        return self.w3.eth.get_block(block).number
+
+    def _fetch(self, criteria: Dict[str, Any], start: int, stop: int) -> List[Dict[str, Any]]:
+        """Fetch one chunk, splitting it in half whenever the provider rejects it."""
+        try:
+            logs = self.w3.eth.get_logs({**criteria, "fromBlock": start, "toBlock": stop})
+        except Exception as e:
+            if start == stop or not is_range_error(e):
+                raise
+            mid = self._split(start, stop)
+            return self._fetch(criteria, start, mid) + self._fetch(criteria, mid + 1, stop)
+
+        self._tune(stop - start + 1, len(logs))
+        return list(logs)
+
+
+class AsyncLogScanner(BaseLogScanner):
+    """:class:`LogScanner` for an AsyncWeb3; each round of chunks runs with ``asyncio.gather``."""
+
+    w3: AsyncWeb3
+
+    async def get_logs(
+        self,
+        address: Optional[str] = None,
+        topics: Optional[Sequence[Any]] = None,
+        from_block: int = 0,
+        to_block: Any = "latest",
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every log matching the filter between two blocks (inclusive).
+
+        Args:
+            address: Contract address to filter on
+            topics: Topic filter, as accepted by eth_getLogs
+            from_block: Starting block number
+            to_block: Ending block number or a tag such as 'latest'
+
+        Returns:
+            Raw logs ordered by block number and log index
+        """
+        with pinned():
+            end = await self._resolve_block(to_block)
+            if end < from_block:
+                return []
+
+            criteria = self._criteria(address, topics)
+
+            logs: List[Dict[str, Any]] = []
+            cursor = from_block
+            while cursor <= end:
+                ranges = self._next_ranges(cursor, end)
+                chunks = await asyncio.gather(*(self._fetch(criteria, *r) for r in ranges))
+                for chunk in chunks:
+                    logs.extend(chunk)
+                cursor = ranges[-1][1] + 1
+            return logs
+
+    async def _resolve_block(self, block: Any) -> int:
+        if isinstance(block, int):
+            return block
+        if block == "latest":
+            return await self.w3.eth.block_number
+        return (await self.w3.eth.get_block(block)).number
+
+    async def _fetch(self, criteria: Dict[str, Any], start: int, stop: int) -> List[Dict[str, Any]]:
+        """Fetch one chunk, splitting it in half whenever the provider rejects it."""
+        try:
+            logs = await self.w3.eth.get_logs({**criteria, "fromBlock": start, "toBlock": stop})
+        except Exception as e:
+            if start == stop or not is_range_error(e):
+                raise
+            mid = self._split(start, stop)
+            return await self._fetch(criteria, start, mid) + await self._fetch(
+                criteria, mid + 1, stop
+            )
+
+        self._tune(stop - start + 1, len(logs))
+        return list(logs)
@@ -0,0 +1,264 @@
+"""
+JSON-RPC instrumentation.
+
+When enabled, the registry's providers report every HTTP round trip to the
+process-wide :class:`RPCMetrics`: per JSON-RPC method it counts calls and
+errors, sums request and response bytes, and keeps a latency histogram.
+Latency is measured as the caller sees it, throttling and retries included.
+
+A batch is one round trip, recorded under the method ``batch``; the methods
+it carried are counted as ``batched`` calls of their own. JSON-RPC error
+responses (reverts included) count as errors of the method that got them.
+
+Only the standard library is imported here, so that the command-line tools
+can enable collection before web3 is loaded.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Upper bounds of the latency histogram buckets, in seconds (as Prometheus clients use)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+BATCH = "batch"
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram with quantile estimates."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation within its bucket.
+
+        Like Prometheus' ``histogram_quantile``, but bucket bounds are narrowed
+        to the smallest and largest observations, which keeps estimates from
+        few samples (and from the +Inf bucket) within the observed range.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = max(self.buckets[index - 1] if index else 0.0, self.min)
+                upper = min(
+                    self.buckets[index] if index < len(self.buckets) else self.max, self.max
+                )
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(``le`` label, cumulative count) pairs in Prometheus order."""
+        pairs, total = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+
+@dataclass
+class MethodStats:
+    """Counters of one JSON-RPC method."""
+
+    calls: int = 0  # round trips (for ``batch``) or single requests
+    batched: int = 0  # requests of this method sent inside a batch
+    errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+
+
+class RPCMetrics:
+    """
+    Thread-safe per-method JSON-RPC statistics.
+
+    Collection is off until :meth:`enable` is called, so uninstrumented
+    processes pay only an attribute check per request.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._methods: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._methods.clear()
+
+    def record(
+        self,
+        request: bytes,
+        seconds: float,
+        response: Optional[bytes] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record one HTTP round trip.
+
+        Args:
+            request: Encoded JSON-RPC request or batch
+            seconds: Time the caller waited for the answer
+            response: Raw response body, when one arrived
+            error: Transport or HTTP error raised instead of a response
+        """
+        payload = json.loads(request)
+        batch = isinstance(payload, list)
+        items = payload if batch else [payload]
+        methods = {item.get("id"): item.get("method", "") for item in items}
+        key = BATCH if batch else items[0].get("method", "")
+
+        failed: List[str] = []
+        # Only parse the answer when it can contain an error object
+        if response is not None and b'"error"' in response:
+            try:
+                answer = json.loads(response)
+            except ValueError:
+                answer = []
+            for item in answer if isinstance(answer, list) else [answer]:
+                if isinstance(item, dict) and item.get("error") is not None:
+                    failed.append(methods.get(item.get("id"), key))
+
+        with self._lock:
+            stats = self._stats(key)
+            stats.calls += 1
+            stats.request_bytes += len(request)
+            stats.response_bytes += len(response or b"")
+            stats.latency.observe(seconds)
+            if error is not None:
+                stats.errors += 1
+            if batch:
+                for method in methods.values():
+                    self._stats(method).batched += 1
+            for method in failed:
+                self._stats(method).errors += 1
+
+    def _stats(self, method: str) -> MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = MethodStats()
+        return stats
+
+    def snapshot(self) -> Dict[str, MethodStats]:
+        """A copy of the per-method statistics."""
+        with self._lock:
+            return {
+                method: MethodStats(
+                    s.calls,
+                    s.batched,
+                    s.errors,
+                    s.request_bytes,
+                    s.response_bytes,
+                    _copy(s.latency),
+                )
+                for method, s in self._methods.items()
+            }
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """One row per method, the most time-consuming first."""
+        rows = []
+        for method, s in self.snapshot().items():
+            hist = s.latency
+            rows.append(
+                {
+                    "method": method,
+                    "calls": s.calls,
+                    "batched": s.batched,
+                    "errors": s.errors,
+                    "total_ms": hist.sum * 1000,
+                    "mean_ms": hist.sum / hist.count * 1000 if hist.count else None,
+                    "p50_ms": _ms(hist.quantile(0.5)),
+                    "p95_ms": _ms(hist.quantile(0.95)),
+                    "max_ms": hist.max * 1000 if hist.count else None,
+                    "request_bytes": s.request_bytes,
+                    "response_bytes": s.response_bytes,
+                }
+            )
+        return sorted(rows, key=lambda row: (-row["total_ms"], -row["calls"], row["method"]))
+
+    def to_prometheus(self) -> str:
+        """The statistics in the Prometheus text exposition format."""
+        methods = sorted(self.snapshot().items())
+        lines: List[str] = []
+
+        def counter(name: str, help_text: str, attribute: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for method, s in methods:
+                lines.append(f'{name}{{method="{method}"}} {getattr(s, attribute)}')
+
+        counter("rpc_requests_total", "JSON-RPC round trips sent, by method.", "calls")
+        counter("rpc_batched_requests_total", "JSON-RPC requests sent inside batches.", "batched")
+        counter("rpc_errors_total", "Failed JSON-RPC requests, by method.", "errors")
+        counter("rpc_request_bytes_total", "Encoded request bytes sent.", "request_bytes")
+        counter("rpc_response_bytes_total", "Response bytes received.", "response_bytes")
+
+        name = "rpc_request_duration_seconds"
+        lines.append(f"# HELP {name} JSON-RPC round-trip latency, by method.")
+        lines.append(f"# TYPE {name} histogram")
+        for method, s in methods:
+            for le, count in s.latency.cumulative():
+                lines.append(f'{name}_bucket{{method="{method}",le="{le}"}} {count}')
+            lines.append(f'{name}_sum{{method="{method}"}} {s.latency.sum!r}')
+            lines.append(f'{name}_count{{method="{method}"}} {s.latency.count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path]) -> None:
+        """Write :meth:`to_prometheus` atomically, e.g. for node_exporter's textfile collector."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _copy(hist: Histogram) -> Histogram:
+    copy = Histogram(hist.buckets)
+    copy.counts = list(hist.counts)
+    copy.count, copy.sum, copy.min, copy.max = hist.count, hist.sum, hist.min, hist.max
+    return copy
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
+
+
+_metrics = RPCMetrics(enabled=os.getenv("RPC_METRICS", "0") == "1")
+
+
+def get_metrics() -> RPCMetrics:
+    """Return the process-wide JSON-RPC statistics."""
+    return _metrics
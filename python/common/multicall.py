@@ -0,0 +1,239 @@
+"""
+Multi-read helpers built on the ReadAggregator contract.
+
+Packs any number of contract view calls into a single ``eth_call`` against a
+deployed ReadAggregator (see ``contracts/stage0/ReadAggregator.sol``). When no
+aggregator is deployed the calls fall back to one JSON-RPC batch instead.
+"""
+
+import os
+from typing import Any, List, Optional, Sequence, Union
+
+from web3 import AsyncWeb3, Web3
+from web3.contract.contract import ContractFunction
+
+from python.common.batch import BlockIdentifier, EmptyReturnData, RPCBatch, decode_call_result
+
+READ_AGGREGATOR_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct ReadAggregator.Call[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate",
+        "outputs": [
+            {"internalType": "uint256", "name": "blockNumber", "type": "uint256"},
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct ReadAggregator.Result[]",
+                "name": "results",
+                "type": "tuple[]",
+            },
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+class ReadAggregator:
+    """
+    A client for the ReadAggregator contract.
+
+    Each :meth:`read_many` call is answered by a single ``eth_call``, no matter
+    how many view calls it contains.
+    """
+
+    def __init__(self, w3: Union[Web3, AsyncWeb3], address: str):
+        """
+        Initialize the aggregator client.
+
+        Args:
+            w3: Web3 (or AsyncWeb3) instance connected to the target chain
+            address: Address of the deployed ReadAggregator contract
+        """
+        self.w3 = w3
+        self.address = Web3.to_checksum_address(address)
+        self.contract = w3.eth.contract(address=self.address, abi=READ_AGGREGATOR_ABI)
+
+    def aggregate(
+        self,
+        calls: Sequence[ContractFunction],
+        allow_failure: bool = False,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> tuple:
+        """
+        Execute view calls in one ``eth_call``.
+
+        Args:
+            calls: Bound contract functions, e.g. ``contract.functions.getUserData(addr)``
+            allow_failure: Return None for failing calls instead of reverting the batch
+            block_identifier: Block number (int) or tag to execute the calls at
+
+        Returns:
+            Tuple of (block number, list of decoded results)
+
+        Raises:
+            EmptyReturnData: If a call returned no data (e.g. its target has no
+                code) and ``allow_failure`` is False
+        """
+        block_number, results = self.contract.functions.aggregate(_pack(calls, allow_failure)).call(
+            block_identifier=block_identifier
+        )
+        return block_number, self._decode(calls, results, allow_failure)
+
+    async def async_aggregate(
+        self,
+        calls: Sequence[ContractFunction],
+        allow_failure: bool = False,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> tuple:
+        """
+        :meth:`aggregate` for an aggregator client built on an AsyncWeb3.
+
+        Args:
+            calls: Bound contract functions
+            allow_failure: Return None for failing calls instead of reverting the batch
+            block_identifier: Block number (int) or tag to execute the calls at
+
+        Returns:
+            Tuple of (block number, list of decoded results)
+        """
+        block_number, results = await self.contract.functions.aggregate(
+            _pack(calls, allow_failure)
+        ).call(block_identifier=block_identifier)
+        return block_number, self._decode(calls, results, allow_failure)
+
+    def _decode(
+        self, calls: Sequence[ContractFunction], results: Sequence[tuple], allow_failure: bool
+    ) -> List[Any]:
+        decoded = []
+        for fn, (success, return_data) in zip(calls, results):
+            try:
+                decoded.append(
+                    decode_call_result(self.w3, fn.abi, return_data) if success else None
+                )
+            except EmptyReturnData:
+                # A staticcall to an address without code succeeds with no data
+                if not allow_failure:
+                    raise
+                decoded.append(None)
+        return decoded
+
+    def read_many(
+        self,
+        calls: Sequence[ContractFunction],
+        allow_failure: bool = False,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[Any]:
+        """
+        Execute view calls in one ``eth_call`` and return only their results.
+
+        Args:
+            calls: Bound contract functions
+            allow_failure: Return None for failing calls instead of reverting the batch
+            block_identifier: Block number (int) or tag to execute the calls at
+
+        Returns:
+            Decoded results, in the same order as ``calls``
+
+        Raises:
+            EmptyReturnData: If a call returned no data and ``allow_failure`` is False
+        """
+        return self.aggregate(calls, allow_failure, block_identifier)[1]
+
+
+def read_many(
+    w3: Web3,
+    calls: Sequence[ContractFunction],
+    aggregator_address: Optional[str] = None,
+    allow_failure: bool = False,
+    block_identifier: BlockIdentifier = "latest",
+) -> List[Any]:
+    """
+    Execute many view calls with as few round trips as possible.
+
+    Uses the ReadAggregator at ``aggregator_address`` (or ``READ_AGGREGATOR_ADDRESS``)
+    when one is configured, otherwise sends the calls as one JSON-RPC batch.
+
+    Args:
+        w3: Web3 instance connected to the target chain
+        calls: Bound contract functions
+        aggregator_address: Optional ReadAggregator address
+        allow_failure: Return None for failing calls instead of raising
+        block_identifier: Block number (int) or tag to execute the calls at
+
+    Returns:
+        Decoded results, in the same order as ``calls``
+    """
+    if not calls:
+        return []
+
+    aggregator_address = aggregator_address or os.getenv("READ_AGGREGATOR_ADDRESS")
+    if aggregator_address:
+        aggregator = ReadAggregator(w3, aggregator_address)
+        return aggregator.read_many(calls, allow_failure, block_identifier)
+
+    batch = RPCBatch(w3)
+    for fn in calls:
+        batch.add_call(fn, block_identifier)
+    return batch.execute(allow_failure=allow_failure)
+
+
+async def async_read_many(
+    w3: AsyncWeb3,
+    calls: Sequence[ContractFunction],
+    aggregator_address: Optional[str] = None,
+    allow_failure: bool = False,
+    block_identifier: BlockIdentifier = "latest",
+) -> List[Any]:
+    """
+    :func:`read_many` over an AsyncWeb3: one ``eth_call`` or one JSON-RPC batch.
+
+    Args:
+        w3: AsyncWeb3 instance connected to the target chain
+        calls: Bound contract functions
+        aggregator_address: Optional ReadAggregator address
+        allow_failure: Return None for failing calls instead of raising
+        block_identifier: Block number (int) or tag to execute the calls at
+
+    Returns:
+        Decoded results, in the same order as ``calls``
+    """
+    if not calls:
+        return []
+
+    aggregator_address = aggregator_address or os.getenv("READ_AGGREGATOR_ADDRESS")
+    if aggregator_address:
+        aggregator = ReadAggregator(w3, aggregator_address)
+        return (await aggregator.async_aggregate(calls, allow_failure, block_identifier))[1]
+
+    batch = RPCBatch(w3)
+    for fn in calls:
+        batch.add_call(fn, block_identifier)
+    return await batch.async_execute(allow_failure=allow_failure)
+
+
+def _pack(calls: Sequence[ContractFunction], allow_failure: bool) -> List[tuple]:
+    return [
+        (fn.address, allow_failure, Web3.to_bytes(hexstr=fn._encode_transaction_data()))
+        for fn in calls
+    ]
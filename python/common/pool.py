@@ -0,0 +1,504 @@
+"""
+Multi-endpoint RPC routing.
+
+An :class:`EndpointPool` spreads JSON-RPC traffic over several providers of
+the same chain. Each endpoint keeps an EWMA of its latency and error rate and
+a circuit breaker; requests go to the fastest healthy endpoint (with a small
+share sent elsewhere so that the other estimates stay current), and a
+read that is still unanswered after that endpoint's p95 latency is hedged with
+a duplicate sent to the next-fastest endpoint (the first answer wins).
+Transactions are never hedged, only failed over when an endpoint errors.
+
+Endpoints of one chain are rarely at exactly the same head, so a flow of
+requests that build on each other (read the head, then query logs up to it)
+should run inside :func:`pinned`, which sends all of them to one endpoint.
+
+Only transport failures (timeouts, connection errors, HTTP 429/5xx) count
+against an endpoint; JSON-RPC error responses such as reverts are ordinary
+answers and are returned to the caller.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import requests
+
+from python.common.throttle import Throttle, is_idempotent, request_methods
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Largest multiple of the current EWMA one latency sample may add to it
+OUTLIER_FACTOR = 3.0
+
+# Endpoint each pool is pinned to by the innermost active pinned() block
+_pins: "ContextVar[Optional[Dict[EndpointPool, Endpoint]]]" = ContextVar("rpc_pins", default=None)
+
+
+@contextmanager
+def pinned() -> Iterator[None]:
+    """
+    Send the pooled requests made inside the block to one endpoint per pool.
+
+    The first request is routed as usual and picks the endpoint; the rest go
+    to the same one and are not hedged. If it fails, the request fails over
+    and the pin moves to the endpoint that answered. Nested blocks share the
+    outer pin; asyncio tasks started inside inherit it, threads only when they
+    run in a copy of the context (``contextvars.copy_context``). Without a
+    pool (a single endpoint) this does nothing.
+    """
+    if _pins.get() is not None:
+        yield
+        return
+    token = _pins.set({})
+    try:
+        yield
+    finally:
+        _pins.reset(token)
+
+
+class CircuitBreaker:
+    """
+    Cuts an endpoint off after consecutive failures.
+
+    Closed until ``failure_threshold`` failures in a row, then open (no
+    traffic) for ``reset_timeout`` seconds, then half-open: one trial request
+    either closes it again or re-opens it. A trial that never reports back
+    (e.g. a cancelled hedge) expires after ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def available(self) -> bool:
+        """Whether a request could be sent now; unlike :meth:`allow`, claims nothing."""
+        state = self.state
+        if state == "closed":
+            return True
+        trial = self._trial_started
+        return state == "half-open" and (
+            trial is None or time.monotonic() - trial >= self.reset_timeout
+        )
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now; claims the trial slot when half-open."""
+        if not self.available():
+            return False
+        if self.opened_at is not None:
+            self._trial_started = time.monotonic()
+        return True
+
+    def record(self, ok: bool) -> None:
+        self._trial_started = None
+        if ok:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class Endpoint:
+    """Latency and health statistics of one RPC URL."""
+
+    def __init__(
+        self,
+        url: str,
+        alpha: float = 0.3,
+        window: int = 200,
+        breaker: Optional[CircuitBreaker] = None,
+        throttle: Optional[Throttle] = None,
+    ):
+        """
+        Initialize the endpoint.
+
+        Args:
+            url: HTTP(S) RPC endpoint
+            alpha: EWMA weight of the newest sample
+            window: Recent latencies kept for the p95
+            breaker: Circuit breaker (default: 3 failures, 10 s cool-down)
+            throttle: Adaptive limiter requests to this endpoint go through
+        """
+        self.url = url
+        self.alpha = alpha
+        self.breaker = breaker or CircuitBreaker()
+        self.throttle = throttle
+        self.latency: Optional[float] = None  # EWMA, seconds
+        self.error_rate = 0.0  # EWMA of failures
+        self.requests = 0
+        self.errors = 0
+        self.hedges = 0  # hedged duplicates sent here
+        self.hedge_wins = 0  # hedged duplicates that answered first
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Fold one request's outcome into the statistics."""
+        with self._lock:
+            self.requests += 1
+            self.error_rate += self.alpha * ((0.0 if ok else 1.0) - self.error_rate)
+            if ok:
+                self._samples.append(latency)
+                if self.latency is None:
+                    self.latency = latency
+                else:
+                    # One tail sample must not price the endpoint out for long, so
+                    # outliers are clamped; a lasting slowdown still compounds fast
+                    sample = min(latency, OUTLIER_FACTOR * self.latency)
+                    self.latency += self.alpha * (sample - self.latency)
+            else:
+                self.errors += 1
+            self.breaker.record(ok)
+
+    def available(self) -> bool:
+        """Whether the breaker would let a request through (without claiming a trial)."""
+        with self._lock:
+            return self.breaker.available()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now; claims the breaker's trial slot if half-open."""
+        with self._lock:
+            return self.breaker.allow()
+
+    def score(self) -> float:
+        """Routing cost: EWMA latency inflated by the recent error rate (lower is better)."""
+        # Endpoints without samples score 0 so that they are tried early
+        return (self.latency or 0.0) * (1.0 + 10.0 * self.error_rate)
+
+    def p95(self, min_samples: int = 20) -> Optional[float]:
+        """95th-percentile latency of recent successes, once enough are known."""
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def stats(self) -> Dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "url": self.url,
+            "state": self.breaker.state,
+            "latency_ms": None if self.latency is None else self.latency * 1000,
+            "p95_ms": None if p95 is None else p95 * 1000,
+            "error_rate": self.error_rate,
+            "requests": self.requests,
+            "errors": self.errors,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class EndpointError(IOError):
+    """Raised when every endpoint of a pool failed a request."""
+
+
+class EndpointPool:
+    """
+    Routes requests over several endpoints with hedging and circuit breakers.
+
+    The same pool serves sync callers (:meth:`post`, on a thread pool) and
+    async callers (:meth:`async_post`); both share the statistics.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        hedge: bool = True,
+        hedge_delay: float = 1.0,
+        failure_threshold: int = 3,
+        reset_timeout: float = 10.0,
+        explore: float = 0.05,
+        throttle_for: Optional[Callable[[str], Throttle]] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            urls: Endpoints serving the same chain
+            hedge: Send duplicate reads to a second endpoint when the first is slow
+            hedge_delay: Hedge delay used until an endpoint's p95 is known
+            failure_threshold: Consecutive failures that open an endpoint's breaker
+            reset_timeout: Seconds an open breaker waits before a trial request
+            explore: Share of requests routed to a random other healthy endpoint, so
+                an endpoint that had a slow spell is measured again
+            throttle_for: Returns the rate limiter of an endpoint URL; pooled
+                requests are throttled but not retried, failover takes their place
+        """
+        if not urls:
+            raise ValueError("An endpoint pool needs at least one URL")
+        self.endpoints = [
+            Endpoint(
+                url,
+                breaker=CircuitBreaker(failure_threshold, reset_timeout),
+                throttle=throttle_for(url) if throttle_for else None,
+            )
+            for url in urls
+        ]
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.explore = explore
+        self._random = random.Random()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(8, 4 * len(urls)), thread_name_prefix="rpc-pool"
+        )
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def ranked(self) -> List[Endpoint]:
+        """
+        Healthy endpoints, fastest first; every endpoint if none is healthy.
+
+        Only reads the breakers: a half-open endpoint's trial is claimed when a
+        request is actually sent to it, so ranking never uses it up.
+        """
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.available()]
+        ranked = sorted(healthy or self.endpoints, key=Endpoint.score)
+        if len(ranked) > 1 and self._random.random() < self.explore:
+            ranked.insert(0, ranked.pop(self._random.randrange(1, len(ranked))))
+        return ranked
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint statistics, in configuration order."""
+        return [endpoint.stats() for endpoint in self.endpoints]
+
+    def close(self) -> None:
+        """Release the worker threads used by sync requests."""
+        self._executor.shutdown(wait=False)
+
+    def _delay(self, endpoint: Endpoint) -> float:
+        p95 = endpoint.p95()
+        return self.hedge_delay if p95 is None else p95
+
+    def _route(self) -> List[Endpoint]:
+        """Endpoints to try for one request: the pinned one first, if any, then by rank."""
+        ranked = self.ranked()
+        pins = _pins.get()
+        pin = pins.get(self) if pins is not None else None
+        if pin is not None and pin in ranked:
+            ranked.remove(pin)
+            ranked.insert(0, pin)
+        return ranked
+
+    def _take(self, remaining: List[Endpoint]) -> Optional[Endpoint]:
+        """
+        Pop the next endpoint to send to, claiming its trial slot if half-open.
+
+        Endpoints whose breaker turns the request away (e.g. another request
+        holds the trial) are skipped, unless no endpoint would take it at all:
+        then the breakers are overridden rather than failing without trying.
+        """
+        while remaining:
+            endpoint = remaining.pop(0)
+            if endpoint.allow():
+                return endpoint
+            if not any(other.available() for other in self.endpoints):
+                return endpoint
+        return None
+
+    def _answered(self, endpoint: Endpoint, primary: Endpoint) -> None:
+        if endpoint is not primary:
+            endpoint.hedge_wins += 1
+        pins = _pins.get()
+        if pins is not None:
+            pins[self] = endpoint
+
+    # -- sync ---------------------------------------------------------------
+
+    def post(
+        self,
+        session: requests.Session,
+        data: bytes,
+        timeout: float,
+        idempotent: Optional[bool] = None,
+    ) -> bytes:
+        """
+        Send an encoded JSON-RPC request (or batch) and return the first good answer.
+
+        Args:
+            session: HTTP session to send with
+            data: Encoded request body
+            timeout: Per-endpoint request timeout in seconds
+            idempotent: Whether the request may be hedged (default: from its methods)
+
+        Returns:
+            The raw response body
+
+        Raises:
+            EndpointError: If every endpoint tried failed
+        """
+        if idempotent is None:
+            idempotent = is_idempotent(request_methods(data))
+        remaining = self._route()
+        # A pinned flow stays on its endpoint, so it is failed over but not hedged
+        hedging = self.hedge and idempotent and _pins.get() is None
+        pending: Dict[Future, Endpoint] = {}
+        errors: List[str] = []
+
+        def launch(endpoint: Endpoint) -> None:
+            pending[self._executor.submit(self._send, session, endpoint, data, timeout)] = endpoint
+
+        primary = self._take(remaining)
+        if primary is None:
+            raise EndpointError("No RPC endpoint is accepting requests")
+        launch(primary)
+        hedged = False
+        while pending:
+            delay = self._delay(primary) if hedging and not hedged and remaining else None
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            if not done:
+                # The primary is slower than its p95: race a duplicate against it
+                hedge = self._take(remaining)
+                if hedge is not None:
+                    hedge.hedges += 1
+                    launch(hedge)
+                hedged = True
+                continue
+            for future in done:
+                endpoint = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f"{endpoint.url}: {e}")
+                    continue
+                self._answered(endpoint, primary)
+                return result
+            if not pending and remaining:
+                # Fail over to the next endpoint
+                failover = self._take(remaining)
+                if failover is not None:
+                    primary = failover
+                    launch(primary)
+        raise EndpointError("All RPC endpoints failed: " + "; ".join(errors))
+
+    @staticmethod
+    def _send(session: requests.Session, endpoint: Endpoint, data: bytes, timeout: float) -> bytes:
+        def send() -> bytes:
+            start = time.perf_counter()
+            try:
+                response = session.post(
+                    endpoint.url,
+                    data=data,
+                    headers={"Content-Type": "application/json"},
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+            except Exception:
+                endpoint.record(time.perf_counter() - start, ok=False)
+                raise
+            endpoint.record(time.perf_counter() - start, ok=True)
+            return response.content
+
+        if endpoint.throttle is None:
+            return send()
+        return endpoint.throttle.call(send, idempotent=False)
+
+    # -- async --------------------------------------------------------------
+
+    async def async_post(
+        self,
+        session: "aiohttp.ClientSession",
+        data: bytes,
+        timeout: float,
+        idempotent: Optional[bool] = None,
+    ) -> bytes:
+        """Async counterpart of :meth:`post`."""
+        if idempotent is None:
+            idempotent = is_idempotent(request_methods(data))
+        remaining = self._route()
+        # A pinned flow stays on its endpoint, so it is failed over but not hedged
+        hedging = self.hedge and idempotent and _pins.get() is None
+        pending: Dict[asyncio.Task, Endpoint] = {}
+        errors: List[str] = []
+
+        def launch(endpoint: Endpoint) -> None:
+            task = asyncio.ensure_future(self._async_send(session, endpoint, data, timeout))
+            pending[task] = endpoint
+
+        primary = self._take(remaining)
+        if primary is None:
+            raise EndpointError("No RPC endpoint is accepting requests")
+        launch(primary)
+        hedged = False
+        try:
+            while pending:
+                delay = self._delay(primary) if hedging and not hedged and remaining else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedge = self._take(remaining)
+                    if hedge is not None:
+                        hedge.hedges += 1
+                        launch(hedge)
+                    hedged = True
+                    continue
+                for task in done:
+                    endpoint = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        errors.append(f"{endpoint.url}: {e}")
+                        continue
+                    self._answered(endpoint, primary)
+                    return result
+                if not pending and remaining:
+                    failover = self._take(remaining)
+                    if failover is not None:
+                        primary = failover
+                        launch(primary)
+        finally:
+            # Losing duplicates are cancelled rather than left running
+            for task in pending:
+                task.cancel()
+        raise EndpointError("All RPC endpoints failed: " + "; ".join(errors))
+
+    @staticmethod
+    async def _async_send(
+        session: "aiohttp.ClientSession", endpoint: Endpoint, data: bytes, timeout: float
+    ) -> bytes:
+        import aiohttp
+
+        async def send() -> bytes:
+            start = time.perf_counter()
+            try:
+                async with session.post(
+                    endpoint.url,
+                    data=data,
+                    headers={"Content-Type": "application/json"},
+                    timeout=aiohttp.ClientTimeout(timeout),
+                ) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                endpoint.record(time.perf_counter() - start, ok=False)
+                raise
+            endpoint.record(time.perf_counter() - start, ok=True)
+            return body
+
+        if endpoint.throttle is None:
+            return await send()
+        return await endpoint.throttle.async_call(send, idempotent=False)
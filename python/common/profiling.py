@@ -0,0 +1,109 @@
+"""
+Phase timings for profiling command-line runs.
+
+Code that does a recognisable kind of work wraps it in
+``get_phase_timer().phase(name)``: the HelloBase client's lazy set-up
+(``client init``), provider round trips (``rpc``) and console output
+(``render``); while timing is enabled, imports are timed as ``imports`` too.
+Times are exclusive, so an RPC made while the client initialises counts as
+``rpc`` only, and the phases add up to at most the wall time.
+
+Only the thread that enabled the timer is timed. Async requests are not
+timed either, since interleaved coroutines do not nest like calls do.
+Import timing replaces ``builtins.__import__``; :meth:`PhaseTimer.timing`
+puts the original back however the timed code exits.
+"""
+
+import builtins
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+IMPORTS = "imports"
+
+
+class PhaseTimer:
+    """Exclusive wall time per named phase."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.totals: Dict[str, float] = {}
+        self._stack: List[List[Any]] = []  # [name, child seconds] per open phase
+        self._thread: Optional[int] = None
+        self._import: Optional[Callable[..., Any]] = None
+
+    def enable(self) -> None:
+        """Start timing phases (and imports) on the calling thread."""
+        self.totals.clear()
+        self._stack.clear()
+        self._thread = threading.get_ident()
+        self.enabled = True
+        if self._import is not None:
+            # Already timing imports; wrapping the wrapper would outlive disable()
+            return
+        self._import = builtins.__import__
+        original = self._import
+
+        def timed_import(*args: Any, **kwargs: Any) -> Any:
+            with self.phase(IMPORTS):
+                return original(*args, **kwargs)
+
+        builtins.__import__ = timed_import
+
+    def disable(self) -> Dict[str, float]:
+        """Stop timing and return the seconds spent per phase."""
+        self.enabled = False
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+        return dict(self.totals)
+
+    @contextmanager
+    def timing(self) -> Iterator["PhaseTimer"]:
+        """Time phases for the duration of the block, restoring ``__import__`` even on errors."""
+        self.enable()
+        try:
+            yield self
+        finally:
+            self.disable()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the time spent in the block (minus nested phases) to ``name``."""
+        if not self.enabled or threading.get_ident() != self._thread:
+            yield
+            return
+        frame = [name, 0.0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            self.totals[name] = self.totals.get(name, 0.0) + elapsed - frame[1]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+
+def process_age() -> Optional[float]:
+    """Seconds since this process started, or None where /proc is not available."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesised command name start at field 3
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+_timer = PhaseTimer()
+
+
+def get_phase_timer() -> PhaseTimer:
+    """Return the process-wide phase timer."""
+    return _timer
@@ -0,0 +1,207 @@
+"""
+Block-aware read-through cache for contract view calls.
+
+Results are keyed by (contract, calldata, block number) in a bounded LRU.
+Reads at ``latest`` are pinned to the newest block the cache has seen, which
+is re-checked with ``eth_blockNumber`` at most once per ``block_ttl`` seconds
+(or advanced early through :meth:`ReadCache.observe_block`), so repeated reads
+within a block cost no round trips. Calls whose result can never change, such
+as getters of ``immutable`` values, are cached permanently instead.
+
+With an endpoint pool, the head check and the read run pinned to one endpoint.
+If that endpoint has not reached the cached block yet, the read is made at its
+own head instead, rather than at a block learned from a node that is ahead.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from web3 import Web3
+
+from python.common.pool import pinned
+from python.common.watch import BASE_BLOCK_TIME
+
+# (contract address, calldata)
+CallKey = Tuple[str, bytes]
+
+# Fragments of the errors nodes return for a block they do not have yet
+MISSING_BLOCK_HINTS = ("header not found", "unknown block", "block not found")
+
+
+def is_missing_block(error: Exception) -> bool:
+    """Whether a call failed because the node has not reached the requested block."""
+    message = str(error).lower()
+    return any(hint in message for hint in MISSING_BLOCK_HINTS)
+
+
+class ReadCache:
+    """
+    LRU cache of view-call results per block.
+
+    Counters (``hits``, ``misses``, ``block_checks``) accumulate over the
+    cache's lifetime; :meth:`stats` returns them with the hit rate.
+    """
+
+    def __init__(self, w3: Web3, max_entries: int = 4096, block_ttl: Optional[float] = None):
+        """
+        Initialize the read cache.
+
+        Args:
+            w3: Web3 instance used to learn the latest block number
+            max_entries: Per-block results kept before the least recently used is evicted
+            block_ttl: Seconds a seen block counts as latest before checking for a
+                new one (default: half the Base block time)
+        """
+        self.w3 = w3
+        self.max_entries = max_entries
+        self.block_ttl = BASE_BLOCK_TIME / 2 if block_ttl is None else block_ttl
+        self.hits = 0
+        self.misses = 0
+        self.block_checks = 0
+
+        self._entries: "OrderedDict[Tuple[str, bytes, int], Any]" = OrderedDict()
+        self._permanent: Dict[CallKey, Any] = {}
+        self._block: Optional[int] = None
+        self._block_seen_at = 0.0
+        self._lock = threading.Lock()
+
+    def latest_block(self) -> int:
+        """The newest block number seen, re-checked once ``block_ttl`` has passed."""
+        with self._lock:
+            if self._block is not None and time.monotonic() - self._block_seen_at < self.block_ttl:
+                return self._block
+        return self._check_block()
+
+    def _check_block(self) -> int:
+        """Ask the node for its head and make it the latest block."""
+        number = self.w3.eth.block_number
+        with self._lock:
+            self.block_checks += 1
+            # The answering node's head, even if another endpoint reported a later one
+            self._block = number
+            self._block_seen_at = time.monotonic()
+        return number
+
+    def observe_block(self, number: int) -> None:
+        """Record a block number learned elsewhere (a log watcher, a receipt)."""
+        with self._lock:
+            if self._block is None or number >= self._block:
+                self._block = number
+                self._block_seen_at = time.monotonic()
+
+    def get(
+        self,
+        address: str,
+        calldata: bytes,
+        load: Callable[[Any], Any],
+        block_identifier: Any = "latest",
+        permanent: bool = False,
+    ) -> Any:
+        """
+        Return a cached view-call result, calling ``load`` on a miss.
+
+        Args:
+            address: Contract address
+            calldata: Encoded call, selector included
+            load: Performs the call at the block identifier it is given
+            block_identifier: ``latest`` or a block number; other tags bypass the cache
+            permanent: The result never changes (e.g. an ``immutable`` getter)
+
+        Returns:
+            The call result
+        """
+        key = (address.lower(), calldata)
+        if permanent:
+            with self._lock:
+                if key in self._permanent:
+                    self.hits += 1
+                    return self._permanent[key]
+            result = load(block_identifier)
+            with self._lock:
+                self.misses += 1
+                self._permanent[key] = result
+            return result
+
+        if isinstance(block_identifier, int):
+            return self._get_at(key, block_identifier, load)
+        if block_identifier != "latest":
+            return load(block_identifier)
+
+        # The head check (if due) and the read on one endpoint of a pool
+        with pinned():
+            block = self.latest_block()
+            try:
+                return self._get_at(key, block, load)
+            except Exception as e:
+                if not is_missing_block(e):
+                    raise
+            # This endpoint lags the block seen elsewhere: read at its own head
+            return self._get_at(key, self._check_block(), load)
+
+    def _get_at(self, key: CallKey, block: int, load: Callable[[Any], Any]) -> Any:
+        block_key = (*key, block)
+        with self._lock:
+            if block_key in self._entries:
+                self._entries.move_to_end(block_key)
+                self.hits += 1
+                return self._entries[block_key]
+        # Read at the pinned block, so the entry is exact for its key
+        result = load(block)
+        with self._lock:
+            self.misses += 1
+            self._entries[block_key] = result
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, address: Optional[str] = None) -> None:
+        """
+        Drop per-block results after a write, for one contract or for all.
+
+        The pinned latest block is forgotten too, so the next read sees the
+        block that included the write. Permanent results are kept.
+        """
+        with self._lock:
+            if address is None:
+                self._entries.clear()
+            else:
+                address = address.lower()
+                for key in [k for k in self._entries if k[0] == address]:
+                    del self._entries[key]
+            self._block_seen_at = 0.0
+
+    def clear(self) -> None:
+        """Drop every cached result, permanent ones included."""
+        with self._lock:
+            self._entries.clear()
+            self._permanent.clear()
+            self._block = None
+            self._block_seen_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and sizes for tuning ``max_entries`` and ``block_ttl``."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "block_checks": self.block_checks,
+                "entries": len(self._entries),
+                "permanent_entries": len(self._permanent),
+                "latest_block": self._block,
+            }
+
+
+_caches: "weakref.WeakKeyDictionary[Any, ReadCache]" = weakref.WeakKeyDictionary()
+
+
+def get_read_cache(w3: Web3) -> ReadCache:
+    """Return the shared read cache for a Web3 instance, creating it on first use."""
+    cache = _caches.get(w3)
+    if cache is None:
+        cache = _caches.setdefault(w3, ReadCache(w3))
+    return cache
@@ -0,0 +1,168 @@
+"""
+Batched receipt tracking.
+
+Collects the hashes of every outstanding transaction and polls them together:
+each tick is one JSON-RPC batch carrying ``eth_blockNumber`` plus one
+``eth_getTransactionReceipt`` per hash. Ticks follow block production, so the
+tracker sleeps for about a block after seeing a new head and polls more often
+only while a block is overdue. The block interval starts at ``block_time`` and
+is re-estimated from the heads the tracker observes.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+from python.common.batch import RPCBatch
+from python.common.watch import BASE_BLOCK_TIME
+
+
+class ReceiptTracker:
+    """
+    Resolves futures for many pending transactions from one polling loop.
+
+    The loop runs on a daemon thread that is started by the first
+    :meth:`track` call and idles while nothing is outstanding.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        block_time: float = BASE_BLOCK_TIME,
+        min_poll_interval: float = 0.25,
+        timeout: float = 120,
+        max_batch_size: int = 500,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            w3: Web3 instance to poll through
+            block_time: Expected seconds between blocks, refined as blocks are seen
+            min_poll_interval: Shortest pause between ticks while a block is overdue
+            timeout: Seconds a transaction may stay unmined before its future fails
+            max_batch_size: Most receipts requested in one batch
+        """
+        self.w3 = w3
+        self.block_time = block_time
+        self.min_poll_interval = min_poll_interval
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self.ticks = 0
+
+        self._pending: Dict[str, Tuple["Future[TxReceipt]", float]] = {}
+        self._wakeup = threading.Condition()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def track(self, tx_hash: str) -> "Future[TxReceipt]":
+        """
+        Start tracking a transaction.
+
+        Args:
+            tx_hash: Hash of a submitted transaction
+
+        Returns:
+            A future resolved with the receipt once mined (reverted or not), or
+            failed with TimeExhausted after ``timeout`` seconds
+        """
+        with self._wakeup:
+            if tx_hash in self._pending:
+                return self._pending[tx_hash][0]
+            future: "Future[TxReceipt]" = Future()
+            self._pending[tx_hash] = (future, time.monotonic() + self.timeout)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            if len(self._pending) == 1:
+                # Only an idle loop needs waking; a busy one picks it up next tick
+                self._wakeup.notify()
+        return future
+
+    def close(self) -> None:
+        """Stop polling; futures still outstanding are cancelled."""
+        with self._wakeup:
+            self._stopped = True
+            self._wakeup.notify()
+            for future, _ in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+
+    def _run(self) -> None:
+        interval = self.min_poll_interval
+        last_block: Optional[int] = None
+        last_block_at: Optional[float] = None
+        observations = 0
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._stopped:
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+                hashes = list(self._pending)[: self.max_batch_size]
+
+            started = time.monotonic()
+            try:
+                block = self._poll(hashes)
+            except Exception:
+                # Transient RPC failure: keep every waiter and retry next tick
+                block = last_block
+            self._expire(time.monotonic())
+            self.ticks += 1
+
+            if block is not None and block != last_block:
+                if last_block_at is not None and block > last_block:
+                    # Smooth the observed interval into the block time estimate
+                    observed = (started - last_block_at) / (block - last_block)
+                    weight = 0.2 if observations else 1.0
+                    self.block_time += weight * (observed - self.block_time)
+                    observations += 1
+                if last_block is not None:
+                    # A head change was just seen: the next one is about a block away
+                    # (ramp up towards the configured block time until one is measured)
+                    interval = (
+                        self.block_time if observations else min(self.block_time, interval * 2)
+                    )
+                    last_block_at = started
+                last_block = block
+            else:
+                interval = min(self.block_time, max(self.min_poll_interval, interval / 2))
+
+            with self._wakeup:
+                if self._pending and not self._stopped:
+                    self._wakeup.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    def _poll(self, hashes: List[str]) -> int:
+        """Fetch the head and every receipt in one batch; resolve what was mined."""
+        batch = RPCBatch(self.w3)
+        head = batch.add("eth_blockNumber", [], lambda r: int(r, 16))
+        indexes = [batch.add_receipt(tx_hash) for tx_hash in hashes]
+        results = batch.execute(allow_failure=True)
+
+        with self._wakeup:
+            for tx_hash, index in zip(hashes, indexes):
+                receipt = results[index]
+                if receipt is not None and tx_hash in self._pending:
+                    future, _ = self._pending.pop(tx_hash)
+                    future.set_result(receipt)
+        return results[head]
+
+    def _expire(self, now: float) -> None:
+        """Fail the futures of transactions that stayed unmined past their deadline."""
+        with self._wakeup:
+            expired = [h for h, (_, deadline) in self._pending.items() if now > deadline]
+            for tx_hash in expired:
+                future, _ = self._pending.pop(tx_hash)
+                future.set_exception(
+                    TimeExhausted(
+                        f"Transaction {tx_hash} is not in the chain after {self.timeout} seconds"
+                    )
+                )
@@ -1,7 +1,34 @@
+import asyncio
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
+import weakref
 from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from web3 import Web3
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+from python.common.metrics import get_metrics
+from python.common.pool import EndpointPool
+from python.common.profiling import get_phase_timer
+from python.common.throttle import DEFAULT_MAX_RETRIES, Throttle, is_idempotent, request_methods
+
+if TYPE_CHECKING:
+    import aiohttp
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30
+DEFAULT_CHAIN_ID_TTL = 86400
+
+_metrics = get_metrics()
+_phases = get_phase_timer()
 
 
 @dataclass
@@ -10,13 +37,571 @@ class RPC:
     chain_id: int
 
 
-def get_rpc() -> RPC:
+class SessionHTTPProvider(Web3.HTTPProvider):
+    """
+    HTTP provider that sends every request through one shared ``requests.Session``.
+
+    web3's own session cache is keyed per thread; this provider shares a single
+    keep-alive connection pool across all threads and clients instead. With a
+    :class:`Throttle`, requests are rate limited and failed reads retried there,
+    in place of web3's fixed-delay retry middleware (which re-sends transactions
+    too). Round trips are reported to :func:`get_metrics` and timed as the
+    ``rpc`` phase while those are enabled.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        session: requests.Session,
+        timeout: float,
+        throttle: Optional[Throttle] = None,
+    ):
+        super().__init__(endpoint_uri, request_kwargs={"timeout": timeout})
+        self.session = session
+        self.throttle = throttle
+        if throttle is not None:
+            self.middlewares = ()
+
+    def post(self, data: bytes, idempotent: Optional[bool] = None) -> bytes:
+        """
+        POST a raw JSON-RPC body (single request or batch) and return the raw response.
+
+        Args:
+            data: Encoded request body
+            idempotent: Whether a failure may be retried (default: from its methods)
+        """
+        if not (_metrics.enabled or _phases.enabled):
+            return self._send(data, idempotent)
+        with _phases.phase("rpc"):
+            start = time.perf_counter()
+            try:
+                body = self._send(data, idempotent)
+            except Exception as e:
+                if _metrics.enabled:
+                    _metrics.record(data, time.perf_counter() - start, error=e)
+                raise
+            if _metrics.enabled:
+                _metrics.record(data, time.perf_counter() - start, body)
+        return body
+
+    def _send(self, data: bytes, idempotent: Optional[bool]) -> bytes:
+        def send() -> bytes:
+            response = self.session.post(self.endpoint_uri, data=data, **self.get_request_kwargs())
+            response.raise_for_status()
+            return response.content
+
+        if self.throttle is None:
+            return send()
+        if idempotent is None:
+            idempotent = is_idempotent(request_methods(data))
+        return self.throttle.call(send, idempotent)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        data = self.encode_rpc_request(method, params)
+        return self.decode_rpc_response(self.post(data, is_idempotent([method])))
+
+
+class AsyncSessionHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    """
+    Async HTTP provider that shares one ``aiohttp.ClientSession`` per event loop.
+
+    Every task on a loop draws connections from the same bounded pool, so
+    concurrent reads reuse keep-alive connections instead of opening new ones.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        registry: "ProviderRegistry",
+        timeout: float,
+        throttle: Optional[Throttle] = None,
+    ):
+        # Imported here so sync-only callers never load aiohttp
+        import aiohttp
+
+        super().__init__(endpoint_uri, request_kwargs={"timeout": aiohttp.ClientTimeout(timeout)})
+        self.registry = registry
+        self.throttle = throttle
+        if throttle is not None:
+            self.middlewares = ()
+
+    async def post(self, data: bytes, idempotent: Optional[bool] = None) -> bytes:
+        """POST a raw JSON-RPC body (single request or batch) and return the raw response."""
+        if not _metrics.enabled:
+            return await self._send(data, idempotent)
+        start = time.perf_counter()
+        try:
+            body = await self._send(data, idempotent)
+        except Exception as e:
+            _metrics.record(data, time.perf_counter() - start, error=e)
+            raise
+        _metrics.record(data, time.perf_counter() - start, body)
+        return body
+
+    async def _send(self, data: bytes, idempotent: Optional[bool]) -> bytes:
+        async def send() -> bytes:
+            session = self.registry.async_session()
+            async with session.post(
+                self.endpoint_uri, data=data, **self.get_request_kwargs()
+            ) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        if self.throttle is None:
+            return await send()
+        if idempotent is None:
+            idempotent = is_idempotent(request_methods(data))
+        return await self.throttle.async_call(send, idempotent)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        data = self.encode_rpc_request(method, params)
+        return self.decode_rpc_response(await self.post(data, is_idempotent([method])))
+
+
+class PooledHTTPProvider(SessionHTTPProvider):
+    """
+    HTTP provider that routes every request through an :class:`EndpointPool`.
+
+    Its ``endpoint_uri`` is the comma-separated list of the pool's URLs. The
+    pool fails over between endpoints, so web3's retry middleware is not used.
+    """
+
+    def __init__(self, pool: EndpointPool, session: requests.Session, timeout: float):
+        super().__init__(",".join(pool.urls), session, timeout)
+        self.pool = pool
+        self.timeout = timeout
+        self.middlewares = ()
+
+    def _send(self, data: bytes, idempotent: Optional[bool]) -> bytes:
+        return self.pool.post(self.session, data, self.timeout, idempotent)
+
+
+class AsyncPooledHTTPProvider(AsyncSessionHTTPProvider):
+    """Async counterpart of :class:`PooledHTTPProvider`."""
+
+    def __init__(self, pool: EndpointPool, registry: "ProviderRegistry", timeout: float):
+        super().__init__(",".join(pool.urls), registry, timeout)
+        self.pool = pool
+        self.timeout = timeout
+        self.middlewares = ()
+
+    async def _send(self, data: bytes, idempotent: Optional[bool]) -> bytes:
+        session = self.registry.async_session()
+        return await self.pool.async_post(session, data, self.timeout, idempotent)
+
+
+def split_urls(url: str) -> List[str]:
+    """The endpoints of an RPC setting, which may list several URLs separated by commas."""
+    return [part.strip() for part in url.split(",") if part.strip()]
+
+
+class ChainIdCache:
+    """
+    On-disk record of the chain id each RPC URL served, with a time-to-live.
+
+    Lets short-lived processes skip ``eth_chainId`` entirely. URLs are stored
+    hashed, since they often embed API keys. Failing to read or write the
+    file only costs the round trip the cache would have saved.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file to use (default: chain-ids.json in the cache directory)
+            ttl: Seconds a recorded chain id is trusted (default: CHAIN_ID_TTL or
+                one day; 0 disables the cache)
+        """
+        if path is None:
+            from python.common.event_index import default_cache_dir
+
+            path = default_cache_dir() / "chain-ids.json"
+        self.path = Path(path)
+        self.ttl = float(os.getenv("CHAIN_ID_TTL", DEFAULT_CHAIN_ID_TTL)) if ttl is None else ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        """Replace the file atomically, so a concurrent reader never sees it half written."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+    def get(self, url: str) -> Optional[int]:
+        """Return the recorded chain id of a URL, or None if unknown or expired."""
+        if self.ttl <= 0:
+            return None
+        entry = self._read().get(self._key(url))
+        if not entry or time.time() - entry["checked_at"] >= self.ttl:
+            return None
+        return entry["chain_id"]
+
+    def put(self, url: str, chain_id: int) -> None:
+        """Record the chain id a URL served just now."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            entries = self._read()
+            entries[self._key(url)] = {"chain_id": chain_id, "checked_at": time.time()}
+            self._write(entries)
+
+    def forget(self, url: str) -> None:
+        """Drop the record of one URL."""
+        with self._lock:
+            entries = self._read()
+            if entries.pop(self._key(url), None) is not None:
+                self._write(entries)
+
+
+def _as_int(value: Any) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _chain_id_middleware(registry: "ProviderRegistry", url: str) -> Callable:
+    """Answer ``eth_chainId`` from the registry's cache, remembering fresh answers."""
+
+    def middleware(make_request: Callable, w3: Web3) -> Callable:
+        def inner(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method == "eth_chainId":
+                cid = registry.cached_chain_id(url)
+                if cid is not None:
+                    return {"jsonrpc": "2.0", "id": 0, "result": hex(cid)}
+                response = make_request(method, params)
+                if "result" in response:
+                    registry._remember_chain_id(url, _as_int(response["result"]))
+                return response
+            return make_request(method, params)
+
+        return inner
+
+    return middleware
+
+
+def _async_chain_id_middleware(registry: "ProviderRegistry", url: str) -> Callable:
+    """Async counterpart of :func:`_chain_id_middleware`."""
+
+    async def middleware(make_request: Callable, w3: AsyncWeb3) -> Callable:
+        async def inner(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method == "eth_chainId":
+                cid = registry.cached_chain_id(url)
+                if cid is not None:
+                    return {"jsonrpc": "2.0", "id": 0, "result": hex(cid)}
+                response = await make_request(method, params)
+                if "result" in response:
+                    registry._remember_chain_id(url, _as_int(response["result"]))
+                return response
+            return await make_request(method, params)
+
+        return inner
+
+    return middleware
+
+
+class ProviderRegistry:
+    """
+    Process-wide registry of Web3 instances keyed by RPC URL.
+
+    All instances share one HTTP session, so TCP/TLS connections are reused
+    across clients. Each URL's chain id is fetched at most once per process,
+    and not at all while the on-disk :class:`ChainIdCache` still vouches for it;
+    web3's own per-call ``eth_chainId`` checks are answered from the same memo.
+
+    A URL listing several endpoints separated by commas is served by one
+    :class:`EndpointPool`, shared by its sync and async Web3 instances.
+
+    Each endpoint has one adaptive :class:`Throttle`, shared by every client
+    of that endpoint, so bulk jobs back off together when it answers 429.
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        chain_id_cache: Optional[ChainIdCache] = None,
+        hedge: Optional[bool] = None,
+        throttling: Optional[bool] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            pool_size: Keep-alive connections kept per host (default: RPC_POOL_SIZE or 10)
+            timeout: Request timeout in seconds
+            chain_id_cache: On-disk chain id cache (default: a :class:`ChainIdCache`
+                in the cache directory, created on first use)
+            hedge: Hedge slow reads across pooled endpoints (default: RPC_HEDGE, on)
+            throttling: Rate limit and retry through per-endpoint throttles
+                (default: RPC_THROTTLE, on)
+        """
+        self.pool_size = pool_size or int(os.getenv("RPC_POOL_SIZE", DEFAULT_POOL_SIZE))
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._web3: Dict[str, Web3] = {}
+        self._async_web3: Dict[str, AsyncWeb3] = {}
+        self._async_sessions: "weakref.WeakKeyDictionary[Any, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._chain_ids: Dict[str, int] = {}
+        self._chain_id_cache = chain_id_cache
+        self.hedge = os.getenv("RPC_HEDGE", "1") != "0" if hedge is None else hedge
+        self._pools: Dict[str, EndpointPool] = {}
+        if throttling is None:
+            throttling = os.getenv("RPC_THROTTLE", "1") != "0"
+        self.throttling = throttling
+        self._throttles: Dict[str, Throttle] = {}
+
+    @property
+    def chain_id_cache(self) -> ChainIdCache:
+        """The on-disk chain id cache."""
+        if self._chain_id_cache is None:
+            self._chain_id_cache = ChainIdCache()
+        return self._chain_id_cache
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared keep-alive HTTP session."""
+        with self._lock:
+            if self._session is None:
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def throttle(self, url: str) -> Optional[Throttle]:
+        """
+        The adaptive rate limiter of one endpoint, created on first use.
+
+        Args:
+            url: HTTP(S) RPC endpoint
+
+        Returns:
+            The shared throttle, or None when throttling is disabled
+        """
+        if not self.throttling:
+            return None
+        throttle = self._throttles.get(url)
+        if throttle is None:
+            rate = os.getenv("RPC_RATE_LIMIT")
+            throttle = Throttle(
+                max_concurrency=self.pool_size,
+                max_rate=float(rate) if rate else None,
+                max_retries=int(os.getenv("RPC_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+            )
+            throttle = self._throttles.setdefault(url, throttle)
+        return throttle
+
+    def pool(self, url: str) -> Optional[EndpointPool]:
+        """
+        The endpoint pool serving a comma-separated URL list, created on first use.
+
+        Args:
+            url: RPC setting, possibly listing several endpoints
+
+        Returns:
+            The shared pool, or None when ``url`` names a single endpoint
+        """
+        urls = split_urls(url)
+        if len(urls) < 2:
+            return None
+        key = ",".join(urls)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = EndpointPool(urls, hedge=self.hedge, throttle_for=self.throttle)
+            pool = self._pools.setdefault(key, pool)
+        return pool
+
+    def get_web3(self, url: str) -> Web3:
+        """
+        Get the shared Web3 instance for a URL, creating it on first use.
+
+        Args:
+            url: HTTP(S) RPC endpoint, or several separated by commas
+
+        Returns:
+            A Web3 instance backed by the shared session
+        """
+        w3 = self._web3.get(url)
+        if w3 is not None:
+            return w3
+        session = self.session
+        pool = self.pool(url)
+        with self._lock:
+            if url not in self._web3:
+                if pool is not None:
+                    provider = PooledHTTPProvider(pool, session, self.timeout)
+                else:
+                    provider = SessionHTTPProvider(url, session, self.timeout, self.throttle(url))
+                w3 = Web3(provider)
+                w3.middleware_onion.add(_chain_id_middleware(self, url), "chain_id_cache")
+                self._web3[url] = w3
+            return self._web3[url]
+
+    def async_session(self) -> "aiohttp.ClientSession":
+        """The shared aiohttp session for the running event loop."""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size)
+            session = aiohttp.ClientSession(connector=connector)
+            self._async_sessions[loop] = session
+        return session
+
+    def get_async_web3(self, url: str) -> AsyncWeb3:
+        """
+        Get the shared AsyncWeb3 instance for a URL, creating it on first use.
+
+        Args:
+            url: HTTP(S) RPC endpoint, or several separated by commas
+
+        Returns:
+            An AsyncWeb3 instance backed by the per-loop shared session
+        """
+        pool = self.pool(url)
+        with self._lock:
+            if url not in self._async_web3:
+                if pool is not None:
+                    provider = AsyncPooledHTTPProvider(pool, self, self.timeout)
+                else:
+                    provider = AsyncSessionHTTPProvider(url, self, self.timeout, self.throttle(url))
+                w3 = AsyncWeb3(provider)
+                w3.middleware_onion.add(_async_chain_id_middleware(self, url), "chain_id_cache")
+                self._async_web3[url] = w3
+            return self._async_web3[url]
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session of the running event loop."""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def cached_chain_id(self, url: str) -> Optional[int]:
+        """The chain id of a URL if known in memory or on disk, without a network call."""
+        cid = self._chain_ids.get(url)
+        if cid is None:
+            cid = self.chain_id_cache.get(url)
+            if cid is not None:
+                self._chain_ids[url] = cid
+        return cid
+
+    def chain_id(self, url: str, refresh: bool = False) -> int:
+        """
+        Get the chain id served by a URL, fetching it only when not cached.
+
+        Args:
+            url: HTTP(S) RPC endpoint
+            refresh: Ask the node even if a chain id is cached
+
+        Returns:
+            The endpoint's chain id
+        """
+        if refresh:
+            self._forget_chain_id(url)
+        cid = self.cached_chain_id(url)
+        if cid is None:
+            # The chain id middleware records the answer
+            cid = self.get_web3(url).eth.chain_id
+        return cid
+
+    async def async_chain_id(self, url: str, refresh: bool = False) -> int:
+        """Async counterpart of :meth:`chain_id`; shares the same caches."""
+        if refresh:
+            self._forget_chain_id(url)
+        cid = self.cached_chain_id(url)
+        if cid is None:
+            cid = await self.get_async_web3(url).eth.chain_id
+        return cid
+
+    def _remember_chain_id(self, url: str, cid: int) -> None:
+        self._chain_ids[url] = cid
+        self.chain_id_cache.put(url, cid)
+
+    def _forget_chain_id(self, url: str) -> None:
+        self._chain_ids.pop(url, None)
+        self.chain_id_cache.forget(url)
+
+    def clear(self) -> None:
+        """Drop all cached Web3 instances, chain ids and pools and close the shared session."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._web3.clear()
+            self._async_web3.clear()
+            self._chain_ids.clear()
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+            self._throttles.clear()
+
+
+_registry = ProviderRegistry()
+
+
+def get_registry() -> ProviderRegistry:
+    """Return the process-wide provider registry."""
+    return _registry
+
+
+def get_rpc_url() -> str:
     url = os.getenv("BASE_SEPOLIA_RPC") or os.getenv("BASE_MAINNET_RPC")
     if not url:
         raise RuntimeError("Set BASE_SEPOLIA_RPC or BASE_MAINNET_RPC in .env")
-    w3 = Web3(Web3.HTTPProvider(url, request_kwargs={"timeout": 30}))
-    cid = w3.eth.chain_id
+    return url
+
+
+def get_web3(url: Optional[str] = None) -> Web3:
+    """Return the shared Web3 instance for ``url`` (default: the configured RPC URL)."""
+    return _registry.get_web3(url or get_rpc_url())
+
+
+def get_async_web3(url: Optional[str] = None) -> AsyncWeb3:
+    """Return the shared AsyncWeb3 instance for ``url`` (default: the configured RPC URL)."""
+    return _registry.get_async_web3(url or get_rpc_url())
+
+
+def _check_chain_id(url: str, cid: int) -> RPC:
     exp = int(os.getenv("CHAIN_ID", cid))
     if cid != exp:
         raise RuntimeError(f"Connected chain_id {cid} != expected {exp}")
     return RPC(url, cid)
+
+
+def get_rpc() -> RPC:
+    url = get_rpc_url()
+    try:
+        return _check_chain_id(url, _registry.chain_id(url))
+    except RuntimeError:
+        # The cached chain id may be stale: ask the node before giving up
+        return _check_chain_id(url, _registry.chain_id(url, refresh=True))
+
+
+async def get_async_rpc() -> RPC:
+    url = get_rpc_url()
+    try:
+        return _check_chain_id(url, await _registry.async_chain_id(url))
+    except RuntimeError:
+        return _check_chain_id(url, await _registry.async_chain_id(url, refresh=True))
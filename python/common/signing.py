@@ -0,0 +1,392 @@
+"""
+Bulk message signing and verification.
+
+Signs large streams of payloads (allowlists, off-chain attestations) with
+``encode_defunct`` or EIP-712 typed data across a process pool, since ECDSA
+signing is CPU-bound. Records are read lazily from JSONL or CSV and results
+are yielded in input order; only a bounded number of chunks is in flight at
+any time, so memory stays flat however long the input is. A record that
+cannot be signed comes back with an ``error`` instead of a signature; it does
+not stop the job.
+
+:class:`SignatureVerifier` is the counterpart: it recovers the signers of
+(message, signature, expected address) records on the same kind of pool,
+caches recoveries by signature hash and yields only the mismatches, along
+with the records that could not be verified (with an ``error`` field).
+
+Signing uses eth_keys' pure-Python backend unless ``coincurve`` is installed,
+in which case it is picked up automatically and is much faster.
+"""
+
+import csv
+import json
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from eth_account import Account
+from eth_account.messages import SignableMessage, encode_defunct, encode_typed_data
+from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from eth_utils import keccak
+
+MODES = ("personal", "eip712")
+
+# The signing key of a worker process, set once by the pool initializer
+_worker_account: Optional[LocalAccount] = None
+
+
+def read_records(stream: IO[str], fmt: Optional[str] = None) -> Iterator[Any]:
+    """
+    Lazily read records from a JSONL or CSV stream.
+
+    Args:
+        stream: Text stream to read from (a file or stdin)
+        fmt: ``jsonl`` or ``csv`` (default: guessed from the stream's file name)
+
+    Yields:
+        One JSON value per non-empty JSONL line, or one dict per CSV row
+    """
+    if fmt is None:
+        fmt = "csv" if str(getattr(stream, "name", "")).endswith(".csv") else "jsonl"
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def signable_message(
+    record: Any,
+    mode: str,
+    field: str = "message",
+    typed_data: Optional[Dict[str, Any]] = None,
+    hex_messages: bool = False,
+) -> SignableMessage:
+    """
+    Build the message to sign for one record.
+
+    Args:
+        record: A JSON value or CSV row
+        mode: ``personal`` (EIP-191 ``encode_defunct``) or ``eip712``
+        field: Record field holding the personal message text
+        typed_data: EIP-712 template (``types``, ``primaryType``, ``domain``) whose
+            ``message`` is taken from each record; records that are complete
+            typed-data documents need no template
+        hex_messages: Personal messages are hex-encoded bytes rather than text
+            (text such as "0xhello" is signed as text otherwise)
+
+    Returns:
+        The signable message
+
+    Raises:
+        ValueError: If the record cannot be turned into a message of this mode
+    """
+    if mode == "personal":
+        text = record if isinstance(record, str) else record[field]
+        if hex_messages:
+            try:
+                return encode_defunct(hexstr=text)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Not a hex message: {text!r}") from e
+        return encode_defunct(text=text)
+    if mode == "eip712":
+        if isinstance(record, dict) and "types" in record:
+            return encode_typed_data(full_message=record)
+        if typed_data is None:
+            raise ValueError("EIP-712 records need a typed-data template")
+        message = _coerce(typed_data["types"][typed_data["primaryType"]], record)
+        return encode_typed_data(full_message={**typed_data, "message": message})
+    raise ValueError(f"Unknown signing mode: {mode}")
+
+
+def _coerce(fields: List[Dict[str, str]], record: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert CSV strings to the Python types of the EIP-712 struct fields."""
+    message = dict(record)
+    for entry in fields:
+        value = message.get(entry["name"])
+        if not isinstance(value, str):
+            continue
+        if entry["type"].startswith(("uint", "int")):
+            message[entry["name"]] = int(value, 0)
+        elif entry["type"] == "bool":
+            message[entry["name"]] = value.strip().lower() in ("1", "true", "yes")
+    return message
+
+
+def _init_worker(private_key: str) -> None:
+    global _worker_account
+    _worker_account = Account.from_key(private_key)
+
+
+def _sign_chunk(
+    records: List[Any],
+    mode: str,
+    field: str,
+    typed_data: Optional[Dict[str, Any]],
+    hex_messages: bool,
+    account: Optional[LocalAccount] = None,
+) -> List[Dict[str, Any]]:
+    account = account or _worker_account
+    results = []
+    for record in records:
+        result = dict(record) if isinstance(record, dict) else {field: record}
+        try:
+            signed = account.sign_message(
+                signable_message(record, mode, field, typed_data, hex_messages)
+            )
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        else:
+            result["messageHash"] = signed.messageHash.hex()
+            result["signature"] = signed.signature.hex()
+        results.append(result)
+    return results
+
+
+def sign_stream(
+    records: Iterable[Any],
+    private_key: str,
+    mode: str = "personal",
+    field: str = "message",
+    typed_data: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+    hex_messages: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Sign every record and yield the results in input order.
+
+    Args:
+        records: Records to sign (consumed lazily)
+        private_key: Signing key
+        mode: ``personal`` or ``eip712`` (see :func:`signable_message`)
+        field: Record field holding the personal message text
+        typed_data: EIP-712 template for records that only carry the message
+        workers: Worker processes (default: all cores; 1 signs in-process)
+        chunk_size: Records sent to a worker at a time
+        hex_messages: Personal messages are hex-encoded bytes rather than text
+
+    Yields:
+        Each record (as a dict) with ``messageHash`` and ``signature`` added,
+        or with ``error`` set if it could not be signed
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown signing mode: {mode}")
+    workers = workers or os.cpu_count() or 1
+    source = iter(records)
+    chunks = iter(lambda: list(islice(source, chunk_size)), [])
+
+    if workers == 1:
+        account = Account.from_key(private_key)
+        for chunk in chunks:
+            yield from _sign_chunk(chunk, mode, field, typed_data, hex_messages, account)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(private_key,)) as pool:
+        # Keep two chunks per worker in flight: enough to stay busy, bounded in memory
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_sign_chunk, chunk, mode, field, typed_data, hex_messages))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def message_hash(signable: SignableMessage) -> bytes:
+    """The EIP-191 hash that is actually signed for a signable message."""
+    return keccak(b"\x19" + signable.version + signable.header + signable.body)
+
+
+def recover_signer(msg_hash: bytes, signature: bytes) -> str:
+    """
+    Recover the address that produced a 65-byte (r, s, v) signature.
+
+    Args:
+        msg_hash: Hash that was signed (see :func:`message_hash`)
+        signature: Signature bytes; v may be 0/1 or 27/28
+
+    Returns:
+        The signer's checksum address
+    """
+    if len(signature) != 65:
+        raise ValueError(f"Expected a 65-byte signature, got {len(signature)} bytes")
+    v = signature[64] - 27 if signature[64] >= 27 else signature[64]
+    vrs = (v, int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:64], "big"))
+    public_key = keys.Signature(vrs=vrs).recover_public_key_from_msg_hash(msg_hash)
+    return public_key.to_checksum_address()
+
+
+def _recover_chunk(items: List[Tuple[bytes, bytes]]) -> List[str]:
+    """Recover every (hash, signature) pair; failures come back as an error string."""
+    signers = []
+    for msg_hash, signature in items:
+        try:
+            signers.append(recover_signer(msg_hash, signature))
+        except Exception as e:
+            signers.append(f"error: {e}")
+    return signers
+
+
+class _Prepared:
+    """A chunk of records with their cache keys and the recoveries still needed."""
+
+    def __init__(self, records: List[Any]):
+        self.records = records
+        self.keys: List[Any] = []  # cache key per record, or an error string
+        self.items: List[Optional[Tuple[bytes, bytes]]] = []  # (hash, signature) per record
+        self.work: List[Tuple[bytes, bytes]] = []  # (hash, signature) to recover
+        self.work_keys: List[bytes] = []
+
+
+class SignatureVerifier:
+    """
+    Checks streams of signed records against their expected signers.
+
+    Recovered signers are cached by ``keccak(message hash + signature)`` in a
+    bounded LRU, so repeated submissions are only recovered once per process.
+    Counters (``checked``, ``mismatches``, ``errors``, ``cache_hits``)
+    accumulate across calls to :meth:`verify`.
+    """
+
+    def __init__(
+        self,
+        mode: str = "personal",
+        field: str = "message",
+        typed_data: Optional[Dict[str, Any]] = None,
+        signature_field: str = "signature",
+        address_field: str = "signer",
+        expected: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        cache_size: int = 100_000,
+        hex_messages: bool = False,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            mode: ``personal`` or ``eip712`` (see :func:`signable_message`)
+            field: Record field holding the personal message text
+            typed_data: EIP-712 template for records that only carry the message
+            signature_field: Record field holding the hex signature
+            address_field: Record field holding the expected signer
+            expected: One expected signer for every record (overrides ``address_field``)
+            workers: Worker processes (default: all cores; 1 recovers in-process)
+            chunk_size: Records sent to a worker at a time
+            cache_size: Recovered signers kept in the LRU cache
+            hex_messages: Personal messages are hex-encoded bytes rather than text
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown signing mode: {mode}")
+        self.mode = mode
+        self.field = field
+        self.typed_data = typed_data
+        self.signature_field = signature_field
+        self.address_field = address_field
+        self.expected = expected
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self.hex_messages = hex_messages
+        self.checked = 0
+        self.mismatches = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    def verify(self, records: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Verify every record and yield the ones that do not match, in input order.
+
+        Args:
+            records: Records carrying a message, a signature and the expected signer
+
+        Yields:
+            Each mismatching record (as a dict) with ``recovered`` set to the
+            actual signer, and each record that could not be verified with
+            ``error`` set instead
+        """
+        source = iter(records)
+        chunks = iter(lambda: list(islice(source, self.chunk_size)), [])
+
+        if self.workers == 1:
+            for chunk in chunks:
+                prepared = self._prepare(chunk)
+                yield from self._finish(prepared, _recover_chunk(prepared.work))
+            return
+
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending: Deque[Tuple[_Prepared, Future]] = deque()
+            for chunk in chunks:
+                prepared = self._prepare(chunk)
+                pending.append((prepared, pool.submit(_recover_chunk, prepared.work)))
+                if len(pending) >= self.workers * 2:
+                    prepared, future = pending.popleft()
+                    yield from self._finish(prepared, future.result())
+            while pending:
+                prepared, future = pending.popleft()
+                yield from self._finish(prepared, future.result())
+
+    def _prepare(self, chunk: List[Any]) -> _Prepared:
+        """Hash each record and split the chunk into cache hits and work for the pool."""
+        prepared = _Prepared(chunk)
+        queued = set()
+        for record in chunk:
+            try:
+                if not isinstance(record, dict):
+                    raise TypeError(f"a plain {type(record).__name__} record has no signature")
+                signature = bytes.fromhex(record[self.signature_field].removeprefix("0x"))
+                msg_hash = message_hash(
+                    signable_message(
+                        record, self.mode, self.field, self.typed_data, self.hex_messages
+                    )
+                )
+            except Exception as e:
+                prepared.keys.append(f"error: {e}")
+                prepared.items.append(None)
+                continue
+            key = keccak(msg_hash + signature)
+            prepared.keys.append(key)
+            prepared.items.append((msg_hash, signature))
+            if key in self._cache:
+                self.cache_hits += 1
+            elif key not in queued:
+                queued.add(key)
+                prepared.work.append((msg_hash, signature))
+                prepared.work_keys.append(key)
+        return prepared
+
+    def _finish(self, prepared: _Prepared, signers: List[str]) -> Iterator[Dict[str, Any]]:
+        """Cache the recovered signers and yield the chunk's mismatches."""
+        recovered_now = dict(zip(prepared.work_keys, signers))
+        for record, key, item in zip(prepared.records, prepared.keys, prepared.items):
+            self.checked += 1
+            result = dict(record) if isinstance(record, dict) else {self.field: record}
+            if isinstance(key, bytes):
+                recovered = recovered_now.get(key) or self._cache.get(key)
+                if recovered is None:
+                    # Evicted since the chunk was prepared: recover it here
+                    recovered = _recover_chunk([item])[0]
+            else:
+                recovered = key
+            if recovered.startswith("error: "):
+                # Reported per record and never cached
+                self.errors += 1
+                yield {**result, "error": recovered.removeprefix("error: ")}
+                continue
+            self._remember(key, recovered)
+            expected = self.expected or str(result.get(self.address_field, ""))
+            if recovered.lower() != expected.lower():
+                self.mismatches += 1
+                yield {**result, "recovered": recovered}
+
+    def _remember(self, key: bytes, signer: str) -> None:
+        self._cache[key] = signer
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
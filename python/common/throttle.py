@@ -0,0 +1,348 @@
+"""
+Adaptive client-side rate limiting and retry for RPC endpoints.
+
+A :class:`Throttle` sits under one endpoint's provider and finds the highest
+load the endpoint sustains without manual tuning:
+
+- an AIMD concurrency limit: every success raises it by ``1/limit`` (about one
+  slot per window of requests), every overload signal (HTTP 429/5xx, timeout)
+  cuts it to 70%;
+- a token bucket that is unlimited until the endpoint answers 429, then
+  follows the same AIMD rule on the request rate (and honours ``Retry-After``)
+  until the cap is well above what is asked of it. Outages (5xx, timeouts) cut
+  only the concurrency, since they say nothing about a rate limit;
+- jittered exponential-backoff retries, for idempotent reads only. A
+  transaction is never re-sent, since a lost response does not mean it was
+  not received.
+
+Only one decrease is applied per congestion event: failures of requests that
+were already in flight when the limit was cut are not counted again, and the
+limits are cut at most once per second (the window public endpoints count
+requests over), so retries landing in the same full window do not compound.
+"""
+
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+# Methods whose duplicates are not harmless reads; they are never retried or hedged
+NON_IDEMPOTENT_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+# HTTP statuses by which an endpoint says it is overloaded
+OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMITED = 429
+
+DEFAULT_MAX_RETRIES = 3
+
+# Shortest interval between two decreases, in seconds
+DECREASE_INTERVAL = 1.0
+
+
+def is_idempotent(methods: Iterable[str]) -> bool:
+    """Whether a request (or batch) only contains methods that are safe to duplicate."""
+    return not any(method in NON_IDEMPOTENT_METHODS for method in methods)
+
+
+def request_methods(data: bytes) -> List[str]:
+    """The JSON-RPC method names of an encoded request or batch."""
+    payload = json.loads(data)
+    items = payload if isinstance(payload, list) else [payload]
+    return [item.get("method", "") for item in items]
+
+
+def _aiohttp_error(error: BaseException, name: str) -> bool:
+    """Whether ``error`` is an instance of ``aiohttp.<name>``, without importing aiohttp."""
+    # An async request has already imported aiohttp; otherwise it cannot be its error
+    aiohttp = sys.modules.get("aiohttp")
+    return aiohttp is not None and isinstance(error, getattr(aiohttp, name))
+
+
+def _status(error: BaseException) -> Optional[int]:
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code
+    if _aiohttp_error(error, "ClientResponseError"):
+        return error.status  # type: ignore[attr-defined]
+    return None
+
+
+def _is_timeout(error: BaseException) -> bool:
+    return isinstance(error, (requests.Timeout, asyncio.TimeoutError))
+
+
+def _is_overload(error: BaseException) -> bool:
+    """Whether a failure means the endpoint wants less traffic."""
+    return _status(error) in OVERLOAD_STATUSES or _is_timeout(error)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a failed read may succeed when sent again."""
+    connection_error = isinstance(error, requests.ConnectionError) or _aiohttp_error(
+        error, "ClientConnectionError"
+    )
+    return _is_overload(error) or (connection_error and _status(error) is None)
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header, if the response carried one."""
+    headers = None
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        headers = error.response.headers
+    elif _aiohttp_error(error, "ClientResponseError"):
+        headers = error.headers  # type: ignore[attr-defined]
+    try:
+        return float(headers["Retry-After"]) if headers else None
+    except (KeyError, TypeError, ValueError):
+        # Absent, or an HTTP date, which RPC providers do not send in practice
+        return None
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Throttle:
+    """
+    Adaptive concurrency and rate limit with retries, shared by all callers of one endpoint.
+
+    Sync callers use :meth:`call` and async callers :meth:`async_call`; both
+    draw from the same limits, so threads and event loops can share it.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        initial_concurrency: Optional[int] = None,
+        max_rate: Optional[float] = None,
+        min_rate: float = 1.0,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = 0.25,
+        max_backoff: float = 8.0,
+        increase: float = 2.0,
+        decrease: float = 0.7,
+    ):
+        """
+        Initialize the throttle.
+
+        Args:
+            max_concurrency: Most requests in flight at once
+            initial_concurrency: Starting in-flight limit (default: half the maximum)
+            max_rate: Requests per second never exceeded (default: no ceiling; the
+                rate is only limited once the endpoint answers 429)
+            min_rate: Requests per second the rate limit is never cut below
+            max_retries: Retries of a failed idempotent read
+            backoff: Base delay of the exponential backoff, in seconds
+            max_backoff: Longest delay between retries, in seconds
+            increase: Requests per second the rate limit grows by per second of success
+            decrease: Factor a limit is multiplied by when the endpoint pushes back
+        """
+        self.max_concurrency = max_concurrency
+        self.limit = float(initial_concurrency or max(1, max_concurrency // 2))
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate = max_rate  # None: not rate limited
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.increase = increase
+        self.decrease = decrease
+
+        self.requests = 0
+        self.retries = 0
+        self.overloads = 0
+        self.waited = 0.0  # seconds spent waiting for a slot or a token
+
+        self._in_flight = 0
+        self._tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._decreased_at = float("-inf")
+        self._sent: Deque[float] = deque()  # send times within the last second
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    # -- public API -----------------------------------------------------------
+
+    def call(self, send: Callable[[], T], idempotent: bool = True) -> T:
+        """
+        Send a request within the limits, retrying failed idempotent reads.
+
+        Args:
+            send: Performs the request; raises on transport or HTTP errors
+            idempotent: Whether the request may be sent again after a failure
+
+        Returns:
+            What ``send`` returned
+        """
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            with self._slot_freed:
+                while self._in_flight >= int(self.limit):
+                    self._slot_freed.wait()
+                self._in_flight += 1
+            delay = self._reserve(start)
+            if delay > 0:
+                time.sleep(delay)
+            sent = time.monotonic()
+            try:
+                result = send()
+            except Exception as e:
+                self._release(sent, e)
+                if not self._should_retry(e, idempotent, attempt):
+                    raise
+                attempt += 1
+                time.sleep(self._backoff(attempt, e))
+                continue
+            self._release(sent)
+            return result
+
+    async def async_call(self, send: Callable[[], Awaitable[T]], idempotent: bool = True) -> T:
+        """Async counterpart of :meth:`call`."""
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            await self._async_slot()
+            try:
+                delay = self._reserve(start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release(start, cancelled=True)
+                raise
+            sent = time.monotonic()
+            try:
+                result = await send()
+            except asyncio.CancelledError:
+                self._release(sent, cancelled=True)
+                raise
+            except Exception as e:
+                self._release(sent, e)
+                if not self._should_retry(e, idempotent, attempt):
+                    raise
+                attempt += 1
+                await asyncio.sleep(self._backoff(attempt, e))
+                continue
+            self._release(sent)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits and lifetime counters."""
+        with self._lock:
+            return {
+                "concurrency_limit": int(self.limit),
+                "rate_limit": self.rate,
+                "in_flight": self._in_flight,
+                "requests": self.requests,
+                "retries": self.retries,
+                "overloads": self.overloads,
+                "waited_s": self.waited,
+            }
+
+    # -- internals ------------------------------------------------------------
+
+    async def _async_slot(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self.limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # Woken just before the cancellation: pass the slot on
+                        self._wake(1)
+                raise
+
+    def _wake(self, count: int) -> None:
+        """Wake up to ``count`` sync and async waiters (lock held)."""
+        self._slot_freed.notify(count)
+        while count > 0 and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, waiter)
+                count -= 1
+
+    def _reserve(self, start: float) -> float:
+        """Take a token and return how long to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            self.waited += now - start
+            self._sent.append(now)
+            while self._sent and self._sent[0] < now - 1.0:
+                self._sent.popleft()
+            delay = max(0.0, self._paused_until - now)
+            if self.rate is not None:
+                burst = max(1.0, self.rate / 10)
+                self._tokens = min(burst, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                # The balance may go negative: later callers queue behind earlier ones
+                self._tokens -= 1.0
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self.rate)
+            self.waited += delay
+            return delay
+
+    def _release(
+        self, sent: float, error: Optional[BaseException] = None, cancelled: bool = False
+    ) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if cancelled:
+                pass  # says nothing about the endpoint
+            elif error is None:
+                # Additive increase: about one slot per window of requests, and
+                # ``increase`` requests/s per second
+                self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+                if self.rate is not None:
+                    self.rate += self.increase / self.rate
+                    if self.max_rate is not None:
+                        self.rate = min(self.rate, self.max_rate)
+                    elif self.rate > 2 * len(self._sent):
+                        # Far above demand: stop limiting until the next 429
+                        self.rate = None
+            elif _is_overload(error):
+                self.overloads += 1
+                retry_after = _retry_after(error)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+                now = time.monotonic()
+                if sent >= self._decreased_at and now - self._decreased_at >= DECREASE_INTERVAL:
+                    # Multiplicative decrease, once per congestion event
+                    self._decreased_at = now
+                    self.limit = max(1.0, self.limit * self.decrease)
+                    if _status(error) == RATE_LIMITED:
+                        current = self.rate or max(2.0, len(self._sent))
+                        self.rate = max(self.min_rate, current * self.decrease)
+            self._wake(max(1, int(self.limit) - self._in_flight))
+
+    def _should_retry(self, error: BaseException, idempotent: bool, attempt: int) -> bool:
+        if not idempotent or attempt >= self.max_retries or not _is_retryable(error):
+            return False
+        with self._lock:
+            self.retries += 1
+        return True
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """Full-jitter exponential backoff, but no sooner than ``Retry-After``."""
+        delay = self._random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        return max(delay, _retry_after(error) or 0.0)
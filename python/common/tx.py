@@ -0,0 +1,281 @@
+"""
+Pipelined transaction sending.
+
+Keeps a local nonce counter per account so transactions can be signed and
+submitted back to back without a get_transaction_count round trip each time,
+and tracks confirmations in the background. Submitting returns a
+:class:`TxHandle` immediately; callers decide when (and whether) to wait.
+EIP-1559 fees come from the shared :class:`FeeOracle`, cached per block;
+every mined receipt tells the oracle about its block, so the next quote is
+refetched once the chain has moved past the one it was built from.
+
+The counter is seeded once from the node's pending nonce and re-seeded after
+any failed submission, which also recovers from another process having used
+the same key. A send that fails because the node already has those very bytes
+(an endpoint that took them before a retry or failover re-sent them) counts as
+submitted; only a nonce conflict with some other transaction is re-signed.
+Receipts are polled in batches by a shared :class:`ReceiptTracker`.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from eth_account.signers.local import LocalAccount
+from eth_utils import keccak
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import ContractLogicError, TransactionNotFound
+from web3.types import TxReceipt
+
+from python.common.fees import FeeOracle, get_fee_oracle
+from python.common.receipts import ReceiptTracker
+
+# Fragments of the errors nodes return when a nonce is stale or already used
+NONCE_ERROR_HINTS = (
+    "nonce too low",
+    "nonce too high",
+    "replacement transaction underpriced",
+    "invalid nonce",
+)
+
+# Fragments of the errors nodes return for a transaction they already have
+ALREADY_KNOWN_HINTS = (
+    "already known",
+    "known transaction",
+    "already imported",
+    "already exists",
+)
+
+
+def _error_message(error: Exception) -> str:
+    detail = error.args[0] if error.args else ""
+    if isinstance(detail, dict):
+        detail = detail.get("message", "")
+    return str(detail).lower()
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Return True if a send error means the local nonce is out of sync."""
+    message = _error_message(error)
+    return any(hint in message for hint in NONCE_ERROR_HINTS)
+
+
+def is_already_known(error: Exception) -> bool:
+    """Return True if a send error means the node already has this exact transaction."""
+    message = _error_message(error)
+    return any(hint in message for hint in ALREADY_KNOWN_HINTS)
+
+
+class NonceManager:
+    """
+    Hands out sequential nonces for one account from a local counter.
+
+    The counter is loaded from the node's pending transaction count on first
+    use and again after :meth:`resync`.
+    """
+
+    def __init__(self, w3: Web3, address: str):
+        """
+        Initialize the nonce manager.
+
+        Args:
+            w3: Web3 instance used to seed the counter
+            address: Account the nonces belong to
+        """
+        self.w3 = w3
+        self.address = address
+        self._next: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def reserve(self) -> int:
+        """Return the next nonce and advance the counter."""
+        with self._lock:
+            if self._next is None:
+                self._next = self.w3.eth.get_transaction_count(self.address, "pending")
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    def resync(self) -> None:
+        """Forget the local counter; the next reservation reloads it from the node."""
+        with self._lock:
+            self._next = None
+
+
+class OutOfGas(ContractLogicError):
+    """A mined transaction failed by using its whole gas limit."""
+
+
+class TxHandle:
+    """A submitted transaction whose receipt may not be available yet."""
+
+    def __init__(
+        self, tx_hash: str, nonce: int, future: "Future[TxReceipt]", gas: Optional[int] = None
+    ):
+        self.tx_hash = tx_hash
+        self.nonce = nonce
+        self.gas = gas
+        self._future = future
+
+    def done(self) -> bool:
+        """Return True once the transaction is mined (or waiting failed)."""
+        return self._future.done()
+
+    def receipt(self, timeout: Optional[float] = None) -> TxReceipt:
+        """
+        Wait for the transaction to be mined.
+
+        Args:
+            timeout: Seconds to wait (default: until the pipeline's receipt timeout)
+
+        Returns:
+            The transaction receipt
+
+        Raises:
+            OutOfGas: If the transaction used its whole gas limit and failed
+            ContractLogicError: If the transaction reverted
+            TimeExhausted: If the transaction was not mined in time
+        """
+        receipt = self._future.result(timeout)
+        if receipt.status == 0:
+            if self.out_of_gas():
+                raise OutOfGas(f"Transaction ran out of gas (limit {self.gas})")
+            raise ContractLogicError("Transaction reverted")
+        return receipt
+
+    def out_of_gas(self) -> bool:
+        """Return True if the transaction was mined and failed on its gas limit."""
+        if not self._future.done() or self._future.exception() is not None:
+            return False
+        receipt = self._future.result()
+        return receipt.status == 0 and self.gas is not None and receipt.gasUsed >= self.gas
+
+    def add_done_callback(self, callback: Callable[["TxHandle"], Any]) -> None:
+        """Call ``callback(handle)`` once the transaction is mined."""
+        self._future.add_done_callback(lambda _: callback(self))
+
+    def __repr__(self) -> str:
+        return f"TxHandle(tx_hash={self.tx_hash!r}, nonce={self.nonce}, done={self.done()})"
+
+
+class TxPipeline:
+    """
+    Signs and submits transactions for one account without waiting on each.
+
+    Submission is serialized so nonces reach the node in order; confirmations
+    are awaited by a :class:`ReceiptTracker` that polls all of them together.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        account: LocalAccount,
+        chain_id: Optional[int] = None,
+        fees: Optional[FeeOracle] = None,
+        tracker: Optional[ReceiptTracker] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            w3: Web3 instance to submit through
+            account: Local account that signs the transactions
+            chain_id: Chain id to sign for (default: fetched once from the node)
+            fees: Fee oracle to price transactions with (default: the shared one)
+            tracker: Receipt tracker to confirm through (default: a new one)
+        """
+        self.w3 = w3
+        self.account = account
+        self.nonces = NonceManager(w3, account.address)
+        self.fees = fees or get_fee_oracle(w3)
+        self.tracker = tracker or ReceiptTracker(w3)
+        self._chain_id = chain_id
+        self._send_lock = threading.Lock()
+
+    @property
+    def chain_id(self) -> int:
+        """Chain id transactions are signed for."""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def submit(self, transaction: Dict[str, Any]) -> TxHandle:
+        """
+        Sign and send a transaction, returning without waiting for it to be mined.
+
+        ``nonce`` and ``chainId`` are filled in, and EIP-1559 fees from the fee
+        oracle unless the transaction already carries legacy or EIP-1559 fee
+        fields. If the node already has the signed bytes, the send succeeded;
+        any other nonce error re-seeds the counter from the node and the send
+        is retried once, re-signed with the new nonce.
+
+        Args:
+            transaction: Transaction fields, e.g. from ``build_transaction``
+
+        Returns:
+            A handle to wait on the receipt
+        """
+        tx = {**transaction, "chainId": self.chain_id}
+        tx.setdefault("from", self.account.address)
+        if "gasPrice" not in tx and "maxFeePerGas" not in tx:
+            tx.update(self.fees.tx_params())
+
+        with self._send_lock:
+            for attempt in range(2):
+                tx["nonce"] = self.nonces.reserve()
+                signed = self.account.sign_transaction(tx)
+                try:
+                    tx_hash = self._send(signed.rawTransaction)
+                    break
+                except Exception as e:
+                    # The reserved nonce may or may not have been consumed, and
+                    # the fees may be stale if the node rejected them
+                    self.nonces.resync()
+                    self.fees.invalidate()
+                    if attempt or not is_nonce_error(e):
+                        raise
+
+        future = self.tracker.track(tx_hash.hex())
+        future.add_done_callback(self._observe_receipt)
+        return TxHandle(tx_hash.hex(), tx["nonce"], future, tx.get("gas"))
+
+    def _observe_receipt(self, future: "Future[TxReceipt]") -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.fees.observe_block(future.result()["blockNumber"])
+
+    def _send(self, raw: bytes) -> HexBytes:
+        """
+        Send signed bytes, succeeding when the node turns out to have them already.
+
+        An endpoint may have taken the bytes before the provider retried or
+        failed over to another one, which then answers "already known", or
+        "nonce too low" once the first copy has spread. Re-signing in either
+        case would submit the same call twice.
+        """
+        tx_hash = HexBytes(keccak(raw))
+        try:
+            return self.w3.eth.send_raw_transaction(raw)
+        except Exception as e:
+            if is_already_known(e):
+                return tx_hash
+            if "nonce too low" in _error_message(e) and self._node_has(tx_hash):
+                return tx_hash
+            raise
+
+    def _node_has(self, tx_hash: HexBytes) -> bool:
+        try:
+            self.w3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Stop tracking receipts; handles still pending are cancelled."""
+        self.tracker.close()
+
+    def __enter__(self) -> "TxPipeline":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,11 +1,102 @@
+"""
+Account loading from a raw private key or an encrypted JSON keystore.
+
+Keystores (``KEYSTORE_PATH``) are decrypted at most once per process: the
+unlocked account is memoized until :func:`clear_account_cache` is called, so
+every client built afterwards reuses it without re-running the scrypt KDF.
+Across processes, a running unlock agent (see :mod:`python.common.keyagent`)
+is asked for the key before falling back to the password.
+"""
+
+import getpass
+import json
 import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
+
+from . import keyagent
+
+_accounts: Dict[Tuple[str, ...], LocalAccount] = {}
+_lock = threading.Lock()
+
+
+def load_account(keystore: Optional[str] = None, password: Optional[str] = None):
+    """
+    Load the signing account, memoized per process.
+
+    Args:
+        keystore: Path of an encrypted JSON keystore (default: KEYSTORE_PATH);
+            PRIVATE_KEY is used when neither is set
+        password: Keystore password (default: KEYSTORE_PASSWORD,
+            KEYSTORE_PASSWORD_FILE or an interactive prompt)
+
+    Returns:
+        The unlocked LocalAccount
+    """
+    keystore = keystore or os.getenv("KEYSTORE_PATH")
+    if not keystore:
+        pk = os.getenv("PRIVATE_KEY")
+        if not pk:
+            raise RuntimeError("Set PRIVATE_KEY or KEYSTORE_PATH in .env")
+        with _lock:
+            acct = _accounts.get(("key", pk))
+            if acct is None:
+                acct = _accounts[("key", pk)] = Account.from_key(pk)
+        return acct
+
+    path = Path(keystore).expanduser().resolve()
+    cache_key = ("keystore", str(path), str(path.stat().st_mtime_ns))
+    # Held while decrypting so concurrent callers wait for one KDF run
+    with _lock:
+        acct = _accounts.get(cache_key)
+        if acct is None:
+            acct = _accounts[cache_key] = _unlock(path, password)
+        return acct
+
+
+def unlock_keystore(keystore: str, password: Optional[str] = None) -> LocalAccount:
+    """Decrypt a keystore without consulting or filling the caches."""
+    keyfile = _read_keystore(Path(keystore).expanduser())
+    return Account.from_key(Account.decrypt(keyfile, password or _password(keystore)))
+
+
+def clear_account_cache() -> None:
+    """Forget every account unlocked in this process."""
+    with _lock:
+        _accounts.clear()
+
+
+def _unlock(path: Path, password: Optional[str]) -> LocalAccount:
+    keyfile = _read_keystore(path)
+    address = keyfile.get("address")
+    if address:
+        key = keyagent.fetch_key(address)
+        if key:
+            acct = Account.from_key(key)
+            if acct.address[2:].lower() == address.lower().removeprefix("0x"):
+                return acct
+    return Account.from_key(Account.decrypt(keyfile, password or _password(str(path))))
+
+
+def _read_keystore(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        raise RuntimeError(f"Cannot read keystore {path}: {e}") from e
 
 
-def load_account():
-    pk = os.getenv("PRIVATE_KEY")
-    if not pk:
-        raise RuntimeError("Set PRIVATE_KEY in .env")
-    acct = Account.from_key(pk)
-    return acct
+def _password(keystore: str) -> str:
+    password = os.getenv("KEYSTORE_PASSWORD")
+    if password:
+        return password
+    password_file = os.getenv("KEYSTORE_PASSWORD_FILE")
+    if password_file:
+        return Path(password_file).expanduser().read_text().rstrip("\n")
+    if sys.stdin.isatty():
+        return getpass.getpass(f"Password for {keystore}: ")
+    raise RuntimeError("Set KEYSTORE_PASSWORD or KEYSTORE_PASSWORD_FILE, or run interactively")
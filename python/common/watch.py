@@ -0,0 +1,239 @@
+"""
+Live log streaming.
+
+Follows the chain head and yields new logs as blocks arrive, using incremental
+eth_getLogs from the last processed block. Heads come from a websocket
+``newHeads`` subscription when a websocket URL is given, otherwise from
+adaptive polling tuned to the chain's block time (about 2 s on Base).
+
+Reorgs are detected from block-hash continuity (a head that replaced a block
+at the same height included); logs from blocks that were replaced are yielded
+again with ``removed=True`` before the new fork's logs.
+Only the last ``reorg_window`` blocks are remembered, so memory stays bounded
+for long-running sessions. Each poll runs pinned to one endpoint of a pool, so
+the head and the logs up to it come from the same node.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.exceptions import BlockNotFound
+
+from python.common.logs import LogScanner
+from python.common.pool import pinned
+
+BASE_BLOCK_TIME = 2.0
+
+
+class LogWatcher:
+    """
+    Streams logs matching a filter as new blocks are produced.
+
+    Iterate over :meth:`stream` to receive raw logs; each log carries a
+    ``removed`` flag that is True when a reorg dropped it from the chain.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        address: Optional[str] = None,
+        topics: Optional[Sequence[Any]] = None,
+        block_time: float = BASE_BLOCK_TIME,
+        min_poll_interval: float = 0.25,
+        confirmations: int = 0,
+        reorg_window: int = 64,
+        ws_url: Optional[str] = None,
+        scanner: Optional[LogScanner] = None,
+        stop_event: Optional[threading.Event] = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            w3: Web3 instance used for block and log queries
+            address: Contract address to filter on
+            topics: Topic filter, as accepted by eth_getLogs
+            block_time: Expected seconds between blocks
+            min_poll_interval: Shortest pause between polls that found no new block
+            confirmations: Blocks to stay behind the head before emitting logs
+            reorg_window: Recent blocks remembered for reorg detection
+            ws_url: Optional websocket RPC URL for a newHeads subscription
+            scanner: Log scanner used for catch-up ranges
+            stop_event: Ends the stream once set (checked between polls and heads)
+        """
+        self.w3 = w3
+        self.address = address
+        self.topics = list(topics) if topics else None
+        self.block_time = block_time
+        self.min_poll_interval = min_poll_interval
+        self.confirmations = confirmations
+        self.reorg_window = reorg_window
+        self.ws_url = ws_url
+        self.scanner = scanner or LogScanner(w3)
+        self.stop_event = stop_event or threading.Event()
+
+        self.last_block: Optional[int] = None
+        self._hashes: "OrderedDict[int, str]" = OrderedDict()
+        self._recent_logs: Deque[AttributeDict] = deque()
+
+    def stream(self, from_block: Optional[int] = None) -> Iterator[AttributeDict]:
+        """
+        Yield matching logs until ``stop_event`` is set, starting after the current head.
+
+        Args:
+            from_block: First block to emit logs from (default: the next new block)
+
+        Yields:
+            Raw logs in chain order; reorged-out logs are re-yielded with removed=True
+        """
+        if from_block is not None:
+            self.last_block = from_block - 1
+        if self.ws_url:
+            try:
+                yield from self._stream_websocket()
+                return
+            except ImportError:
+                pass
+        yield from self._stream_polling()
+
+    def _stream_polling(self) -> Iterator[AttributeDict]:
+        interval = self.min_poll_interval
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            processed = self.last_block
+            with pinned():
+                logs = self._step(self.w3.eth.get_block("latest"))
+            yield from logs
+
+            if self.last_block is not None and self.last_block != processed:
+                # A new block arrived: the next one is about one block time away
+                interval = self.block_time
+            else:
+                # Early or missed: retry soon, backing off towards one block time
+                interval = min(self.block_time, max(self.min_poll_interval, interval / 2))
+            self.stop_event.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    def _stream_websocket(self) -> Iterator[AttributeDict]:
+        from websockets.sync.client import connect
+
+        with connect(self.ws_url) as ws:
+            ws.send(
+                json.dumps(
+                    {"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": ["newHeads"]}
+                )
+            )
+            json.loads(ws.recv())  # subscription id
+
+            # Catch up to the current head before following notifications
+            with pinned():
+                logs = self._step(self.w3.eth.get_block("latest"))
+            yield from logs
+            for message in ws:
+                if self.stop_event.is_set():
+                    return
+                params = json.loads(message).get("params") or {}
+                header = params.get("result")
+                if header:
+                    yield from self._step(
+                        AttributeDict(
+                            {
+                                "number": int(header["number"], 16),
+                                "hash": header["hash"],
+                                "parentHash": header["parentHash"],
+                            }
+                        )
+                    )
+
+    def _step(self, head: Any) -> List[AttributeDict]:
+        """Run :meth:`_advance` to completion with all of its requests on one endpoint."""
+        with pinned():
+            return list(self._advance(head))
+
+    def _advance(self, head: Any) -> Iterator[AttributeDict]:
+        """Process a new head: handle reorgs, then emit logs up to the safe block."""
+        head_number = head["number"]
+        if self.last_block is None:
+            self.last_block = head_number - 1
+
+        if self._reorged(head):
+            yield from self._rewind()
+
+        target = head_number - self.confirmations
+        if target <= self.last_block:
+            self._remember(head_number, _hex(head["hash"]))
+            return
+
+        criteria: Dict[str, Any] = {"address": self.address, "topics": self.topics}
+        logs = self.scanner.get_logs(from_block=self.last_block + 1, to_block=target, **criteria)
+        for log in logs:
+            log = AttributeDict({**log, "removed": False})
+            self._recent_logs.append(log)
+            yield log
+
+        self.last_block = target
+        self._remember(head_number, _hex(head["hash"]))
+        self._prune()
+
+    def _reorged(self, head: Any) -> bool:
+        """Return True if the remembered chain no longer matches the node's."""
+        if not self._hashes:
+            return False
+        # The same height on another fork (e.g. the tip replaced by a sibling)
+        known = self._hashes.get(head["number"])
+        if known is not None and known != _hex(head["hash"]):
+            return True
+        known = self._hashes.get(head["number"] - 1)
+        if known is not None:
+            return known != _hex(head["parentHash"])
+        last_known = next(reversed(self._hashes))
+        if last_known > head["number"]:
+            return True
+        block = self._block(last_known)
+        return block is None or _hex(block["hash"]) != self._hashes[last_known]
+
+    def _rewind(self) -> Iterator[AttributeDict]:
+        """Find the last common block, drop newer state and yield removed logs."""
+        ancestor = None
+        for number in reversed(list(self._hashes)):
+            block = self._block(number)
+            if block is not None and _hex(block["hash"]) == self._hashes[number]:
+                ancestor = number
+                break
+            del self._hashes[number]
+
+        if ancestor is None:
+            # The reorg is deeper than our window: resume from before it
+            ancestor = max(0, (self.last_block or 0) - self.reorg_window)
+            self._hashes.clear()
+
+        while self._recent_logs and self._recent_logs[-1]["blockNumber"] > ancestor:
+            yield AttributeDict({**self._recent_logs.pop(), "removed": True})
+        self.last_block = min(self.last_block or ancestor, ancestor)
+
+    def _block(self, number: int) -> Optional[Any]:
+        """The node's block at a height, or None if it has none (e.g. after a reorg)."""
+        try:
+            return self.w3.eth.get_block(number)
+        except BlockNotFound:
+            return None
+
+    def _remember(self, number: int, block_hash: str) -> None:
+        self._hashes[number] = block_hash
+        self._hashes.move_to_end(number)
+
+    def _prune(self) -> None:
+        """Forget blocks and logs that fell out of the reorg window."""
+        floor = (self.last_block or 0) - self.reorg_window
+        while self._hashes and next(iter(self._hashes)) < floor:
+            self._hashes.popitem(last=False)
+        while self._recent_logs and self._recent_logs[0]["blockNumber"] < floor:
+            self._recent_logs.popleft()
+
+
+def _hex(value: Any) -> str:
+    return value.hex() if isinstance(value, (bytes, bytearray)) else str(value)
@@ -0,0 +1,42 @@
+"""
+Shared rich console for the command-line tools.
+
+The console is created, and rich imported, on first use, so that commands
+which print nothing (``--help``, argument errors) start without loading it.
+"""
+
+
+from python.common.profiling import get_phase_timer
+
+_phases = get_phase_timer()
+
+
+class LazyConsole:
+    """
+    Stands in for a ``rich.console.Console`` until an attribute is first used.
+
+    While phases are timed, ``print`` counts as the ``render`` phase.
+    """
+
+    _console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        attribute = getattr(self._console, name)
+        if name == "print" and _phases.enabled:
+            return _rendering(attribute)
+        return attribute
+
+
+def _rendering(print_):
+    def print_timed(*args, **kwargs):
+        with _phases.phase("render"):
+            return print_(*args, **kwargs)
+
+    return print_timed
+
+
+console = LazyConsole()
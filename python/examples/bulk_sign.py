@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Bulk Message Signer
+
+Signs every record of a JSONL or CSV file (or stdin) with the PRIVATE_KEY
+account and writes one JSONL result per record, in input order, to stdout or
+a file. Personal messages are signed with ``encode_defunct`` (EIP-191);
+``--mode eip712`` signs typed data, either complete typed-data documents per
+record or per-record messages for a ``--typed-data`` template. Messages are
+text unless ``--hex`` says they are hex-encoded bytes. Records that cannot be
+signed are written with an ``error`` field and make the exit status 1.
+
+Usage:
+    poetry run bulk-sign allowlist.csv --field address -o signed.jsonl
+    cat attestations.jsonl | poetry run bulk-sign - --mode eip712 --typed-data tpl.json
+
+Author: Base Learning Curriculum
+"""
+
+import json
+import os
+import sys
+import time
+
+import click
+from dotenv import load_dotenv
+
+from python.common.signing import MODES, read_records, sign_stream
+from python.common.wallet import load_account
+
+
+@click.command()
+@click.argument("input_file", type=click.File("r", encoding="utf-8"), default="-")
+@click.option("-o", "--output", type=click.File("w"), default="-", help="Output JSONL file")
+@click.option("--format", "fmt", type=click.Choice(["jsonl", "csv"]), help="Input format")
+@click.option("--mode", type=click.Choice(MODES), default="personal", help="Signing scheme")
+@click.option("--field", default="message", help="Record field holding the message text")
+@click.option("--hex", "hex_messages", is_flag=True, help="Messages are 0x-prefixed hex bytes")
+@click.option("--typed-data", type=click.File("r"), help="EIP-712 template for --mode eip712")
+@click.option("--workers", type=int, help="Worker processes (default: all cores)")
+@click.option("--chunk-size", default=500, help="Records per worker task")
+def main(input_file, output, fmt, mode, field, hex_messages, typed_data, workers, chunk_size):
+    """Sign every record of INPUT_FILE (JSONL or CSV, '-' for stdin)."""
+    load_dotenv()
+    account = load_account()
+    template = json.load(typed_data) if typed_data else None
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    signed = failed = 0
+    for result in sign_stream(
+        read_records(input_file, fmt),
+        account.key,
+        mode=mode,
+        field=field,
+        typed_data=template,
+        workers=workers,
+        chunk_size=chunk_size,
+        hex_messages=hex_messages,
+    ):
+        output.write(json.dumps(result) + "\n")
+        if "error" in result:
+            failed += 1
+        else:
+            signed += 1
+    output.flush()
+    elapsed = time.perf_counter() - start
+
+    rate = signed / elapsed if elapsed else 0.0
+    print(
+        f"Signed {signed} records as {account.address} in {elapsed:.2f}s: "
+        f"{rate:,.0f} sig/s on {workers} worker(s), {rate / workers:,.0f} sig/s per core",
+        file=sys.stderr,
+    )
+    if failed:
+        print(f"{failed} records could not be signed (see their 'error' field)", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Bulk Signature Verifier
+
+Counterpart of bulk-sign: recovers the signer of every record of a JSONL or
+CSV file (or stdin) and writes only the records whose signer does not match,
+with a ``recovered`` field added, and the records that could not be verified,
+with an ``error`` field. Exits with status 1 when any of either was found.
+
+Usage:
+    poetry run bulk-verify signed.jsonl --expected 0xf39F...2266
+    poetry run bulk-verify submissions.csv --address-field wallet -o bad.jsonl
+
+Author: Base Learning Curriculum
+"""
+
+import json
+import sys
+import time
+
+import click
+
+from python.common.signing import MODES, SignatureVerifier, read_records
+
+
+@click.command()
+@click.argument("input_file", type=click.File("r", encoding="utf-8"), default="-")
+@click.option(
+    "-o", "--output", type=click.File("w"), default="-", help="Mismatches and errors as JSONL"
+)
+@click.option("--format", "fmt", type=click.Choice(["jsonl", "csv"]), help="Input format")
+@click.option("--mode", type=click.Choice(MODES), default="personal", help="Signing scheme")
+@click.option("--field", default="message", help="Record field holding the message text")
+@click.option("--hex", "hex_messages", is_flag=True, help="Messages are 0x-prefixed hex bytes")
+@click.option("--typed-data", type=click.File("r"), help="EIP-712 template for --mode eip712")
+@click.option("--signature-field", default="signature", help="Record field holding the signature")
+@click.option("--address-field", default="signer", help="Record field holding the signer")
+@click.option("--expected", help="Expected signer of every record")
+@click.option("--workers", type=int, help="Worker processes (default: all cores)")
+@click.option("--chunk-size", default=500, help="Records per worker task")
+def main(
+    input_file,
+    output,
+    fmt,
+    mode,
+    field,
+    hex_messages,
+    typed_data,
+    signature_field,
+    address_field,
+    expected,
+    workers,
+    chunk_size,
+):
+    """Verify every record of INPUT_FILE (JSONL or CSV, '-' for stdin)."""
+    verifier = SignatureVerifier(
+        mode=mode,
+        field=field,
+        typed_data=json.load(typed_data) if typed_data else None,
+        signature_field=signature_field,
+        address_field=address_field,
+        expected=expected,
+        workers=workers,
+        chunk_size=chunk_size,
+        hex_messages=hex_messages,
+    )
+
+    start = time.perf_counter()
+    for mismatch in verifier.verify(read_records(input_file, fmt)):
+        output.write(json.dumps(mismatch) + "\n")
+    output.flush()
+    elapsed = time.perf_counter() - start
+
+    rate = verifier.checked / elapsed if elapsed else 0.0
+    print(
+        f"Checked {verifier.checked} records in {elapsed:.2f}s ({rate:,.0f}/s on "
+        f"{verifier.workers} worker(s)): {verifier.mismatches} mismatches, "
+        f"{verifier.errors} errors, {verifier.cache_hits} cache hits",
+        file=sys.stderr,
+    )
+    sys.exit(1 if verifier.mismatches or verifier.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
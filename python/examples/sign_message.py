@@ -1,15 +1,14 @@
 from dotenv import load_dotenv
 from eth_account.messages import encode_defunct
-from web3 import Web3
 
-from python.common.rpc import get_rpc
+from python.common.rpc import get_rpc, get_web3
 from python.common.wallet import load_account
 
 
 def main():
     load_dotenv()
     rpc = get_rpc()
-    w3 = Web3(Web3.HTTPProvider(rpc.url))
+    w3 = get_web3(rpc.url)
     acct = load_account()
 
     msg = encode_defunct(text="hello base")
@@ -0,0 +1,218 @@
+"""
+Instrumentation options shared by the command-line tools.
+
+The click groups of ``base-cli`` and ``hello-base`` call these from their
+group callbacks, before any command (or web3) is loaded; the reports are
+printed when the command's context closes, whether or not it succeeded.
+"""
+
+import time
+from typing import Optional
+
+import click
+
+from python.console import console
+
+
+def enable_rpc_stats(ctx: click.Context, show: bool, prometheus_path: Optional[str]) -> None:
+    """
+    Collect JSON-RPC statistics for the command and report them when it ends.
+
+    Args:
+        ctx: Context of the click group
+        show: Print a per-method summary table
+        prometheus_path: Also write the statistics to this file in Prometheus text format
+    """
+    from python.common.metrics import get_metrics
+
+    metrics = get_metrics()
+    metrics.enable()
+
+    def report() -> None:
+        if show:
+            print_rpc_stats()
+        if prometheus_path:
+            metrics.write_prometheus(prometheus_path)
+            console.print(f"[blue]📈 RPC statistics written to {prometheus_path}[/blue]")
+
+    ctx.call_on_close(report)
+
+
+def print_rpc_stats() -> None:
+    """Print the per-method JSON-RPC statistics recorded so far."""
+    from rich.table import Table
+
+    from python.common.metrics import get_metrics
+
+    rows = get_metrics().summary()
+    if not rows:
+        console.print("[yellow]No JSON-RPC requests were made.[/yellow]")
+        return
+
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    table = Table(title="JSON-RPC Statistics")
+    table.add_column("Method", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Batched", justify="right")
+    table.add_column("Errors", justify="right", style="red")
+    table.add_column("Mean (ms)", justify="right")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    table.add_column("Total (ms)", justify="right", style="green")
+    table.add_column("Sent (B)", justify="right")
+    table.add_column("Received (B)", justify="right")
+    for row in rows:
+        table.add_row(
+            row["method"],
+            str(row["calls"]),
+            str(row["batched"]),
+            str(row["errors"]),
+            ms(row["mean_ms"]),
+            ms(row["p50_ms"]),
+            ms(row["p95_ms"]),
+            ms(row["max_ms"]),
+            ms(row["total_ms"]),
+            str(row["request_bytes"]),
+            str(row["response_bytes"]),
+        )
+    round_trips = sum(row["calls"] for row in rows)
+    total = sum(row["total_ms"] for row in rows)
+    table.caption = f"{round_trips} round trips, {total:.1f} ms waiting on the network"
+    console.print(table)
+
+
+def enable_profiling(
+    ctx: click.Context, show: bool, pstats_path: Optional[str], memory: bool = True
+) -> None:
+    """
+    Profile the command with cProfile (and tracemalloc) and report when it ends.
+
+    Args:
+        ctx: Context of the click group
+        show: Print phase timings, the top functions, peak traced memory and the
+            allocations still held when the command ended
+        pstats_path: Also dump the cProfile statistics to this file (for snakeviz, pstats)
+        memory: Trace allocations too; this slows imports several times over
+    """
+    import cProfile
+    import tracemalloc
+
+    from python.common.profiling import get_phase_timer, process_age
+
+    # Interpreter start-up and the CLI's own imports, before profiling began
+    startup = process_age()
+    timer = get_phase_timer()
+    # Entered first, so the import hook is removed when the context closes even if
+    # the set-up below or the command fails before the report runs
+    ctx.with_resource(timer.timing())
+    profiler = cProfile.Profile()
+    if memory:
+        tracemalloc.start()
+        ctx.call_on_close(tracemalloc.stop)
+    start = time.perf_counter()
+    profiler.enable()
+
+    def report() -> None:
+        profiler.disable()
+        wall = time.perf_counter() - start
+        phases = timer.disable()
+        snapshot, peak = None, 0
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        if pstats_path:
+            profiler.dump_stats(pstats_path)
+        if show:
+            print_profile(profiler, startup, phases, wall)
+            if snapshot is not None:
+                print_allocations(snapshot, peak)
+        if pstats_path:
+            console.print(f"[blue]🔬 Profile written to {pstats_path}[/blue]")
+
+    ctx.call_on_close(report)
+
+
+def print_profile(profiler, startup: Optional[float], phases, wall: float, top: int = 15) -> None:
+    """
+    Print the time spent per phase and the functions with the most cumulative time.
+
+    Args:
+        profiler: Disabled ``cProfile.Profile`` of the command
+        startup: Seconds from process start to profiling, if known
+        phases: Exclusive seconds per phase (see ``python.common.profiling``)
+        wall: Seconds the command ran for
+        top: Number of functions to list
+    """
+    import pstats
+
+    from rich.table import Table
+
+    timings = Table(title="Phase Timings")
+    timings.add_column("Phase", style="cyan")
+    timings.add_column("Time (ms)", justify="right", style="green")
+    timings.add_column("Share", justify="right")
+    rows = [("startup", startup)] if startup is not None else []
+    for name in ("imports", "client init", "rpc", "render"):
+        rows.append((name, phases.get(name, 0.0)))
+    rows.append(("other", max(0.0, wall - sum(phases.values()))))
+    total = wall + (startup or 0.0)
+    for name, seconds in rows:
+        timings.add_row(name, f"{seconds * 1000:.1f}", f"{seconds / total:.0%}" if total else "-")
+    timings.caption = f"{total * 1000:.1f} ms in total, profiler overhead included"
+    console.print(timings)
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    functions = Table(title=f"Top {top} Functions by Cumulative Time")
+    functions.add_column("Function", style="cyan", overflow="fold")
+    functions.add_column("Calls", justify="right")
+    functions.add_column("Own (ms)", justify="right")
+    functions.add_column("Cumulative (ms)", justify="right", style="green")
+    for func in stats.fcn_list[:top]:
+        _, calls, own, cumulative, _ = stats.stats[func]
+        filename, lineno, name = func
+        # Built-ins have no file ("~") or line
+        label = f"{name} ({_short_path(filename)}:{lineno})" if lineno else name
+        functions.add_row(label, str(calls), f"{own * 1000:.1f}", f"{cumulative * 1000:.1f}")
+    console.print(functions)
+
+
+def print_allocations(snapshot, peak: int, top: int = 10) -> None:
+    """
+    Print the source lines holding the most traced memory when the command ended.
+
+    The sites are those of the memory still allocated at exit, not at the peak;
+    only the peak total is known.
+
+    Args:
+        snapshot: ``tracemalloc`` snapshot taken when the command ended
+        peak: Peak traced memory in bytes
+        top: Number of lines to list
+    """
+    from rich.table import Table
+
+    allocations = Table(title="Top Allocation Sites at Exit")
+    allocations.add_column("Line", style="cyan", overflow="fold")
+    allocations.add_column("Blocks", justify="right")
+    allocations.add_column("Size (KiB)", justify="right", style="green")
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        allocations.add_row(
+            f"{_short_path(frame.filename)}:{frame.lineno}",
+            str(stat.count),
+            f"{stat.size / 1024:.1f}",
+        )
+    allocations.caption = f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB"
+    console.print(allocations)
+
+
+def _short_path(filename: str) -> str:
+    """A file name relative to the working directory or to its site-packages."""
+    import os
+
+    if filename.startswith(os.getcwd() + os.sep):
+        return os.path.relpath(filename)
+    return filename.rsplit("site-packages" + os.sep, 1)[-1]
@@ -3,9 +3,34 @@ Stage 0: EVM Basics & Tooling
 
 This module contains tools and utilities for Stage 0 of the Base Learning Curriculum,
 including smart contract interaction clients and CLI tools.
+
+Exports are imported on first access, so that loading the CLI (or any one
+submodule) does not pull in web3 through the clients it does not use.
 """
 
-from .cli import cli
-from .hello_base import HelloBaseClient
+import importlib
+
+_EXPORTS = {
+    "AsyncHelloBaseClient": "async_hello_base",
+    "HelloBaseClient": "hello_base",
+    "MessageMirror": "message_mirror",
+    "SimpleStorageClient": "simple_storage",
+    "cli": "cli",
+}
+
+__all__ = [
+    "AsyncHelloBaseClient",
+    "HelloBaseClient",
+    "MessageMirror",
+    "SimpleStorageClient",
+    "cli",
+]
+
 
-__all__ = ["HelloBaseClient", "cli"]
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Async HelloBase Contract Interaction Module
+
+This module provides an asyncio counterpart of HelloBaseClient built on
+AsyncWeb3. Independent reads run concurrently with asyncio.gather (or in one
+JSON-RPC batch with read_many), and every client on an event loop shares one
+pooled HTTP session.
+
+Author: Base Learning Curriculum
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from eth_account.signers.local import LocalAccount
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import ContractLogicError
+
+from python.common.abi import get_abi_registry
+from python.common.fees import get_fee_oracle
+from python.common.gas import get_gas_estimator
+from python.common.logs import AsyncLogScanner
+from python.common.multicall import async_read_many
+from python.common.pool import pinned
+from python.common.rpc import RPC, get_async_rpc, get_async_web3, get_rpc_url
+from python.common.tx import OutOfGas
+from python.common.wallet import load_account
+from python.stage0.hello_base import HELLO_BASE_ABI
+
+
+class AsyncHelloBaseClient:
+    """
+    An asyncio client for interacting with the HelloBase smart contract.
+
+    Construction does no network I/O and loads no key; the chain id is
+    verified on first use of :meth:`get_rpc` (and memoized process-wide by the
+    provider registry), and the account is loaded when first needed.
+    """
+
+    def __init__(self, contract_address: str, abi_path: Optional[str] = None):
+        """
+        Initialize the async HelloBase client.
+
+        Args:
+            contract_address: The address of the deployed HelloBase contract
+            abi_path: Optional path to the contract ABI JSON file
+        """
+        self.w3 = get_async_web3(get_rpc_url())
+        self.contract_address = contract_address
+        self._rpc: Optional[RPC] = None
+        self._account: Optional[LocalAccount] = None
+        self._log_scanner: Optional[AsyncLogScanner] = None
+
+        # Contract ABI: --abi-path, else the Foundry artifact, else the inline copy
+        abis = get_abi_registry()
+        if abi_path and os.path.exists(abi_path):
+            self.spec = abis.load(abi_path)
+        else:
+            self.spec = abis.spec("HelloBase", HELLO_BASE_ABI)
+        self.abi = self.spec.abi
+
+        self.contract = self.spec.at(self.w3, contract_address)
+
+    @property
+    def account(self) -> LocalAccount:
+        """The signing account; only loaded by methods that need it."""
+        if self._account is None:
+            self._account = load_account()
+        return self._account
+
+    @property
+    def log_scanner(self) -> AsyncLogScanner:
+        """Chunked eth_getLogs scanner that remembers the provider's range limit."""
+        if self._log_scanner is None:
+            self._log_scanner = AsyncLogScanner(self.w3)
+        return self._log_scanner
+
+    async def get_rpc(self) -> RPC:
+        """
+        Get the verified RPC connection details.
+
+        Returns:
+            The RPC URL and chain id
+        """
+        if self._rpc is None:
+            self._rpc = await get_async_rpc()
+        return self._rpc
+
+    async def get_message(self, block_identifier: Any = "latest") -> str:
+        """
+        Get the current message from the contract.
+
+        Args:
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            The current message stored in the contract
+        """
+        return await self.contract.functions.getMessage().call(block_identifier=block_identifier)
+
+    async def get_owner(self, block_identifier: Any = "latest") -> str:
+        """
+        Get the contract owner address.
+
+        Args:
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            The address of the contract owner
+        """
+        return await self.contract.functions.getOwner().call(block_identifier=block_identifier)
+
+    async def get_message_length(self, block_identifier: Any = "latest") -> int:
+        """
+        Get the length of the current message.
+
+        Args:
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            The length of the message in bytes
+        """
+        return await self.contract.functions.getMessageLength().call(
+            block_identifier=block_identifier
+        )
+
+    async def is_owner(self, address: str, block_identifier: Any = "latest") -> bool:
+        """
+        Check if an address is the contract owner.
+
+        Args:
+            address: The address to check
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            True if the address is the owner, False otherwise
+        """
+        return await self.contract.functions.isOwner(address).call(
+            block_identifier=block_identifier
+        )
+
+    async def read_many(
+        self,
+        calls: Sequence[AsyncContractFunction],
+        allow_failure: bool = False,
+        block_identifier: Any = "latest",
+    ) -> List[Any]:
+        """
+        Execute many view calls in a single request.
+
+        Calls are packed into one ``eth_call`` through the ReadAggregator at
+        ``READ_AGGREGATOR_ADDRESS`` when it is set, otherwise into one JSON-RPC batch.
+
+        Args:
+            calls: Bound contract functions, e.g. ``client.contract.functions.getMessage()``
+            allow_failure: Return None for failing calls instead of raising
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            Decoded results, in the same order as ``calls``
+        """
+        return await async_read_many(
+            self.w3, calls, allow_failure=allow_failure, block_identifier=block_identifier
+        )
+
+    async def update_message(self, new_message: str, gas_limit: Optional[int] = None) -> str:
+        """
+        Update the contract message.
+
+        Without ``gas_limit`` the memoized estimate is used. That estimate can
+        run out when the stored message needs more storage than the one it
+        was measured against; the update is then sent once more, automatically,
+        with a fresh estimate (a second transaction and nonce). Pass
+        ``gas_limit`` to send exactly one transaction.
+
+        Args:
+            new_message: The new message to store
+            gas_limit: Gas limit for the transaction (default: memoized estimate)
+
+        Returns:
+            The transaction hash
+
+        Raises:
+            ValueError: If the message is empty
+            OutOfGas: If the transaction ran out of gas (with a memoized limit: twice)
+            ContractLogicError: If the transaction reverts
+        """
+        if not new_message.strip():
+            raise ValueError("Message cannot be empty")
+
+        function = self.contract.functions.updateMessage(new_message)
+        estimator = get_gas_estimator(self.w3)
+        memoized = gas_limit is None
+        # A memoized limit that runs out is forgotten (here only) and the update
+        # sent once more with a fresh estimate
+        for attempt in range(2 if memoized else 1):
+            fees, nonce = await asyncio.gather(
+                get_fee_oracle(self.w3).async_tx_params(),
+                self.w3.eth.get_transaction_count(self.account.address),
+            )
+            if memoized:
+                gas_limit = await estimator.async_estimate(function, self.account.address)
+
+            # Build transaction
+            transaction = await function.build_transaction(
+                {
+                    "from": self.account.address,
+                    "gas": gas_limit,
+                    "chainId": (await self.get_rpc()).chain_id,
+                    "nonce": nonce,
+                    **fees,
+                }
+            )
+
+            # Sign and send transaction
+            signed_txn = self.account.sign_transaction(transaction)
+            tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+
+            # Wait for receipt
+            receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+
+            if receipt.status == 0 and receipt.gasUsed >= gas_limit:
+                if memoized:
+                    estimator.forget(function)
+                    if not attempt:
+                        continue
+                raise OutOfGas(f"Transaction ran out of gas (limit {gas_limit})")
+            break
+
+        if receipt.status == 0:
+            raise ContractLogicError("Transaction reverted")
+
+        return receipt.transactionHash.hex()
+
+    async def get_events(
+        self, from_block: int = 0, to_block: Any = "latest"
+    ) -> List[Dict[str, Any]]:
+        """
+        Get MessageUpdated events from the contract.
+
+        The range is fetched in adaptive, concurrent block chunks (see
+        :class:`AsyncLogScanner`), so long ranges stay within provider limits.
+
+        Args:
+            from_block: Starting block number
+            to_block: Ending block number or 'latest'
+
+        Returns:
+            List of event logs
+        """
+        event = self.contract.events.MessageUpdated()
+        logs = await self.log_scanner.get_logs(
+            address=self.contract.address,
+            topics=[self.spec.topic("MessageUpdated")],
+            from_block=from_block,
+            to_block=to_block,
+        )
+        return [event.process_log(log) for log in logs]
+
+    async def get_balance(self, block_identifier: Any = "latest") -> int:
+        """
+        Get the account balance in wei.
+
+        Args:
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            The account balance in wei
+        """
+        return await self.w3.eth.get_balance(self.account.address, block_identifier)
+
+    async def get_balance_eth(self) -> float:
+        """
+        Get the account balance in ETH.
+
+        Returns:
+            The account balance in ETH
+        """
+        balance_wei = await self.get_balance()
+        return self.w3.from_wei(balance_wei, "ether")
+
+    async def get_contract_info(self) -> Dict[str, Any]:
+        """
+        Get comprehensive contract information.
+
+        All reads are pinned to the current head and issued concurrently, on
+        the endpoint that reported that head when the URL names a pool.
+
+        Returns:
+            Dictionary containing contract information
+        """
+
+        async def snapshot() -> List[Any]:
+            with pinned():
+                block = await self.w3.eth.block_number
+                return await asyncio.gather(
+                    self.get_balance(block),
+                    self.get_message(block),
+                    self.get_message_length(block),
+                    self.get_owner(block),
+                    self.is_owner(self.account.address, block),
+                )
+
+        # The chain id lookup runs beside the snapshot, outside its pin
+        (balance_wei, message, length, owner, is_owner), rpc = await asyncio.gather(
+            snapshot(), self.get_rpc()
+        )
+        return {
+            "contract_address": self.contract_address,
+            "account": self.account.address,
+            "balance_eth": self.w3.from_wei(balance_wei, "ether"),
+            "current_message": message,
+            "message_length": length,
+            "owner": owner,
+            "is_owner": is_owner,
+            "chain_id": rpc.chain_id,
+        }
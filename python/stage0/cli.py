@@ -9,25 +9,45 @@ Author: Base Learning Curriculum
 """
 
 import click
-from hello_base import HelloBaseClient
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-console = Console()
+from python.console import console
+from python.instrumentation import enable_profiling, enable_rpc_stats
 
 
 @click.group()
 @click.version_option(version="1.0.0")
-def cli():
+@click.option("--rpc-stats", is_flag=True, help="Print per-method JSON-RPC statistics on exit")
+@click.option(
+    "--rpc-stats-file",
+    type=click.Path(dir_okay=False),
+    help="Write JSON-RPC statistics to a file in Prometheus text format",
+)
+@click.option(
+    "--profile", is_flag=True, help="Profile the command (time per phase, functions, memory)"
+)
+@click.option(
+    "--profile-out",
+    type=click.Path(dir_okay=False),
+    help="Dump cProfile statistics to a .pstats file (implies profiling)",
+)
+@click.option(
+    "--profile-memory/--no-profile-memory",
+    default=True,
+    help="Trace allocations while profiling (slows imports; on by default)",
+)
+@click.pass_context
+def cli(ctx, rpc_stats, rpc_stats_file, profile, profile_out, profile_memory):
     """
     HelloBase CLI - Interact with your HelloBase contract on Base-Sepolia.
 
     This tool provides commands to read contract state, update messages,
     and view transaction history.
     """
-    pass
+    if rpc_stats or rpc_stats_file:
+        enable_rpc_stats(ctx, rpc_stats, rpc_stats_file)
+    # Registered last so that it reports (and stops profiling) before the statistics print
+    if profile or profile_out:
+        enable_profiling(ctx, profile, profile_out, profile_memory)
 
 
 @cli.command()
@@ -35,6 +55,10 @@ def cli():
 @click.option("--abi-path", help="Path to contract ABI JSON file")
 def info(contract_address, abi_path):
     """Get comprehensive contract information."""
+    from rich.table import Table
+
+    from python.stage0.hello_base import HelloBaseClient
+
     try:
         client = HelloBaseClient(contract_address, abi_path)
         info = client.get_contract_info()
@@ -77,9 +101,11 @@ def info(contract_address, abi_path):
 @click.argument("contract_address")
 @click.argument("new_message")
 @click.option("--abi-path", help="Path to contract ABI JSON file")
-@click.option("--gas-limit", default=100000, help="Gas limit for the transaction")
+@click.option("--gas-limit", type=int, help="Gas limit for the transaction (default: estimated)")
 def update(contract_address, new_message, abi_path, gas_limit):
     """Update the contract message."""
+    from python.stage0.hello_base import HelloBaseClient
+
     try:
         client = HelloBaseClient(contract_address, abi_path)
 
@@ -98,7 +124,7 @@ def update(contract_address, new_message, abi_path, gas_limit):
 
         console.print(f"[yellow]🔄 Updating message to: {new_message}[/yellow]")
         console.print(f"[blue]💰 Balance: {balance:.4f} ETH[/blue]")
-        console.print(f"[blue]⛽ Gas limit: {gas_limit}[/blue]")
+        console.print(f"[blue]⛽ Gas limit: {gas_limit or 'estimated'}[/blue]")
 
         # Update message
         tx_hash = client.update_message(new_message, gas_limit)
@@ -128,11 +154,17 @@ def update(contract_address, new_message, abi_path, gas_limit):
 @click.argument("contract_address")
 @click.option("--abi-path", help="Path to contract ABI JSON file")
 @click.option("--count", default=5, help="Number of recent events to show")
-def events(contract_address, abi_path, count):
+@click.option("--total", is_flag=True, help="Also count all events ever emitted")
+@click.option("--no-index", is_flag=True, help="Count by scanning the chain, not the event index")
+def events(contract_address, abi_path, count, total, no_index):
     """Show recent contract events."""
+    from rich.table import Table
+
+    from python.stage0.hello_base import HelloBaseClient
+
     try:
         client = HelloBaseClient(contract_address, abi_path)
-        events = client.get_events()
+        events = client.get_recent_events(count)
 
         if not events:
             console.print("[yellow]📭 No events found.[/yellow]")
@@ -140,7 +172,7 @@ def events(contract_address, abi_path, count):
 
         # Create events table
         table = Table(
-            title=f"📜 Recent Events (last {min(count, len(events))})",
+            title=f"📜 Recent Events (last {len(events)})",
             show_header=True,
             header_style="bold magenta",
         )
@@ -149,7 +181,7 @@ def events(contract_address, abi_path, count):
         table.add_column("Updater", style="blue")
         table.add_column("Transaction", style="dim")
 
-        for event in events[-count:]:
+        for event in events:
             # Truncate long messages
             message = event["args"]["newMessage"]
             if len(message) > 30:
@@ -166,18 +198,57 @@ def events(contract_address, abi_path, count):
 
         console.print(table)
 
-        # Show total events count
-        console.print(f"\n[blue]📊 Total events: {len(events)}[/blue]")
+        # Show total events count (requires history beyond the recent window)
+        if total:
+            if no_index:
+                total_events = len(client.get_events(use_index=False))
+            else:
+                total_events = client.count_events()
+            console.print(f"\n[blue]📊 Total events: {total_events}[/blue]")
 
     except Exception as e:
         console.print(f"[red]❌ Error: {e}[/red]")
 
 
+@cli.command()
+@click.argument("contract_address")
+@click.option("--abi-path", help="Path to contract ABI JSON file")
+@click.option("--from-block", type=int, help="Replay events from this block before following")
+@click.option("--confirmations", default=0, help="Blocks to wait before showing an event")
+@click.option("--ws-url", help="Websocket RPC URL for newHeads (default: BASE_WS_RPC)")
+def watch(contract_address, abi_path, from_block, confirmations, ws_url):
+    """Stream new contract events as they happen (Ctrl+C to stop)."""
+    from python.stage0.hello_base import HelloBaseClient
+
+    try:
+        client = HelloBaseClient(contract_address, abi_path)
+        console.print(f"[blue]👀 Watching {contract_address} for MessageUpdated events...[/blue]")
+
+        for event in client.watch_events(from_block, confirmations, ws_url):
+            updater = event["args"]["updater"]
+            updater_short = updater[:6] + "..." + updater[-4:]
+            line = f"#{event['blockNumber']} {updater_short}: {event['args']['newMessage']}"
+            if event["removed"]:
+                console.print(f"[red]↩️  Reorged out {line}[/red]")
+            else:
+                console.print(f"[green]📨 {line}[/green]")
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]👋 Stopped watching.[/yellow]")
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+
+
 @cli.command()
 @click.argument("contract_address")
 @click.option("--abi-path", help="Path to contract ABI JSON file")
 def balance(contract_address, abi_path):
     """Check your account balance."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from python.stage0.hello_base import HelloBaseClient
+
     try:
         client = HelloBaseClient(contract_address, abi_path)
         balance_eth = client.get_balance_eth()
@@ -214,6 +285,8 @@ def balance(contract_address, abi_path):
 @click.option("--abi-path", help="Path to contract ABI JSON file")
 def test(contract_address, abi_path):
     """Run a quick test of contract functionality."""
+    from python.stage0.hello_base import HelloBaseClient
+
     try:
         client = HelloBaseClient(contract_address, abi_path)
 
@@ -250,6 +323,8 @@ def test(contract_address, abi_path):
 @cli.command()
 def setup():
     """Show setup instructions for using the CLI."""
+    from rich.panel import Panel
+
     instructions = """
 🔧 HelloBase CLI Setup Instructions
 
@@ -271,6 +346,7 @@ def setup():
    • python python/stage0/cli.py info <CONTRACT_ADDRESS>
    • python python/stage0/cli.py update <CONTRACT_ADDRESS> "New Message"
    • python python/stage0/cli.py events <CONTRACT_ADDRESS>
+   • python python/stage0/cli.py watch <CONTRACT_ADDRESS>
 
 5. 🔍 Verify on Explorer:
    • Check your contract on: https://sepolia.basescan.org
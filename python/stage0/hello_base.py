@@ -8,15 +8,136 @@ deployed on Base-Sepolia testnet. It demonstrates basic web3.py usage patterns.
 Author: Base Learning Curriculum
 """
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
-from web3.exceptions import ContractLogicError
-
-from python.common.rpc import get_rpc
+from web3.contract.contract import Contract, ContractFunction
+from web3.datastructures import AttributeDict
+
+from python.common.abi import get_abi_registry
+from python.common.batch import RPCBatch
+from python.common.event_index import EventIndex
+from python.common.gas import get_gas_estimator
+from python.common.logs import LogScanner
+from python.common.multicall import read_many
+from python.common.pool import pinned
+from python.common.profiling import get_phase_timer
+from python.common.read_cache import ReadCache, get_read_cache
+from python.common.rpc import RPC, get_rpc, get_web3
+from python.common.tx import OutOfGas, TxHandle, TxPipeline
 from python.common.wallet import load_account
+from python.common.watch import BASE_BLOCK_TIME, LogWatcher
+
+# Default ABI for HelloBase contract
+HELLO_BASE_ABI = [
+    {
+        "inputs": [{"internalType": "string", "name": "_message", "type": "string"}],
+        "stateMutability": "nonpayable",
+        "type": "constructor",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {
+                "indexed": False,
+                "internalType": "string",
+                "name": "newMessage",
+                "type": "string",
+            },
+            {
+                "indexed": True,
+                "internalType": "address",
+                "name": "updater",
+                "type": "address",
+            },
+        ],
+        "name": "MessageUpdated",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {
+                "indexed": True,
+                "internalType": "address",
+                "name": "previousOwner",
+                "type": "address",
+            },
+            {
+                "indexed": True,
+                "internalType": "address",
+                "name": "newOwner",
+                "type": "address",
+            },
+        ],
+        "name": "OwnershipTransferred",
+        "type": "event",
+    },
+    {
+        "inputs": [],
+        "name": "getMessage",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getMessageLength",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getOwner",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "_address", "type": "address"}],
+        "name": "isOwner",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "message",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "owner",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "_newMessage", "type": "string"}],
+        "name": "updateMessage",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+
+# Events kept in the local event index
+INDEXED_EVENTS = ("MessageUpdated", "OwnershipTransferred")
+
+# View functions that only depend on the immutable owner; cached permanently
+IMMUTABLE_VIEWS = ("owner", "getOwner", "isOwner")
+
+# Profiling phase of the client's lazy set-up (ABI, endpoint, account, contract)
+CLIENT_INIT = "client init"
+
+_phases = get_phase_timer()
 
 
 class HelloBaseClient:
@@ -25,104 +146,114 @@ class HelloBaseClient:
 
     This class provides methods to read from and write to the HelloBase contract,
     handle events, and manage transactions.
+
+    Construction does no I/O: the endpoint is connected on the first call and
+    the account is only loaded by methods that need it, so read-only use works
+    without PRIVATE_KEY.
     """
 
-    def __init__(self, contract_address: str, abi_path: Optional[str] = None):
+    def __init__(
+        self,
+        contract_address: str,
+        abi_path: Optional[str] = None,
+        fast_calls: bool = False,
+        cache_reads: bool = False,
+    ):
         """
         Initialize the HelloBase client.
 
         Args:
             contract_address: The address of the deployed HelloBase contract
             abi_path: Optional path to the contract ABI JSON file
+            fast_calls: Send view calls as pre-encoded raw ``eth_call`` requests,
+                bypassing web3's contract stack and middleware
+            cache_reads: Serve repeated view calls within a block from the shared
+                :class:`ReadCache`; owner lookups are cached permanently
         """
-        self.rpc = get_rpc()
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc.url))
-        self.account = load_account()
         self.contract_address = contract_address
+        self.fast_calls = fast_calls
+        self.cache_reads = cache_reads
+
+        # Contract ABI: --abi-path, else the Foundry artifact, else the inline copy
+        with _phases.phase(CLIENT_INIT):
+            abis = get_abi_registry()
+            if abi_path and os.path.exists(abi_path):
+                self.spec = abis.load(abi_path)
+            else:
+                self.spec = abis.spec("HelloBase", HELLO_BASE_ABI)
+        self.abi = self.spec.abi
+
+        # Connected, checked and loaded on first use; see the properties below
+        self._rpc: Optional[RPC] = None
+        self._w3: Optional[Web3] = None
+        self._account: Optional[LocalAccount] = None
+        self._contract: Optional[Contract] = None
+        self._log_scanner: Optional[LogScanner] = None
+        self._event_index: Optional[EventIndex] = None
+        self._tx_pipeline: Optional[TxPipeline] = None
+
+    @property
+    def rpc(self) -> RPC:
+        """The RPC endpoint, with its chain id checked against CHAIN_ID on first use."""
+        if self._rpc is None:
+            with _phases.phase(CLIENT_INIT):
+                self._rpc = get_rpc()
+        return self._rpc
+
+    @property
+    def w3(self) -> Web3:
+        """The shared Web3 instance for the configured endpoint."""
+        if self._w3 is None:
+            with _phases.phase(CLIENT_INIT):
+                self._w3 = get_web3(self.rpc.url)
+        return self._w3
+
+    @property
+    def account(self) -> LocalAccount:
+        """The signing account; only loaded by methods that need it."""
+        if self._account is None:
+            with _phases.phase(CLIENT_INIT):
+                self._account = load_account()
+        return self._account
+
+    @property
+    def contract(self) -> Contract:
+        """The bound HelloBase contract."""
+        if self._contract is None:
+            with _phases.phase(CLIENT_INIT):
+                self._contract = self.spec.at(self.w3, self.contract_address)
+        return self._contract
+
+    @property
+    def log_scanner(self) -> LogScanner:
+        """Log scanner for event queries."""
+        if self._log_scanner is None:
+            self._log_scanner = LogScanner(self.w3)
+        return self._log_scanner
+
+    @property
+    def read_cache(self) -> ReadCache:
+        """The view-call cache shared by clients of this endpoint (used if ``cache_reads``)."""
+        return get_read_cache(self.w3)
+
+    def _view(self, name: str, *args: Any) -> Any:
+        """Call a view function, through the read cache when enabled."""
+        if not self.cache_reads:
+            return self._call_at(name, args, "latest")
+        return self.read_cache.get(
+            self.contract_address,
+            self.spec.function(name).encode_call(*args),
+            lambda block: self._call_at(name, args, block),
+            permanent=name in IMMUTABLE_VIEWS,
+        )
 
-        # Load contract ABI
-        if abi_path and os.path.exists(abi_path):
-            with open(abi_path, "r") as f:
-                self.abi = json.load(f)
-        else:
-            # Default ABI for HelloBase contract
-            self.abi = [
-                {
-                    "inputs": [{"internalType": "string", "name": "_message", "type": "string"}],
-                    "stateMutability": "nonpayable",
-                    "type": "constructor",
-                },
-                {
-                    "anonymous": False,
-                    "inputs": [
-                        {
-                            "indexed": False,
-                            "internalType": "string",
-                            "name": "newMessage",
-                            "type": "string",
-                        },
-                        {
-                            "indexed": True,
-                            "internalType": "address",
-                            "name": "updater",
-                            "type": "address",
-                        },
-                    ],
-                    "name": "MessageUpdated",
-                    "type": "event",
-                },
-                {
-                    "inputs": [],
-                    "name": "getMessage",
-                    "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [],
-                    "name": "getMessageLength",
-                    "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [],
-                    "name": "getOwner",
-                    "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [],
-                    "name": "isOwner",
-                    "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [],
-                    "name": "message",
-                    "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [],
-                    "name": "owner",
-                    "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [{"internalType": "string", "name": "_newMessage", "type": "string"}],
-                    "name": "updateMessage",
-                    "outputs": [],
-                    "stateMutability": "nonpayable",
-                    "type": "function",
-                },
-            ]
-
-        self.contract = self.w3.eth.contract(address=contract_address, abi=self.abi)
+    def _call_at(self, name: str, args: Sequence[Any], block_identifier: Any) -> Any:
+        """Call a view function through the raw fast path or the web3 contract."""
+        if self.fast_calls:
+            return self.spec.function(name).call(
+                self.w3, self.contract_address, *args, block_identifier=block_identifier
+            )
+        return self.contract.functions[name](*args).call(block_identifier=block_identifier)
 
     def get_message(self) -> str:
         """
@@ -131,7 +262,7 @@ class HelloBaseClient:
         Returns:
             The current message stored in the contract
         """
-        return self.contract.functions.getMessage().call()
+        return self._view("getMessage")
 
     def get_owner(self) -> str:
         """
@@ -140,7 +271,7 @@ class HelloBaseClient:
         Returns:
             The address of the contract owner
         """
-        return self.contract.functions.getOwner().call()
+        return self._view("getOwner")
 
     def get_message_length(self) -> int:
         """
@@ -149,7 +280,7 @@ class HelloBaseClient:
         Returns:
             The length of the message in bytes
         """
-        return self.contract.functions.getMessageLength().call()
+        return self._view("getMessageLength")
 
     def is_owner(self, address: str) -> bool:
         """
@@ -161,65 +292,269 @@ class HelloBaseClient:
         Returns:
             True if the address is the owner, False otherwise
         """
-        return self.contract.functions.isOwner(address).call()
+        return self._view("isOwner", address)
+
+    def read_many(
+        self,
+        calls: Sequence[ContractFunction],
+        allow_failure: bool = False,
+        block_identifier: Any = "latest",
+    ) -> List[Any]:
+        """
+        Execute many view calls in a single request.
 
-    def update_message(self, new_message: str, gas_limit: int = 100000) -> str:
+        Calls are packed into one ``eth_call`` through the ReadAggregator at
+        ``READ_AGGREGATOR_ADDRESS`` when it is set, otherwise into one JSON-RPC batch.
+
+        Args:
+            calls: Bound contract functions, e.g. ``client.contract.functions.getMessage()``
+            allow_failure: Return None for failing calls instead of raising
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            Decoded results, in the same order as ``calls``
+        """
+        return read_many(
+            self.w3, calls, allow_failure=allow_failure, block_identifier=block_identifier
+        )
+
+    def update_message(self, new_message: str, gas_limit: Optional[int] = None) -> str:
         """
         Update the contract message.
 
+        Without ``gas_limit`` the memoized estimate is used. That estimate can
+        run out when the stored message needs more storage than the one it
+        was measured against; the update is then sent once more, automatically,
+        with a fresh estimate (a second transaction and nonce). Pass
+        ``gas_limit`` to send exactly one transaction.
+
         Args:
             new_message: The new message to store
-            gas_limit: Gas limit for the transaction
+            gas_limit: Gas limit for the transaction (default: memoized estimate)
 
         Returns:
             The transaction hash
 
         Raises:
             ValueError: If the message is empty
+            OutOfGas: If the transaction ran out of gas (with a memoized limit: twice)
             ContractLogicError: If the transaction reverts
         """
+        handle = self.submit_update_message(new_message, gas_limit)
+        # Registered after submit_update_message's callbacks, so once this is set
+        # an out-of-gas estimate has been forgotten
+        settled = threading.Event()
+        handle.add_done_callback(lambda _: settled.set())
+        try:
+            receipt = handle.receipt()
+        except OutOfGas:
+            if gas_limit is not None:
+                raise
+            settled.wait()
+            receipt = self.submit_update_message(new_message).receipt()
+        if self.cache_reads:
+            self.read_cache.invalidate(self.contract_address)
+        return receipt.transactionHash.hex()
+
+    def submit_update_message(self, new_message: str, gas_limit: Optional[int] = None) -> TxHandle:
+        """
+        Send an updateMessage transaction without waiting for it to be mined.
+
+        Nonces come from the client's local counter (see :class:`TxPipeline`),
+        so many updates can be submitted back to back. If a memoized gas limit
+        runs out, the estimate is forgotten so that the next update re-estimates.
+
+        Args:
+            new_message: The new message to store
+            gas_limit: Gas limit for the transaction (default: memoized estimate,
+                see :class:`GasEstimator`)
+
+        Returns:
+            A handle whose ``receipt()`` waits for confirmation
+
+        Raises:
+            ValueError: If the message is empty
+        """
         if not new_message.strip():
             raise ValueError("Message cannot be empty")
 
-        # Build transaction
-        transaction = self.contract.functions.updateMessage(new_message).build_transaction(
+        function = self.contract.functions.updateMessage(new_message)
+        memoized = gas_limit is None
+        if memoized:
+            estimator = get_gas_estimator(self.w3)
+            gas_limit = estimator.estimate(function, self.account.address)
+
+        transaction = function.build_transaction(
             {
                 "from": self.account.address,
                 "gas": gas_limit,
-                "gasPrice": self.w3.eth.gas_price,
-                "nonce": self.w3.eth.get_transaction_count(self.account.address),
+                "chainId": self.tx_pipeline.chain_id,
+                **self.tx_pipeline.fees.tx_params(),
             }
         )
+        handle = self.tx_pipeline.submit(transaction)
+        if memoized:
+            # Storage the calldata does not show can make the estimate too low
+            handle.add_done_callback(lambda h: h.out_of_gas() and estimator.forget(function))
+        if self.cache_reads:
+            handle.add_done_callback(lambda _: self.read_cache.invalidate(self.contract_address))
+        return handle
+
+    @property
+    def tx_pipeline(self) -> TxPipeline:
+        """Transaction pipeline for the client's account, created on first use."""
+        if self._tx_pipeline is None:
+            self._tx_pipeline = TxPipeline(self.w3, self.account, chain_id=self.rpc.chain_id)
+        return self._tx_pipeline
+
+    @property
+    def event_index(self) -> EventIndex:
+        """The on-disk event index, opened on first use."""
+        if self._event_index is None:
+            self._event_index = EventIndex()
+        return self._event_index
+
+    def sync_events(self) -> int:
+        """
+        Bring the local event index up to the current head.
 
-        # Sign transaction
-        signed_txn = self.w3.eth.account.sign_transaction(transaction, self.account.key)
+        Only blocks after the last synced block (minus a small reorg margin)
+        are fetched from the node.
 
-        # Send transaction
-        tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        Returns:
+            The block number the index is synced to
+        """
+        return self.event_index.sync(
+            self.contract, INDEXED_EVENTS, self.log_scanner, self.rpc.chain_id
+        )
 
-        # Wait for receipt
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+    def count_events(
+        self, event_name: str = "MessageUpdated", from_block: int = 0, to_block: Any = "latest"
+    ) -> int:
+        """
+        Count events using the local event index.
 
-        if receipt.status == 0:
-            raise ContractLogicError("Transaction reverted")
+        Args:
+            event_name: Event name, e.g. 'MessageUpdated' or 'OwnershipTransferred'
+            from_block: Starting block number
+            to_block: Ending block number or 'latest'
 
-        return receipt.transactionHash.hex()
+        Returns:
+            Number of matching events
+        """
+        head = self.sync_events()
+        return self.event_index.count(
+            self.rpc.chain_id,
+            self.contract.address,
+            event_name,
+            from_block,
+            head if to_block == "latest" else to_block,
+        )
 
-    def get_events(self, from_block: int = 0, to_block: str = "latest") -> List[Dict[str, Any]]:
+    def get_events(
+        self, from_block: int = 0, to_block: Any = "latest", use_index: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Get MessageUpdated events from the contract.
 
+        By default events are served from the local event index after syncing
+        only the blocks that are new since the last call. With ``use_index=False``
+        the range is fetched with plain eth_getLogs in adaptive, concurrent block
+        chunks (see :class:`LogScanner`), so no filter is installed on the node.
+
         Args:
             from_block: Starting block number
             to_block: Ending block number or 'latest'
+            use_index: Serve events from the local event index
 
         Returns:
             List of event logs
         """
-        event_filter = self.contract.events.MessageUpdated.create_filter(
-            fromBlock=from_block, toBlock=to_block
+        if use_index and (to_block == "latest" or isinstance(to_block, int)):
+            head = self.sync_events()
+            return self.event_index.get_events(
+                self.rpc.chain_id,
+                self.contract.address,
+                "MessageUpdated",
+                from_block,
+                head if to_block == "latest" else to_block,
+            )
+
+        event = self.contract.events.MessageUpdated()
+        logs = self.log_scanner.get_logs(
+            address=self.contract.address,
+            topics=[self.spec.topic("MessageUpdated")],
+            from_block=from_block,
+            to_block=to_block,
+        )
+        return [event.process_log(log) for log in logs]
+
+    def get_recent_events(
+        self, count: int = 5, from_block: int = 0, to_block: Any = "latest"
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the most recent MessageUpdated events without scanning the full history.
+
+        Scans backwards from ``to_block`` in growing block windows and stops
+        as soon as ``count`` events have been found.
+
+        Args:
+            count: Number of events wanted
+            from_block: Lowest block to scan back to
+            to_block: Block number or 'latest' to start scanning back from
+
+        Returns:
+            Up to ``count`` event logs, oldest first
+        """
+        event = self.contract.events.MessageUpdated()
+        logs = self.log_scanner.get_recent_logs(
+            count,
+            address=self.contract.address,
+            topics=[self.spec.topic("MessageUpdated")],
+            from_block=from_block,
+            to_block=to_block,
+        )
+        return [event.process_log(log) for log in logs]
+
+    def watch_events(
+        self,
+        from_block: Optional[int] = None,
+        confirmations: int = 0,
+        ws_url: Optional[str] = None,
+        block_time: float = BASE_BLOCK_TIME,
+        stop_event: Optional[threading.Event] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream MessageUpdated events as new blocks arrive.
+
+        Follows the chain head (websocket newHeads if ``ws_url`` or BASE_WS_RPC is
+        set, adaptive polling otherwise) and only requests the blocks that are
+        new since the previous poll. Events dropped by a reorg are yielded again
+        with ``removed=True``.
+
+        Args:
+            from_block: First block to stream from (default: the next new block)
+            confirmations: Blocks to wait behind the head before emitting events
+            ws_url: Optional websocket RPC URL
+            block_time: Expected seconds between blocks
+            stop_event: Ends the stream once set
+
+        Yields:
+            Decoded event logs, each with a ``removed`` flag
+        """
+        event = self.contract.events.MessageUpdated()
+        watcher = LogWatcher(
+            self.w3,
+            address=self.contract.address,
+            topics=[self.spec.topic("MessageUpdated")],
+            block_time=block_time,
+            confirmations=confirmations,
+            ws_url=ws_url or os.getenv("BASE_WS_RPC"),
+            scanner=self.log_scanner,
+            stop_event=stop_event,
         )
-        return event_filter.get_all_entries()
+        for log in watcher.stream(from_block):
+            yield AttributeDict({**event.process_log(log), "removed": log["removed"]})
 
     def get_balance(self) -> int:
         """
@@ -240,21 +575,58 @@ class HelloBaseClient:
         balance_wei = self.get_balance()
         return self.w3.from_wei(balance_wei, "ether")
 
-    def get_contract_info(self) -> Dict[str, Any]:
+    def get_contract_info(
+        self, block_identifier: Optional[int] = None, batched: bool = True
+    ) -> Dict[str, Any]:
         """
         Get comprehensive contract information.
 
+        By default every read is sent in a single JSON-RPC batch pinned to one
+        block, so the values are consistent with each other and the whole
+        snapshot costs two round trips (block number + batch) instead of five.
+
+        Args:
+            block_identifier: Block number to read at; defaults to the current head
+            batched: Set to False to issue each read as a separate request
+
         Returns:
             Dictionary containing contract information
         """
+        if not batched:
+            return {
+                "contract_address": self.contract_address,
+                "account": self.account.address,
+                "balance_eth": self.get_balance_eth(),
+                "current_message": self.get_message(),
+                "message_length": self.get_message_length(),
+                "owner": self.get_owner(),
+                "is_owner": self.is_owner(self.account.address),
+                "chain_id": self.rpc.chain_id,
+            }
+
+        functions = self.contract.functions
+        # The head and the reads at it from one endpoint: a lagging one of a pool
+        # may not have that block yet
+        with pinned():
+            if block_identifier is None:
+                block_identifier = self.w3.eth.block_number
+
+            batch = RPCBatch(self.w3)
+            batch.add_balance(self.account.address, block_identifier)
+            batch.add_call(functions.getMessage(), block_identifier)
+            batch.add_call(functions.getMessageLength(), block_identifier)
+            batch.add_call(functions.getOwner(), block_identifier)
+            batch.add_call(functions.isOwner(self.account.address), block_identifier)
+            balance_wei, message, length, owner, is_owner = batch.execute()
+
         return {
             "contract_address": self.contract_address,
             "account": self.account.address,
-            "balance_eth": self.get_balance_eth(),
-            "current_message": self.get_message(),
-            "message_length": self.get_message_length(),
-            "owner": self.get_owner(),
-            "is_owner": self.is_owner(self.account.address),
+            "balance_eth": self.w3.from_wei(balance_wei, "ether"),
+            "current_message": message,
+            "message_length": length,
+            "owner": owner,
+            "is_owner": is_owner,
             "chain_id": self.rpc.chain_id,
         }
 
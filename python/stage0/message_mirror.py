@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+HelloBase Message Mirror
+
+Keeps an in-memory copy of a HelloBase contract's message, its length and the
+last updater. The message only changes when ``MessageUpdated`` is emitted, so
+after one seeding round trip the mirror follows those events and serves reads
+locally with no RPC cost.
+
+When a reorg drops an event, or the event stream fails, the mirror re-reads
+the state at the current head and resumes streaming from there. Streaming
+restarts at the synced block itself rather than the one after it, so the
+watcher also knows that block's hash and events: if a reorg then replaces it
+(the tip included), the dropped updates come back as removed and trigger
+another resync instead of staying mirrored.
+
+Author: Base Learning Curriculum
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+from python.common.pool import pinned
+from python.common.watch import BASE_BLOCK_TIME
+from python.stage0.hello_base import HelloBaseClient
+
+
+class MessageMirror:
+    """
+    Event-driven mirror of a HelloBase contract's message state.
+
+    Use as a context manager, or call :meth:`start` and :meth:`stop`. Reads
+    (:meth:`get_message`, :meth:`get_message_length`, ``last_updater``) never
+    touch the network. ``last_updater`` is None until the first event is seen,
+    since it is not stored on-chain.
+    """
+
+    def __init__(
+        self,
+        client: HelloBaseClient,
+        confirmations: int = 0,
+        ws_url: Optional[str] = None,
+        block_time: float = BASE_BLOCK_TIME,
+        on_change: Optional[Callable[["MessageMirror"], Any]] = None,
+    ):
+        """
+        Initialize the mirror.
+
+        Args:
+            client: Client of the contract to mirror
+            confirmations: Blocks to stay behind the head before applying events
+            ws_url: Optional websocket RPC URL for newHeads (default: BASE_WS_RPC)
+            block_time: Expected seconds between blocks
+            on_change: Called with the mirror after every update or resync
+        """
+        self.client = client
+        self.confirmations = confirmations
+        self.ws_url = ws_url
+        self.block_time = block_time
+        self.on_change = on_change
+
+        self.message: Optional[str] = None
+        self.last_updater: Optional[str] = None
+        self.block_number: Optional[int] = None
+        self.updates = 0
+        self.resyncs = 0
+        self.errors = 0
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MessageMirror":
+        """Seed the state with one read and start following events."""
+        if self._thread is None:
+            self._stopped.clear()
+            self.resync()
+            self._thread = threading.Thread(target=self._run, name="hello-base-mirror", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop following events (waits up to ``timeout`` for the stream to end)."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "MessageMirror":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def get_message(self) -> str:
+        """The mirrored message (no RPC)."""
+        with self._lock:
+            if self.message is None:
+                raise RuntimeError("Mirror not started")
+            return self.message
+
+    def get_message_length(self) -> int:
+        """The mirrored message length in bytes, as ``getMessageLength()`` returns it."""
+        return len(self.get_message().encode())
+
+    def resync(self) -> None:
+        """Re-read the message at the current head (less ``confirmations`` blocks)."""
+        # Both reads from one endpoint, at that block number rather than "latest":
+        # the head may move between them
+        with pinned():
+            block = self.client.w3.eth.block_number - self.confirmations
+            message = self.client.contract.functions.getMessage().call(block_identifier=block)
+        with self._lock:
+            self.message = message
+            self.block_number = block
+            self.resyncs += 1
+        self._notify()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._follow()
+            except Exception:
+                # The stream broke, so events may have been missed: wait, then resync
+                self.errors += 1
+                if self._stopped.wait(self.block_time):
+                    return
+                try:
+                    self.resync()
+                except Exception:
+                    continue
+
+    def _follow(self) -> None:
+        """Apply events after the synced block until a reorg forces a resync."""
+        synced = self.block_number
+        for event in self.client.watch_events(
+            from_block=synced,
+            confirmations=self.confirmations,
+            ws_url=self.ws_url,
+            block_time=self.block_time,
+            stop_event=self._stopped,
+        ):
+            if event["removed"]:
+                # A reorg dropped an update we may have applied: start over from the head
+                self.resync()
+                return
+            if event["blockNumber"] <= synced:
+                # Already part of the synced state; only the updater is news
+                with self._lock:
+                    self.last_updater = event["args"]["updater"]
+                continue
+            with self._lock:
+                self.message = event["args"]["newMessage"]
+                self.last_updater = event["args"]["updater"]
+                self.block_number = event["blockNumber"]
+                self.updates += 1
+            self._notify()
+
+    def _notify(self) -> None:
+        if self.on_change is not None:
+            self.on_change(self)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+SimpleStorage Contract Interaction Module
+
+This module provides a read-focused Python interface to the SimpleStorage smart
+contract, including bulk reads of user data through the ReadAggregator.
+
+Author: Base Learning Curriculum
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from web3.contract.contract import ContractFunction
+
+from python.common.abi import get_abi_registry
+from python.common.multicall import read_many
+from python.common.rpc import get_rpc, get_web3
+
+SIMPLE_STORAGE_ABI = [
+    {
+        "inputs": [],
+        "name": "getContractState",
+        "outputs": [
+            {"internalType": "uint256", "name": "data", "type": "uint256"},
+            {"internalType": "string", "name": "stringData", "type": "string"},
+            {"internalType": "address", "name": "contractOwner", "type": "address"},
+            {"internalType": "bool", "name": "locked", "type": "bool"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "_user", "type": "address"}],
+        "name": "getUserData",
+        "outputs": [
+            {"internalType": "string", "name": "name", "type": "string"},
+            {"internalType": "uint256", "name": "age", "type": "uint256"},
+            {"internalType": "bool", "name": "isActive", "type": "bool"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "storedData",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "storedString",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "owner",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "isLocked",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+class SimpleStorageClient:
+    """
+    A read client for the SimpleStorage smart contract.
+
+    Single reads go straight to the contract; bulk reads such as
+    :meth:`get_user_data_many` are packed into one request with :meth:`read_many`.
+    """
+
+    def __init__(self, contract_address: str, abi_path: Optional[str] = None):
+        """
+        Initialize the SimpleStorage client.
+
+        Args:
+            contract_address: The address of the deployed SimpleStorage contract
+            abi_path: Optional path to the contract ABI JSON file
+        """
+        self.rpc = get_rpc()
+        self.w3 = get_web3(self.rpc.url)
+        self.contract_address = contract_address
+
+        abis = get_abi_registry()
+        if abi_path and os.path.exists(abi_path):
+            self.spec = abis.load(abi_path)
+        else:
+            self.spec = abis.spec("SimpleStorage", SIMPLE_STORAGE_ABI)
+        self.abi = self.spec.abi
+
+        self.contract = self.spec.at(self.w3, contract_address)
+
+    def get_contract_state(self) -> Dict[str, Any]:
+        """
+        Get the contract state.
+
+        Returns:
+            Dictionary with stored data, stored string, owner and lock status
+        """
+        data, string_data, owner, locked = self.contract.functions.getContractState().call()
+        return {"data": data, "string_data": string_data, "owner": owner, "locked": locked}
+
+    def get_user_data(self, user: str) -> Dict[str, Any]:
+        """
+        Get the registered data for a user.
+
+        Args:
+            user: The user's address
+
+        Returns:
+            Dictionary with the user's name, age and active flag
+        """
+        name, age, is_active = self.contract.functions.getUserData(user).call()
+        return {"name": name, "age": age, "is_active": is_active}
+
+    def get_user_data_many(self, users: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the registered data for many users in a single request.
+
+        Args:
+            users: User addresses
+
+        Returns:
+            Mapping of user address to the dictionary returned by :meth:`get_user_data`
+        """
+        results = self.read_many([self.contract.functions.getUserData(user) for user in users])
+        return {
+            user: {"name": name, "age": age, "is_active": is_active}
+            for user, (name, age, is_active) in zip(users, results)
+        }
+
+    def read_many(
+        self,
+        calls: Sequence[ContractFunction],
+        allow_failure: bool = False,
+        block_identifier: Any = "latest",
+    ) -> List[Any]:
+        """
+        Execute many view calls in a single request.
+
+        Calls are packed into one ``eth_call`` through the ReadAggregator at
+        ``READ_AGGREGATOR_ADDRESS`` when it is set, otherwise into one JSON-RPC batch.
+
+        Args:
+            calls: Bound contract functions, e.g. ``client.contract.functions.storedData()``
+            allow_failure: Return None for failing calls instead of raising
+            block_identifier: Block number or tag to read at
+
+        Returns:
+            Decoded results, in the same order as ``calls``
+        """
+        return read_many(
+            self.w3, calls, allow_failure=allow_failure, block_identifier=block_identifier
+        )
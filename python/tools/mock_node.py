@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Mock JSON-RPC Node
+
+A small in-process stand-in for a Base JSON-RPC endpoint. It serves a single
+HelloBase contract from memory and can inject a fixed latency per HTTP round
+trip, which makes it useful for benchmarks and offline experiments where a
+real node (or even anvil) is not available.
+
+Signed transactions are accepted too: ``updateMessage`` calls are executed
+when their block is mined, either immediately (like anvil's automine) or on a
+fixed block interval. ``reorg`` replaces recent blocks, dropping their logs and
+the message updates they carried; ``eth_call`` answers for past blocks too.
+
+Author: Base Learning Curriculum
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+import rlp
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_utils import keccak, to_checksum_address
+
+DEFAULT_CONTRACT = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+DEFAULT_ACCOUNT = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+DEFAULT_AGGREGATOR = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+
+AGGREGATE_SIG = "aggregate((address,bool,bytes)[])"
+
+# Priority fee suggested by eth_maxPriorityFeePerGas (and folded into eth_gasPrice)
+SUGGESTED_TIP = 1_000_000
+
+MESSAGE_UPDATED_TOPIC = "0x" + keccak(text="MessageUpdated(string,address)").hex()
+
+
+def _selector(signature: str) -> str:
+    return "0x" + keccak(text=signature)[:4].hex()
+
+
+def _decode_transaction(raw: bytes) -> Dict[str, Any]:
+    """Extract the fields the mock needs from a signed legacy or typed transaction."""
+    priority_fee = None
+    if raw[0] == 0x02:
+        fields = rlp.decode(raw[1:])
+        nonce, priority_fee, gas_price, gas, to, value, data = fields[1:8]
+    elif raw[0] == 0x01:
+        fields = rlp.decode(raw[1:])
+        nonce, gas_price, gas, to, value, data = fields[1:7]
+    else:
+        nonce, gas_price, gas, to, value, data = rlp.decode(raw)[:6]
+    return {
+        "from": Account.recover_transaction(raw),
+        "nonce": int.from_bytes(nonce, "big"),
+        # For type-2 transactions gasPrice holds maxFeePerGas
+        "gasPrice": int.from_bytes(gas_price, "big"),
+        "maxPriorityFeePerGas": (
+            int.from_bytes(priority_fee, "big") if priority_fee is not None else None
+        ),
+        "gas": int.from_bytes(gas, "big"),
+        "to": to_checksum_address(to) if to else None,
+        "value": int.from_bytes(value, "big"),
+        "data": bytes(data),
+        "type": raw[0] if raw[0] < 0x7F else 0,
+    }
+
+
+class MockNode:
+    """
+    An in-memory JSON-RPC node serving one HelloBase contract.
+
+    Use it as a context manager; ``url`` is ready once the block is entered.
+    Every HTTP round trip sleeps for ``latency`` seconds before it is answered,
+    whether it carries a single request or a batch. For failover experiments a
+    share of round trips can be slowed down (``slow_rate``) or answered with
+    HTTP 503 (``error_rate``), and like a public endpoint the node can answer
+    HTTP 429 above ``rate_limit`` round trips per second; all of these can be
+    changed while the node runs.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        chain_id: int = 84532,
+        message: str = "Hello Base Sepolia!",
+        owner: str = DEFAULT_ACCOUNT,
+        contract_address: str = DEFAULT_CONTRACT,
+        aggregator_address: str = DEFAULT_AGGREGATOR,
+        block_number: int = 1,
+        block_time: float = 0.0,
+        base_fee: int = 1_000_000,
+        slow_rate: float = 0.0,
+        slow_latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the mock node.
+
+        Args:
+            latency: Seconds to sleep before answering each HTTP round trip
+            chain_id: Chain id reported by eth_chainId
+            message: Initial HelloBase message
+            owner: HelloBase owner (and the funded account)
+            contract_address: Address the HelloBase contract lives at
+            aggregator_address: Address the ReadAggregator contract lives at
+            block_number: Initial chain head
+            block_time: Seconds between mined blocks; 0 mines every transaction at once
+            base_fee: Base fee per gas of every block, in wei
+            slow_rate: Share of round trips delayed by ``slow_latency`` on top of ``latency``
+            slow_latency: Extra seconds a slowed round trip sleeps
+            error_rate: Share of round trips answered with HTTP 503
+            rate_limit: Round trips per second served before answering HTTP 429
+            seed: Seed for the fault injection, for reproducible runs
+        """
+        self.latency = latency
+        self.chain_id = chain_id
+        self.message = message
+        self._initial_message = message
+        self.owner = to_checksum_address(owner)
+        self.contract_address = to_checksum_address(contract_address)
+        self.aggregator_address = to_checksum_address(aggregator_address)
+        self.block_number = block_number
+        self.balances: Dict[str, int] = {self.owner.lower(): 10**18}
+        self.logs: List[Dict[str, Any]] = []
+        self.genesis_time = int(time.time())
+        self._fork = 0
+        self._fork_start = 0
+        self.block_time = block_time
+        self.base_fee = base_fee
+        self.nonces: Dict[str, int] = {}  # next nonce per sender, pooled txs included
+        self.mempool: List[Dict[str, Any]] = []
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+        self.transactions: Dict[str, Dict[str, Any]] = {}  # every accepted tx by hash
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self._random = random.Random(seed)
+        self._served: List[float] = []  # arrival times within the last second
+
+        self.round_trips = 0
+        self.failures = 0  # round trips answered with HTTP 503
+        self.rate_limited = 0  # round trips answered with HTTP 429
+        self.method_counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._miner: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+        self._calls = {
+            _selector("getMessage()"): self._get_message,
+            _selector("message()"): self._get_message,
+            _selector("getMessageLength()"): self._get_message_length,
+            _selector("getOwner()"): self._get_owner,
+            _selector("owner()"): self._get_owner,
+            _selector("isOwner(address)"): self._is_owner,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """HTTP URL of the running node."""
+        if self._server is None:
+            raise RuntimeError("MockNode is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockNode":
+        """Start serving on a free localhost port in a background thread."""
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:  # noqa: N802 (http.server naming)
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length)
+                status = node._fault()
+                if status is not None:
+                    self.send_response(status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = node.handle(raw)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        if self.block_time:
+            self._stopped.clear()
+            self._miner = threading.Thread(target=self._mine_forever, daemon=True)
+            self._miner.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background server."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockNode":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        """Zero the round-trip and per-method counters."""
+        with self._lock:
+            self.round_trips = 0
+            self.failures = 0
+            self.rate_limited = 0
+            self.method_counts.clear()
+
+    # ------------------------------------------------------------------
+    # Chain state helpers
+    # ------------------------------------------------------------------
+
+    def mine(self, blocks: int = 1) -> int:
+        """Advance the chain head and return the new block number."""
+        with self._lock:
+            self.block_number += blocks
+            return self.block_number
+
+    def emit_message_updated(self, new_message: str, updater: Optional[str] = None) -> None:
+        """Update the message in a new block and record a MessageUpdated log."""
+        updater = to_checksum_address(updater or self.owner)
+        with self._lock:
+            self.block_number += 1
+            tx_hash = "0x" + keccak(text=f"tx:{self.block_number}:{len(self.logs)}").hex()
+            self._update_message(new_message, updater, tx_hash, 0, 0)
+
+    def mine_pending(self) -> int:
+        """Mine every pooled transaction into one new block and return its number."""
+        with self._lock:
+            self.block_number += 1
+            log_index = 0
+            for tx_index, tx in enumerate(self.mempool):
+                receipt = self._execute(tx, tx_index, log_index)
+                log_index += len(receipt["logs"])
+                self.receipts[tx["hash"]] = receipt
+            self.mempool = []
+            return self.block_number
+
+    def _mine_forever(self) -> None:
+        while not self._stopped.wait(self.block_time):
+            self.mine_pending()
+
+    def _intrinsic_gas(self, sender: str, to: Optional[str], data: bytes) -> int:
+        """
+        Gas a call uses; raises ValueError if it reverts.
+
+        updateMessage pays for the event, 20000 per storage word the new message
+        needs beyond the stored one's and 5000 per word it overwrites, so the
+        cost depends on the current message as well as the new one.
+        """
+        gas = 21_000 + 16 * len(data)
+        if to != self.contract_address:
+            return gas
+        if data[:4].hex() != _selector("updateMessage(string)")[2:]:
+            raise ValueError("execution reverted")
+        (new_message,) = decode(["string"], data[4:])
+        if sender.lower() != self.owner.lower():
+            raise ValueError("execution reverted: Only owner can call this function")
+        if not new_message.strip():
+            raise ValueError("execution reverted: Message cannot be empty")
+        words = max(1, -(-len(new_message.encode()) // 32))
+        stored = max(1, -(-len(self.message.encode()) // 32))
+        return gas + 5_000 + 20_000 * max(0, words - stored) + 5_000 * min(words, stored)
+
+    def _update_message(
+        self, new_message: str, updater: str, tx_hash: str, tx_index: int, log_index: int
+    ) -> Dict[str, Any]:
+        self.message = new_message
+        log = {
+            "address": self.contract_address,
+            "topics": [
+                MESSAGE_UPDATED_TOPIC,
+                "0x" + encode(["address"], [updater]).hex(),
+            ],
+            "data": "0x" + encode(["string"], [new_message]).hex(),
+            "blockNumber": hex(self.block_number),
+            "blockHash": self.block_hash(self.block_number),
+            "transactionHash": tx_hash,
+            "transactionIndex": hex(tx_index),
+            "logIndex": hex(log_index),
+            "removed": False,
+        }
+        self.logs.append(log)
+        return log
+
+    def _execute(self, tx: Dict[str, Any], tx_index: int, log_index: int) -> Dict[str, Any]:
+        """Apply a transaction to the current block and build its receipt."""
+        logs = []
+        data = tx["data"]
+        try:
+            gas_used = self._intrinsic_gas(tx["from"], tx["to"], data)
+            reverted = False
+        except ValueError:
+            gas_used, reverted = 21_000 + 16 * len(data), True
+        # Running out of gas reverts and consumes the whole limit
+        status = 0 if reverted or gas_used > tx["gas"] else 1
+        gas_used = min(gas_used, tx["gas"])
+        if status and tx["to"] == self.contract_address:
+            (new_message,) = decode(["string"], data[4:])
+            logs.append(
+                self._update_message(new_message, tx["from"], tx["hash"], tx_index, log_index)
+            )
+        gas_price = tx["gasPrice"]
+        if tx["maxPriorityFeePerGas"] is not None:
+            gas_price = min(gas_price, self.base_fee + tx["maxPriorityFeePerGas"])
+        sender = tx["from"].lower()
+        self.balances[sender] = self.balances.get(sender, 0) - gas_used * gas_price
+        return {
+            "transactionHash": tx["hash"],
+            "transactionIndex": hex(tx_index),
+            "blockNumber": hex(self.block_number),
+            "blockHash": self.block_hash(self.block_number),
+            "from": tx["from"],
+            "to": tx["to"],
+            "cumulativeGasUsed": hex(gas_used),
+            "gasUsed": hex(gas_used),
+            "effectiveGasPrice": hex(gas_price),
+            "contractAddress": None,
+            "logs": logs,
+            "logsBloom": "0x" + "00" * 256,
+            "status": hex(status),
+            "type": hex(tx["type"]),
+        }
+
+    def block_hash(self, number: int) -> str:
+        """Deterministic block hash for a block number on the current fork."""
+        fork = self._fork if number >= self._fork_start else 0
+        return "0x" + keccak(text=f"block:{number}:{fork}").hex()
+
+    def reorg(self, depth: int) -> None:
+        """
+        Replace the last ``depth`` blocks with a new fork of the same height.
+
+        Logs emitted in the replaced blocks are dropped, as they would be when
+        their transactions are not re-included.
+        """
+        with self._lock:
+            start = self.block_number - depth + 1
+            self._fork += 1
+            self._fork_start = start
+            self.logs = [log for log in self.logs if int(log["blockNumber"], 16) < start]
+            self.message = self.message_at(start - 1)
+
+    def message_at(self, number: int) -> str:
+        """The HelloBase message as of a block, replayed from the MessageUpdated logs."""
+        if number >= self.block_number:
+            return self.message
+        message = self._initial_message
+        for log in self.logs:
+            if int(log["blockNumber"], 16) > number:
+                break
+            if log["topics"][0] == MESSAGE_UPDATED_TOPIC:
+                (message,) = decode(["string"], bytes.fromhex(log["data"][2:]))
+        return message
+
+    # ------------------------------------------------------------------
+    # JSON-RPC dispatch
+    # ------------------------------------------------------------------
+
+    def _fault(self) -> Optional[int]:
+        """Apply the slow-down for this round trip; the HTTP error status to answer, if any."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate_limit is not None:
+                self._served = [t for t in self._served if t > now - 1.0]
+                if len(self._served) >= self.rate_limit:
+                    self.rate_limited += 1
+                    return 429
+                self._served.append(now)
+            slow = self.slow_rate and self._random.random() < self.slow_rate
+            fail = self.error_rate and self._random.random() < self.error_rate
+            if fail:
+                self.failures += 1
+        if slow:
+            time.sleep(self.slow_latency)
+        return 503 if fail else None
+
+    def handle(self, raw: bytes) -> bytes:
+        """Answer one HTTP body, which may be a single request or a batch."""
+        if self.latency:
+            time.sleep(self.latency)
+        payload = json.loads(raw)
+        with self._lock:
+            self.round_trips += 1
+        if isinstance(payload, list):
+            return json.dumps([self._dispatch(item) for item in payload]).encode()
+        return json.dumps(self._dispatch(payload)).encode()
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        method = request.get("method", "")
+        params = request.get("params") or []
+        with self._lock:
+            self.method_counts[method] += 1
+        handler = getattr(self, "rpc_" + method, None)
+        if handler is None:
+            error = {"code": -32601, "message": f"the method {method} does not exist"}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        try:
+            result = handler(*params)
+        except ValueError as e:
+            error = {"code": 3, "message": str(e)}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        except LookupError as e:
+            error = {"code": -32000, "message": str(e)}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def rpc_eth_chainId(self) -> str:  # noqa: N802
+        return hex(self.chain_id)
+
+    def rpc_net_version(self) -> str:
+        return str(self.chain_id)
+
+    def rpc_eth_blockNumber(self) -> str:  # noqa: N802
+        return hex(self.block_number)
+
+    def rpc_eth_getBlockByNumber(  # noqa: N802
+        self, block: Any, full_transactions: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        number = self._block_arg(block)
+        if number > self.block_number:
+            return None
+        return {
+            "number": hex(number),
+            "hash": self.block_hash(number),
+            "parentHash": self.block_hash(number - 1) if number else "0x" + "00" * 32,
+            "timestamp": hex(self.genesis_time + 2 * number),
+            "baseFeePerGas": hex(self.base_fee),
+            "gasLimit": hex(30_000_000),
+            "gasUsed": hex(0),
+            "transactions": [],
+        }
+
+    def rpc_eth_getTransactionCount(self, address: str, block: Any = "latest") -> str:  # noqa: N802
+        with self._lock:
+            count = self.nonces.get(address.lower(), 0)
+            if block != "pending":
+                count -= sum(1 for tx in self.mempool if tx["from"].lower() == address.lower())
+        return hex(count)
+
+    def rpc_eth_sendRawTransaction(self, raw: str) -> str:  # noqa: N802
+        data = bytes.fromhex(raw[2:])
+        tx = _decode_transaction(data)
+        tx["hash"] = "0x" + keccak(data).hex()
+        sender = tx["from"].lower()
+        with self._lock:
+            if tx["hash"] in self.receipts or any(p["hash"] == tx["hash"] for p in self.mempool):
+                raise ValueError("already known")
+            expected = self.nonces.get(sender, 0)
+            if tx["nonce"] < expected:
+                raise ValueError(f"nonce too low: next nonce {expected}, tx nonce {tx['nonce']}")
+            if tx["nonce"] > expected:
+                raise ValueError(f"nonce too high: next nonce {expected}, tx nonce {tx['nonce']}")
+            self.nonces[sender] = expected + 1
+            self.mempool.append(tx)
+            self.transactions[tx["hash"]] = tx
+        if not self.block_time:
+            self.mine_pending()
+        return tx["hash"]
+
+    def rpc_eth_estimateGas(self, tx: Dict[str, Any], block: Any = "latest") -> str:  # noqa: N802
+        data = bytes.fromhex((tx.get("data") or tx.get("input") or "0x")[2:])
+        sender = tx.get("from") or self.owner
+        to = to_checksum_address(tx["to"]) if tx.get("to") else None
+        return hex(self._intrinsic_gas(sender, to, data))
+
+    def rpc_eth_getTransactionReceipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:  # noqa: N802
+        return self.receipts.get(tx_hash)
+
+    def rpc_eth_getTransactionByHash(self, tx_hash: str) -> Optional[Dict[str, Any]]:  # noqa: N802
+        tx = self.transactions.get(tx_hash)
+        if tx is None:
+            return None
+        receipt = self.receipts.get(tx_hash) or {}
+        return {
+            "hash": tx["hash"],
+            "nonce": hex(tx["nonce"]),
+            "from": tx["from"],
+            "to": tx["to"],
+            "value": hex(tx["value"]),
+            "gas": hex(tx["gas"]),
+            "gasPrice": hex(tx["gasPrice"]),
+            "input": "0x" + tx["data"].hex(),
+            "blockNumber": receipt.get("blockNumber"),
+            "blockHash": receipt.get("blockHash"),
+            "transactionIndex": receipt.get("transactionIndex"),
+        }
+
+    def rpc_eth_getBalance(self, address: str, block: Any = "latest") -> str:  # noqa: N802
+        return hex(self.balances.get(address.lower(), 0))
+
+    def rpc_eth_gasPrice(self) -> str:  # noqa: N802
+        # Like op-geth: the base fee plus a default suggested tip
+        return hex(self.base_fee + SUGGESTED_TIP)
+
+    def rpc_eth_maxPriorityFeePerGas(self) -> str:  # noqa: N802
+        return hex(SUGGESTED_TIP)
+
+    def rpc_eth_feeHistory(  # noqa: N802
+        self, block_count: Any, newest_block: Any, percentiles: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        count = int(block_count, 16) if isinstance(block_count, str) else int(block_count)
+        newest = self._block_arg(newest_block)
+        oldest = max(0, newest - count + 1)
+        blocks = newest - oldest + 1
+        # Recent tips rise linearly with the percentile, up to the suggested tip
+        reward = [hex(int(SUGGESTED_TIP * p / 100)) for p in percentiles or []]
+        return {
+            "oldestBlock": hex(oldest),
+            "baseFeePerGas": [hex(self.base_fee)] * (blocks + 1),
+            "gasUsedRatio": [0.5] * blocks,
+            "reward": [reward] * blocks,
+        }
+
+    def rpc_eth_getCode(self, address: str, block: Any = "latest") -> str:  # noqa: N802
+        if address.lower() == self.contract_address.lower():
+            return "0x" + keccak(text="HelloBase").hex()
+        return "0x"
+
+    def rpc_eth_call(self, tx: Dict[str, Any], block: Any = "latest") -> str:  # noqa: N802
+        to = (tx.get("to") or "").lower()
+        data = tx.get("data") or tx.get("input") or "0x"
+        number = self._block_arg(block)
+        if number > self.block_number:
+            # Like geth, a node cannot execute at a block it has not reached yet
+            raise LookupError("header not found")
+        if to == self.aggregator_address.lower() and data[:10] == _selector(AGGREGATE_SIG):
+            return "0x" + self._aggregate(bytes.fromhex(data[10:]), number).hex()
+        if to != self.contract_address.lower():
+            return "0x"
+        handler = self._calls.get(data[:10])
+        if handler is None:
+            raise ValueError("execution reverted")
+        return "0x" + handler(bytes.fromhex(data[10:]), number).hex()
+
+    def rpc_eth_getLogs(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:  # noqa: N802
+        from_block = self._block_arg(criteria.get("fromBlock", "latest"))
+        to_block = self._block_arg(criteria.get("toBlock", "latest"))
+        address = criteria.get("address") or []
+        addresses = {a.lower() for a in ([address] if isinstance(address, str) else address)}
+        topics = criteria.get("topics") or []
+        matched = []
+        for log in self.logs:
+            if not from_block <= int(log["blockNumber"], 16) <= to_block:
+                continue
+            if addresses and log["address"].lower() not in addresses:
+                continue
+            if not self._topics_match(log["topics"], topics):
+                continue
+            matched.append(log)
+        return matched
+
+    def _topics_match(self, log_topics: List[str], wanted: List[Any]) -> bool:
+        for position, option in enumerate(wanted):
+            if option is None:
+                continue
+            options = [option] if isinstance(option, str) else option
+            if position >= len(log_topics) or log_topics[position] not in options:
+                return False
+        return True
+
+    def _block_arg(self, block: Any) -> int:
+        if block in ("latest", "safe", "finalized", "pending"):
+            return self.block_number
+        if block == "earliest":
+            return 0
+        return int(block, 16) if isinstance(block, str) else int(block)
+
+    # ------------------------------------------------------------------
+    # ReadAggregator and HelloBase view functions
+    # ------------------------------------------------------------------
+
+    def _aggregate(self, args: bytes, number: int) -> bytes:
+        (calls,) = decode(["(address,bool,bytes)[]"], args)
+        results = []
+        for index, (target, allow_failure, call_data) in enumerate(calls):
+            if target.lower() != self.contract_address.lower():
+                # Like the EVM, a staticcall to an address without code succeeds empty
+                results.append((True, b""))
+                continue
+            handler = self._calls.get("0x" + call_data[:4].hex())
+            if handler is None:
+                if not allow_failure:
+                    raise ValueError(f"execution reverted: CallFailed({index})")
+                results.append((False, b""))
+                continue
+            results.append((True, handler(call_data[4:], number)))
+        return encode(["uint256", "(bool,bytes)[]"], [number, results])
+
+    def _get_message(self, args: bytes, number: int) -> bytes:
+        return encode(["string"], [self.message_at(number)])
+
+    def _get_message_length(self, args: bytes, number: int) -> bytes:
+        return encode(["uint256"], [len(self.message_at(number).encode())])
+
+    def _get_owner(self, args: bytes, number: int) -> bytes:
+        return encode(["address"], [self.owner])
+
+    def _is_owner(self, args: bytes, number: int) -> bytes:
+        (address,) = decode(["address"], args)
+        return encode(["bool"], [address.lower() == self.owner.lower()])
@@ -0,0 +1,29 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import "forge-std/Script.sol";
+import "../contracts/stage0/ReadAggregator.sol";
+
+/**
+ * @title DeployReadAggregator
+ * @dev Deployment script for the ReadAggregator contract
+ * @author Base Learning Curriculum
+ */
+contract DeployReadAggregator is Script {
+    function run() external {
+        uint256 deployerPrivateKey = vm.envUint("PRIVATE_KEY");
+        address deployer = vm.addr(deployerPrivateKey);
+
+        console.log("Deploying contracts with account:", deployer);
+        console.log("Account balance:", deployer.balance);
+
+        vm.startBroadcast(deployerPrivateKey);
+
+        ReadAggregator readAggregator = new ReadAggregator();
+
+        vm.stopBroadcast();
+
+        console.log("ReadAggregator deployed to:", address(readAggregator));
+        console.log("Set READ_AGGREGATOR_ADDRESS to this address in your .env");
+    }
+}
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Async Client Benchmark
+
+Compares AsyncHelloBaseClient with the synchronous HelloBaseClient at 1, 10
+and 100 concurrent callers. Sync callers run in a thread pool sharing one
+client; async callers are tasks on one event loop sharing one pooled session.
+Both run against the in-process mock node, and every result is checked
+against the value the mock node serves.
+
+Usage:
+    poetry run python scripts/bench-async-client.py --latency 0.05 --reads 5
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console
+from rich.table import Table
+
+from python.common.rpc import get_registry
+from python.stage0.async_hello_base import AsyncHelloBaseClient
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import MockNode
+
+# Anvil's first well-known development key; it owns the mock HelloBase contract
+DEV_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+console = Console()
+
+
+def run_sync(client, callers, reads):
+    """Run ``callers`` threads doing ``reads`` get_message() calls each."""
+
+    def caller(_):
+        return [client.get_message() for _ in range(reads)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        results = [msg for batch in pool.map(caller, range(callers)) for msg in batch]
+    return time.perf_counter() - start, results
+
+
+async def run_async(client, callers, reads):
+    """Run ``callers`` tasks doing ``reads`` get_message() calls each."""
+
+    async def caller():
+        return [await client.get_message() for _ in range(reads)]
+
+    start = time.perf_counter()
+    batches = await asyncio.gather(*(caller() for _ in range(callers)))
+    return time.perf_counter() - start, [msg for batch in batches for msg in batch]
+
+
+async def run_all_async(client, levels, reads):
+    timings = {}
+    for callers in levels:
+        timings[callers] = await run_async(client, callers, reads)
+    await get_registry().aclose()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per round trip")
+    parser.add_argument("--reads", type=int, default=5, help="get_message() calls per caller")
+    parser.add_argument("--pool-size", type=int, default=100, help="Shared connection pool size")
+    args = parser.parse_args()
+    levels = (1, 10, 100)
+
+    get_registry().pool_size = args.pool_size
+
+    with MockNode(latency=args.latency) as node:
+        os.environ["BASE_SEPOLIA_RPC"] = node.url
+        os.environ["CHAIN_ID"] = str(node.chain_id)
+        os.environ["PRIVATE_KEY"] = DEV_PRIVATE_KEY
+
+        sync_client = HelloBaseClient(node.contract_address)
+        async_client = AsyncHelloBaseClient(node.contract_address)
+
+        sync_timings = {n: run_sync(sync_client, n, args.reads) for n in levels}
+        async_timings = asyncio.run(run_all_async(async_client, levels, args.reads))
+
+        for callers in levels:
+            for _, results in (sync_timings[callers], async_timings[callers]):
+                assert len(results) == callers * args.reads
+                assert all(msg == node.message for msg in results), "unexpected message"
+
+    table = Table(title=f"get_message() @ {args.latency * 1000:.0f} ms/round trip")
+    table.add_column("Callers", justify="right", style="cyan")
+    table.add_column("Sync wall (s)", justify="right")
+    table.add_column("Async wall (s)", justify="right")
+    table.add_column("Sync calls/s", justify="right")
+    table.add_column("Async calls/s", justify="right", style="green")
+
+    for callers in levels:
+        total = callers * args.reads
+        sync_wall = sync_timings[callers][0]
+        async_wall = async_timings[callers][0]
+        table.add_row(
+            str(callers),
+            f"{sync_wall:.2f}",
+            f"{async_wall:.2f}",
+            f"{total / sync_wall:.0f}",
+            f"{total / async_wall:.0f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+
+Runs each base-cli and hello-base subcommand in a fresh interpreter under
+``-X importtime`` and reports the total import time, wall time and whether
+web3 was loaded. Contract commands run against the mock node so they finish
+quickly. Save a baseline with --save and check later runs against it with
+--compare to catch startup regressions.
+
+Usage:
+    poetry run python scripts/bench-cli-startup.py --runs 5 --save startup.json
+    poetry run python scripts/bench-cli-startup.py --compare startup.json
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from python.tools.mock_node import MockNode
+
+DEV_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+ENTRY_POINTS = {
+    "base-cli": "from python.cli import main as entry",
+    "hello-base": "from python.stage0.cli import cli as entry",
+}
+
+COMMANDS = [
+    ("hello-base", ["--help"]),
+    ("hello-base", ["setup"]),
+    ("hello-base", ["info", "{contract}"]),
+    ("hello-base", ["balance", "{contract}"]),
+    ("base-cli", ["--help"]),
+    ("base-cli", ["version"]),
+    ("base-cli", ["wallet", "status"]),
+    ("base-cli", ["stage0", "info", "{contract}"]),
+]
+
+console = Console()
+
+
+def run_command(entry, args, env):
+    """Run one CLI invocation and return (import seconds, wall seconds, imported modules)."""
+    code = f"import sys; {ENTRY_POINTS[entry]}; sys.exit(entry())"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+
+    import_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        # Top-level imports are not indented; their cumulative times add up to the total
+        if not name[1:].startswith(" "):
+            import_us += int(cumulative)
+    return import_us / 1e6, wall, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--runs", type=int, default=3, help="Runs per command (median is kept)")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed import-time growth vs baseline"
+    )
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = {}
+    with MockNode() as node:
+        env = dict(
+            os.environ,
+            BASE_SEPOLIA_RPC=node.url,
+            CHAIN_ID=str(node.chain_id),
+            PRIVATE_KEY=DEV_PRIVATE_KEY,
+            PYTHONPATH=os.getcwd(),
+        )
+        for entry, template in COMMANDS:
+            command_args = [arg.format(contract=node.contract_address) for arg in template]
+            name = " ".join([entry, *template]).replace("{contract}", "<address>")
+            runs = [run_command(entry, command_args, env) for _ in range(args.runs)]
+            results[name] = {
+                "import_s": statistics.median(r[0] for r in runs),
+                "wall_s": statistics.median(r[1] for r in runs),
+                "web3": "web3" in runs[0][2],
+            }
+
+    table = Table(title=f"CLI startup (median of {args.runs} runs)")
+    table.add_column("Command", style="cyan")
+    table.add_column("Imports (ms)", justify="right", style="green")
+    table.add_column("Wall (ms)", justify="right")
+    table.add_column("web3 loaded", justify="center")
+    if baseline:
+        table.add_column("vs baseline", justify="right")
+
+    regressions = []
+    for name, result in results.items():
+        row = [
+            name,
+            f"{result['import_s'] * 1000:.0f}",
+            f"{result['wall_s'] * 1000:.0f}",
+            "yes" if result["web3"] else "no",
+        ]
+        if baseline:
+            before = baseline.get(name, {}).get("import_s")
+            if before:
+                change = result["import_s"] / before - 1
+                # Ignore sub-20 ms swings; they are process start-up noise
+                if change > args.tolerance and result["import_s"] - before > 0.02:
+                    regressions.append(name)
+                colour = "red" if name in regressions else "green"
+                row.append(f"[{colour}]{change:+.0%}[/]")
+            else:
+                row.append("new")
+        table.add_row(*row)
+    console.print(table)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        console.print(f"Saved results to {args.save}")
+    if regressions:
+        console.print(f"[red]Startup regressions: {', '.join(regressions)}[/red]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
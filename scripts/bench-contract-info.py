@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Contract Info Benchmark
+
+Compares HelloBaseClient.get_contract_info() with and without JSON-RPC
+batching. Runs against the in-process mock node with an injected per-round-trip
+latency, so the numbers model a remote Base endpoint without needing one.
+
+Usage:
+    poetry run python scripts/bench-contract-info.py --latency 0.1 --runs 5
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import MockNode
+
+# Anvil's first well-known development key; it owns the mock HelloBase contract
+DEV_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+console = Console()
+
+
+def measure(node, client, batched, runs):
+    """Return (round trips per call, wall times) for get_contract_info()."""
+    node.reset_stats()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        client.get_contract_info(batched=batched)
+        timings.append(time.perf_counter() - start)
+    return node.round_trips / runs, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per round trip")
+    parser.add_argument("--runs", type=int, default=5, help="Calls per mode")
+    args = parser.parse_args()
+
+    with MockNode(latency=args.latency) as node:
+        os.environ["BASE_SEPOLIA_RPC"] = node.url
+        os.environ["CHAIN_ID"] = str(node.chain_id)
+        os.environ["PRIVATE_KEY"] = DEV_PRIVATE_KEY
+
+        client = HelloBaseClient(node.contract_address)
+        sequential = client.get_contract_info(batched=False)
+        batched = client.get_contract_info()
+        assert sequential == batched, "batched info differs from sequential info"
+
+        table = Table(title=f"get_contract_info() @ {args.latency * 1000:.0f} ms/round trip")
+        table.add_column("Mode", style="cyan")
+        table.add_column("Round trips", justify="right")
+        table.add_column("Median wall (ms)", justify="right", style="green")
+
+        for label, mode in (("sequential", False), ("batched", True)):
+            trips, timings = measure(node, client, mode, args.runs)
+            table.add_row(label, f"{trips:.0f}", f"{statistics.median(timings) * 1000:.1f}")
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
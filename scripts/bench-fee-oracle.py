@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Fee Oracle Benchmark
+
+Sends the same updateMessage transactions two ways through the transaction
+pipeline: legacy, with a fresh eth_gasPrice per transaction, and EIP-1559,
+with fees from the block-cached fee oracle. Reports the fee-related RPC calls
+per transaction and the effective gas price and total fee actually paid,
+taken from the receipts. Runs against the in-process mock node, whose
+eth_gasPrice is the base fee plus op-geth's default suggested tip.
+
+Usage:
+    poetry run python scripts/bench-fee-oracle.py --txs 40 --block-time 0.5 --percentile 50
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import os
+
+from rich.console import Console
+from rich.table import Table
+
+from python.common.fees import FeeOracle
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import MockNode
+
+# Anvil's first well-known development key; it owns the mock HelloBase contract
+DEV_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+FEE_METHODS = ("eth_gasPrice", "eth_feeHistory", "eth_maxPriorityFeePerGas", "eth_getBlockByNumber")
+
+console = Console()
+
+
+def run(node, client, txs, legacy):
+    """Send ``txs`` updates and return (fee RPC calls, receipts)."""
+    node.reset_stats()
+    handles = []
+    for i in range(txs):
+        transaction = client.contract.functions.updateMessage(f"fee {i}").build_transaction(
+            {
+                "from": client.account.address,
+                "gas": 100000,
+                "chainId": client.tx_pipeline.chain_id,
+                **(
+                    {"gasPrice": client.w3.eth.gas_price}
+                    if legacy
+                    else client.tx_pipeline.fees.tx_params()
+                ),
+            }
+        )
+        handles.append(client.tx_pipeline.submit(transaction))
+    receipts = [handle.receipt() for handle in handles]
+    return sum(node.method_counts[m] for m in FEE_METHODS), receipts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--txs", type=int, default=40, help="Transactions per run")
+    parser.add_argument("--block-time", type=float, default=0.5, help="Mock seconds per block")
+    parser.add_argument("--percentile", type=float, default=50, help="Priority fee percentile")
+    args = parser.parse_args()
+
+    with MockNode(block_time=args.block_time) as node:
+        os.environ["BASE_SEPOLIA_RPC"] = node.url
+        os.environ["CHAIN_ID"] = str(node.chain_id)
+        os.environ["PRIVATE_KEY"] = DEV_PRIVATE_KEY
+
+        client = HelloBaseClient(node.contract_address)
+        client.tx_pipeline.fees = FeeOracle(
+            client.w3, percentile=args.percentile, max_age=args.block_time
+        )
+        results = {
+            "Legacy gasPrice": run(node, client, args.txs, legacy=True),
+            f"EIP-1559 oracle (p{args.percentile:g})": run(node, client, args.txs, legacy=False),
+        }
+        client.tx_pipeline.close()
+
+    table = Table(title=f"{args.txs} updateMessage txs @ {args.block_time}s blocks")
+    table.add_column("Fees", style="cyan")
+    table.add_column("Fee RPCs", justify="right")
+    table.add_column("RPCs / tx", justify="right", style="green")
+    table.add_column("Avg effective gas price (wei)", justify="right")
+    table.add_column("Total fee paid (gwei)", justify="right", style="green")
+
+    for name, (calls, receipts) in results.items():
+        effective = sum(r.effectiveGasPrice for r in receipts) / len(receipts)
+        paid = sum(r.effectiveGasPrice * r.gasUsed for r in receipts)
+        table.add_row(
+            name,
+            str(calls),
+            f"{calls / args.txs:.2f}",
+            f"{effective:,.0f}",
+            f"{paid / 1e9:,.2f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
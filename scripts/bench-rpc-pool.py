@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+RPC Endpoint Pool Benchmark
+
+Compares read latency through a single RPC endpoint with an endpoint pool
+(EWMA routing, hedged reads and circuit breakers) over three local mock nodes:
+a fast node with a slow tail, a steady slower node, and a flaky node that
+answers part of its requests with HTTP 503. Halfway through, the fast node
+goes down for a few requests to show failover (a single endpoint pays web3's
+retry back-off for each of them).
+
+Usage:
+    poetry run python scripts/bench-rpc-pool.py --calls 400
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import statistics
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from python.common.rpc import ProviderRegistry
+from python.tools.mock_node import MockNode
+
+console = Console()
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def run(w3, fast, calls, outage):
+    """Return (latencies in ms, failed calls) for ``calls`` sequential reads."""
+    latencies, failed = [], 0
+    for i in range(calls):
+        # The fast node is down for ``outage`` requests in the middle of the run
+        fast.error_rate = 1.0 if calls // 2 <= i < calls // 2 + outage else 0.0
+        start = time.perf_counter()
+        try:
+            w3.eth.block_number
+        except Exception:
+            failed += 1
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--calls", type=int, default=400, help="Sequential reads per setup")
+    parser.add_argument("--outage", type=int, default=10, help="Requests the fast node is down for")
+    parser.add_argument("--no-hedge", action="store_true", help="Disable hedged reads")
+    args = parser.parse_args()
+
+    fast = MockNode(latency=0.01, slow_rate=0.04, slow_latency=0.25, seed=1)
+    steady = MockNode(latency=0.03, seed=2)
+    flaky = MockNode(latency=0.015, error_rate=0.3, seed=3)
+    with fast, steady, flaky:
+        single = ProviderRegistry(timeout=5).get_web3(fast.url)
+        pooled_registry = ProviderRegistry(timeout=5, hedge=not args.no_hedge)
+        pool_url = ",".join(node.url for node in (fast, steady, flaky))
+        pooled = pooled_registry.get_web3(pool_url)
+
+        table = Table(title=f"eth_blockNumber, {args.calls} sequential reads")
+        table.add_column("Setup", style="cyan")
+        table.add_column("p50 (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        table.add_column("p99 (ms)", justify="right")
+        table.add_column("Mean (ms)", justify="right")
+        table.add_column("Failed", justify="right", style="red")
+
+        for name, w3 in (("single endpoint", single), ("endpoint pool", pooled)):
+            latencies, failed = run(w3, fast, args.calls, args.outage)
+            table.add_row(
+                name,
+                f"{percentile(latencies, 0.50):.1f}",
+                f"{percentile(latencies, 0.95):.1f}",
+                f"{percentile(latencies, 0.99):.1f}",
+                f"{statistics.mean(latencies):.1f}",
+                str(failed),
+            )
+        console.print(table)
+
+        endpoints = Table(title="Pool endpoints")
+        endpoints.add_column("Node", style="cyan")
+        endpoints.add_column("Breaker")
+        endpoints.add_column("EWMA (ms)", justify="right")
+        endpoints.add_column("p95 (ms)", justify="right")
+        endpoints.add_column("Requests", justify="right")
+        endpoints.add_column("Errors", justify="right")
+        endpoints.add_column("Hedges", justify="right")
+        endpoints.add_column("Hedge wins", justify="right", style="green")
+        names = {fast.url: "fast, slow tail", steady.url: "steady", flaky.url: "flaky"}
+        for stats in pooled_registry.pool(pool_url).stats():
+            endpoints.add_row(
+                names[stats["url"]],
+                stats["state"],
+                "-" if stats["latency_ms"] is None else f"{stats['latency_ms']:.1f}",
+                "-" if stats["p95_ms"] is None else f"{stats['p95_ms']:.1f}",
+                str(stats["requests"]),
+                str(stats["errors"]),
+                str(stats["hedges"]),
+                str(stats["hedge_wins"]),
+            )
+        console.print(endpoints)
+        pooled_registry.clear()
+
+
+if __name__ == "__main__":
+    main()
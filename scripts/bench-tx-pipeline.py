@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Transaction Pipeline Benchmark
+
+Measures updateMessage throughput in tx/s two ways: the one-at-a-time flow
+(fetch gas price and nonce, send, wait for the receipt, repeat) and the
+pipelined flow (local nonces, submit everything back to back, then let the
+batched receipt tracker confirm them all). Runs against the in-process mock
+node mining on a fixed block interval, or against a local dev chain such as
+anvil with --rpc-url.
+
+Usage:
+    poetry run python scripts/bench-tx-pipeline.py --txs 50 --block-time 0.5
+    anvil --block-time 1 &
+    poetry run python scripts/bench-tx-pipeline.py --rpc-url http://127.0.0.1:8545 \\
+        --contract <HELLO_BASE_ADDRESS>
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import MockNode
+
+# Anvil's first well-known development key; it owns the mock HelloBase contract
+DEV_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+console = Console()
+
+
+def send_sequential(client, messages):
+    """The classic flow: one transaction per round of gas price, nonce, send and wait."""
+    start = time.perf_counter()
+    for message in messages:
+        transaction = client.contract.functions.updateMessage(message).build_transaction(
+            {
+                "from": client.account.address,
+                "gas": 100000,
+                "gasPrice": client.w3.eth.gas_price,
+                "nonce": client.w3.eth.get_transaction_count(client.account.address),
+            }
+        )
+        signed = client.account.sign_transaction(transaction)
+        tx_hash = client.w3.eth.send_raw_transaction(signed.rawTransaction)
+        receipt = client.w3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=0.1)
+        assert receipt.status == 1
+    return time.perf_counter() - start
+
+
+def send_pipelined(client, messages):
+    """Submit every transaction back to back, then wait for all receipts."""
+    start = time.perf_counter()
+    handles = [client.submit_update_message(message) for message in messages]
+    submitted = time.perf_counter() - start
+    for handle in handles:
+        handle.receipt()
+    return time.perf_counter() - start, submitted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--txs", type=int, default=50, help="Transactions per run")
+    parser.add_argument("--latency", type=float, default=0.01, help="Mock seconds per round trip")
+    parser.add_argument("--block-time", type=float, default=0.5, help="Mock seconds per block")
+    parser.add_argument("--rpc-url", help="Use a local dev chain instead of the mock node")
+    parser.add_argument("--contract", help="HelloBase address on the dev chain")
+    args = parser.parse_args()
+
+    if args.rpc_url and not args.contract:
+        parser.error("--contract is required with --rpc-url")
+
+    node = None
+    with contextlib.ExitStack() as stack:
+        if args.rpc_url:
+            url, contract, target = args.rpc_url, args.contract, args.rpc_url
+        else:
+            node = stack.enter_context(MockNode(latency=args.latency, block_time=args.block_time))
+            url, contract = node.url, node.contract_address
+            target = f"mock node ({args.block_time}s blocks, {args.latency * 1000:.0f} ms RTT)"
+
+        os.environ["BASE_SEPOLIA_RPC"] = url
+        os.environ.pop("CHAIN_ID", None)
+        os.environ.setdefault("PRIVATE_KEY", DEV_PRIVATE_KEY)
+
+        client = HelloBaseClient(contract)
+        round_trips = {}
+
+        node and node.reset_stats()
+        sequential_wall = send_sequential(client, [f"seq {i}" for i in range(args.txs)])
+        round_trips["sequential"] = node.round_trips if node else None
+
+        node and node.reset_stats()
+        pipelined_wall, submit_wall = send_pipelined(client, [f"pipe {i}" for i in range(args.txs)])
+        round_trips["pipelined"] = node.round_trips if node else None
+
+        assert client.get_message() == f"pipe {args.txs - 1}"
+        client.tx_pipeline.close()
+
+    table = Table(title=f"{args.txs} updateMessage txs @ {target}")
+    table.add_column("Mode", style="cyan")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("Submit (s)", justify="right")
+    table.add_column("Round trips", justify="right")
+    table.add_column("tx/s", justify="right", style="green")
+    table.add_row(
+        "Sequential",
+        f"{sequential_wall:.2f}",
+        "-",
+        str(round_trips["sequential"] or "-"),
+        f"{args.txs / sequential_wall:.1f}",
+    )
+    table.add_row(
+        "Pipelined",
+        f"{pipelined_wall:.2f}",
+        f"{submit_wall:.2f}",
+        str(round_trips["pipelined"] or "-"),
+        f"{args.txs / pipelined_wall:.1f}",
+    )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
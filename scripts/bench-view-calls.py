@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+View Call Fast-Path Benchmark
+
+Compares the client-side CPU time of HelloBaseClient view calls through the
+web3 contract stack with the opt-in raw-codec fast path (``fast_calls=True``).
+Runs against the in-process mock node with no injected latency; the CPU time
+is measured on the calling thread only, so the node's own work is excluded.
+
+Usage:
+    poetry run python scripts/bench-view-calls.py --calls 2000
+
+Author: Base Learning Curriculum
+"""
+
+import argparse
+import os
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import MockNode
+
+console = Console()
+
+
+def measure(node, client, method, args, calls):
+    """Return (CPU µs per call, wall µs per call, round trips per call) for one method."""
+    call = getattr(client, method)
+    call(*args)  # warm up lazy connections and caches
+    node.reset_stats()
+    cpu_start, wall_start = time.thread_time(), time.perf_counter()
+    for _ in range(calls):
+        call(*args)
+    cpu = time.thread_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return cpu / calls * 1e6, wall / calls * 1e6, node.round_trips / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--calls", type=int, default=2000, help="Calls per method and path")
+    args = parser.parse_args()
+
+    with MockNode() as node:
+        os.environ["BASE_SEPOLIA_RPC"] = node.url
+        os.environ["CHAIN_ID"] = str(node.chain_id)
+
+        standard = HelloBaseClient(node.contract_address)
+        fast = HelloBaseClient(node.contract_address, fast_calls=True)
+        owner = standard.get_owner()
+        methods = [
+            ("get_message", ()),
+            ("get_owner", ()),
+            ("get_message_length", ()),
+            ("is_owner", (owner,)),
+        ]
+        for method, method_args in methods:
+            expected = getattr(standard, method)(*method_args)
+            assert getattr(fast, method)(*method_args) == expected, f"{method} results differ"
+
+        table = Table(title=f"View calls, client CPU per call ({args.calls} calls each)")
+        table.add_column("Method", style="cyan")
+        table.add_column("web3 CPU (µs)", justify="right")
+        table.add_column("Fast CPU (µs)", justify="right", style="green")
+        table.add_column("CPU saved", justify="right", style="green")
+        table.add_column("web3 wall (µs)", justify="right")
+        table.add_column("Fast wall (µs)", justify="right")
+
+        for method, method_args in methods:
+            cpu, wall, trips = measure(node, standard, method, method_args, args.calls)
+            fast_cpu, fast_wall, fast_trips = measure(node, fast, method, method_args, args.calls)
+            table.add_row(
+                method,
+                f"{cpu:.0f}",
+                f"{fast_cpu:.0f}",
+                f"{1 - fast_cpu / cpu:.0%}",
+                f"{wall:.0f}",
+                f"{fast_wall:.0f}",
+            )
+            assert trips == fast_trips == 1, "expected exactly one round trip per call"
+
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,8 @@ import sys
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from web3 import Web3
+
+from python.common.rpc import get_web3
 
 console = Console()
 
@@ -45,7 +46,7 @@ def check_network_connection():
 
     try:
         rpc_url = os.getenv("BASE_SEPOLIA_RPC", "https://sepolia.base.org")
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        w3 = get_web3(rpc_url)
 
         if w3.is_connected():
             chain_id = w3.eth.chain_id
@@ -78,7 +79,7 @@ def check_wallet_balance():
         from python.common.wallet import load_account
 
         rpc = get_rpc()
-        w3 = Web3(Web3.HTTPProvider(rpc.url))
+        w3 = get_web3(rpc.url)
         account = load_account()
 
         balance_wei = w3.eth.get_balance(account.address)
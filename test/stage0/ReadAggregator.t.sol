@@ -0,0 +1,117 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import "forge-std/Test.sol";
+import "../../contracts/stage0/HelloBase.sol";
+import "../../contracts/stage0/ReadAggregator.sol";
+import "../../contracts/stage0/SimpleStorage.sol";
+
+/**
+ * @title ReadAggregatorTest
+ * @dev Tests for the ReadAggregator contract against the Stage 0 contracts
+ * @author Base Learning Curriculum
+ */
+contract ReadAggregatorTest is Test {
+    ReadAggregator public aggregator;
+    HelloBase public helloBase;
+    SimpleStorage public simpleStorage;
+    address public owner = address(1);
+    address public user = address(2);
+
+    function setUp() public {
+        aggregator = new ReadAggregator();
+
+        vm.startPrank(owner);
+        helloBase = new HelloBase("Initial Message");
+        simpleStorage = new SimpleStorage();
+        vm.stopPrank();
+
+        vm.prank(user);
+        simpleStorage.registerUser("Alice", 30);
+    }
+
+    function testAggregateHelloBaseReads() public {
+        ReadAggregator.Call[] memory calls = new ReadAggregator.Call[](3);
+        calls[0] = ReadAggregator.Call(
+            address(helloBase), false, abi.encodeCall(HelloBase.getMessage, ())
+        );
+        calls[1] = ReadAggregator.Call(
+            address(helloBase), false, abi.encodeCall(HelloBase.getMessageLength, ())
+        );
+        calls[2] = ReadAggregator.Call(
+            address(helloBase), false, abi.encodeCall(HelloBase.isOwner, (owner))
+        );
+
+        (uint256 blockNumber, ReadAggregator.Result[] memory results) = aggregator.aggregate(calls);
+
+        assertEq(blockNumber, block.number);
+        assertEq(results.length, 3);
+        assertEq(abi.decode(results[0].returnData, (string)), "Initial Message");
+        assertEq(abi.decode(results[1].returnData, (uint256)), 15);
+        assertTrue(abi.decode(results[2].returnData, (bool)));
+    }
+
+    function testAggregateSimpleStorageReads() public {
+        ReadAggregator.Call[] memory calls = new ReadAggregator.Call[](2);
+        calls[0] = ReadAggregator.Call(
+            address(simpleStorage), false, abi.encodeCall(SimpleStorage.getContractState, ())
+        );
+        calls[1] = ReadAggregator.Call(
+            address(simpleStorage), false, abi.encodeCall(SimpleStorage.getUserData, (user))
+        );
+
+        (, ReadAggregator.Result[] memory results) = aggregator.aggregate(calls);
+
+        (uint256 data, string memory stringData, address contractOwner, bool locked) =
+            abi.decode(results[0].returnData, (uint256, string, address, bool));
+        assertEq(data, 0);
+        assertEq(stringData, "Initial String");
+        assertEq(contractOwner, owner);
+        assertFalse(locked);
+
+        (string memory name, uint256 age, bool isActive) =
+            abi.decode(results[1].returnData, (string, uint256, bool));
+        assertEq(name, "Alice");
+        assertEq(age, 30);
+        assertTrue(isActive);
+    }
+
+    function testAllowFailure() public {
+        ReadAggregator.Call[] memory calls = new ReadAggregator.Call[](2);
+        calls[0] = ReadAggregator.Call(address(helloBase), true, hex"deadbeef");
+        calls[1] = ReadAggregator.Call(
+            address(helloBase), true, abi.encodeCall(HelloBase.getOwner, ())
+        );
+
+        (, ReadAggregator.Result[] memory results) = aggregator.aggregate(calls);
+
+        assertFalse(results[0].success);
+        assertTrue(results[1].success);
+        assertEq(abi.decode(results[1].returnData, (address)), owner);
+    }
+
+    function testRequiredCallFailureReverts() public {
+        ReadAggregator.Call[] memory calls = new ReadAggregator.Call[](2);
+        calls[0] = ReadAggregator.Call(
+            address(helloBase), false, abi.encodeCall(HelloBase.getOwner, ())
+        );
+        calls[1] = ReadAggregator.Call(address(helloBase), false, hex"deadbeef");
+
+        vm.expectRevert(abi.encodeWithSelector(ReadAggregator.CallFailed.selector, 1));
+        aggregator.aggregate(calls);
+    }
+
+    function testEmptyAggregate() public {
+        ReadAggregator.Call[] memory calls = new ReadAggregator.Call[](0);
+
+        (uint256 blockNumber, ReadAggregator.Result[] memory results) = aggregator.aggregate(calls);
+
+        assertEq(blockNumber, block.number);
+        assertEq(results.length, 0);
+    }
+
+    function testGetBlockNumber() public {
+        vm.roll(12345);
+        assertEq(aggregator.getBlockNumber(), 12345);
+    }
+}
@@ -0,0 +1,39 @@
+"""
+Shared fixtures: an in-process MockNode and an environment pointing the
+clients at it, with caches kept out of the user's home directory.
+"""
+
+import pytest
+from eth_account import Account
+
+from python.common.rpc import get_registry
+from python.tools.mock_node import MockNode
+
+# Anvil's first development key; it owns the mock node's HelloBase contract
+OWNER_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+@pytest.fixture
+def node():
+    with MockNode() as node:
+        yield node
+
+
+@pytest.fixture
+def owner():
+    """The contract owner's local account."""
+    return Account.from_key(OWNER_KEY)
+
+
+@pytest.fixture
+def env(node, monkeypatch, tmp_path):
+    """Configure BASE_SEPOLIA_RPC, CHAIN_ID and PRIVATE_KEY for ``node``."""
+    monkeypatch.setenv("BASE_SEPOLIA_RPC", node.url)
+    monkeypatch.setenv("CHAIN_ID", str(node.chain_id))
+    monkeypatch.setenv("PRIVATE_KEY", OWNER_KEY)
+    monkeypatch.setenv("BASE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("CHAIN_ID_TTL", "0")
+    for name in ("BASE_MAINNET_RPC", "KEYSTORE_PATH", "READ_AGGREGATOR_ADDRESS"):
+        monkeypatch.delenv(name, raising=False)
+    yield node
+    get_registry().clear()
@@ -0,0 +1,67 @@
+"""AsyncHelloBaseClient against the mock node."""
+
+import asyncio
+
+from python.common.logs import AsyncLogScanner
+from python.common.rpc import get_registry
+from python.stage0.async_hello_base import AsyncHelloBaseClient
+from python.tools.mock_node import DEFAULT_ACCOUNT, DEFAULT_CONTRACT
+
+
+def run(coro):
+    """Run a coroutine on a fresh event loop, closing the loop's shared session after."""
+
+    async def main():
+        try:
+            return await coro
+        finally:
+            await get_registry().aclose()
+
+    return asyncio.run(main())
+
+
+def test_account_is_loaded_lazily(env, monkeypatch):
+    monkeypatch.delenv("PRIVATE_KEY")
+
+    async def read():
+        client = AsyncHelloBaseClient(DEFAULT_CONTRACT)
+        return await client.get_message()
+
+    assert run(read()) == "Hello Base Sepolia!"
+
+
+def test_contract_info(env):
+    async def info():
+        return await AsyncHelloBaseClient(DEFAULT_CONTRACT).get_contract_info()
+
+    info = run(info())
+    assert info["current_message"] == "Hello Base Sepolia!"
+    assert info["owner"] == DEFAULT_ACCOUNT
+    assert info["is_owner"] is True
+
+
+def test_read_many_is_one_round_trip(env):
+    async def read():
+        client = AsyncHelloBaseClient(DEFAULT_CONTRACT)
+        functions = client.contract.functions
+        await client.get_rpc()
+        env.reset_stats()
+        return await client.read_many([functions.getMessage(), functions.getMessageLength()])
+
+    assert run(read()) == ["Hello Base Sepolia!", len("Hello Base Sepolia!")]
+    assert env.round_trips == 1
+
+
+def test_get_events_scans_in_chunks(env):
+    env.emit_message_updated("first")
+    env.mine(25)
+    env.emit_message_updated("second")
+
+    async def events():
+        client = AsyncHelloBaseClient(DEFAULT_CONTRACT)
+        client._log_scanner = AsyncLogScanner(client.w3, chunk_size=4, max_chunk_size=4)
+        return await client.get_events()
+
+    events = run(events())
+    assert [e["args"]["newMessage"] for e in events] == ["first", "second"]
+    assert env.method_counts["eth_getLogs"] >= 7
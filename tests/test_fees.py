@@ -0,0 +1,56 @@
+"""FeeOracle caching against the mock node."""
+
+import threading
+
+from python.common.fees import FeeOracle
+from python.common.rpc import get_web3
+from python.common.tx import TxPipeline
+
+TRANSFER = {"to": "0x70997970C51812dc3A010C7d01b50e0d17dc79C8", "value": 1, "gas": 21_000}
+
+
+def test_quote_is_reused_within_a_block(env):
+    oracle = FeeOracle(get_web3(), percentile=50, max_age=60)
+
+    first = oracle.quote()
+    oracle.observe_block(first.block_number)
+
+    assert oracle.quote() is first
+    assert oracle.fetches == 1
+    assert first.block_number == env.block_number
+
+
+def test_newer_block_refetches_before_max_age(env):
+    oracle = FeeOracle(get_web3(), percentile=50, max_age=60)
+    oracle.quote()
+
+    env.mine()
+    oracle.observe_block(env.block_number)
+
+    assert oracle.quote().block_number == env.block_number
+    assert oracle.fetches == 2
+
+
+def test_max_age_caps_reuse_without_observed_blocks(env):
+    oracle = FeeOracle(get_web3(), percentile=50, max_age=0)
+
+    oracle.quote()
+    oracle.quote()
+
+    assert oracle.fetches == 2
+
+
+def test_mined_receipts_advance_the_oracle(env, owner):
+    oracle = FeeOracle(get_web3(), percentile=50, max_age=60)
+    with TxPipeline(get_web3(), owner, chain_id=env.chain_id, fees=oracle) as pipeline:
+        first = oracle.quote()
+        handle = pipeline.submit(TRANSFER)
+        # Callbacks run in order, so this one runs after the oracle was told
+        observed = threading.Event()
+        handle.add_done_callback(lambda _: observed.set())
+        receipt = handle.receipt(timeout=10)
+        assert observed.wait(10)
+
+    assert receipt.blockNumber > first.block_number
+    assert oracle.quote().block_number == receipt.blockNumber
+    assert oracle.fetches == 2
@@ -0,0 +1,58 @@
+"""Memoized gas estimates against the mock node."""
+
+import asyncio
+
+from python.common.rpc import get_registry
+from python.stage0.async_hello_base import AsyncHelloBaseClient
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import DEFAULT_CONTRACT
+
+LONG = "x" * 64  # two storage words; the same calldata bucket for any 33-64 bytes
+
+
+def test_estimates_are_memoized(env):
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    client.update_message("first")
+    env.reset_stats()
+
+    client.update_message("second")
+
+    assert env.method_counts["eth_estimateGas"] == 0
+
+
+def test_out_of_gas_re_estimates(env):
+    env.message = LONG
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    # Memoized while the stored message already has two words: overwrites only
+    client.update_message("y" * 64)
+    client.update_message("short")
+    env.reset_stats()
+
+    # Now the second word is new storage, which the memoized limit does not cover
+    client.update_message("z" * 64)
+
+    assert client.get_message() == "z" * 64
+    assert env.method_counts["eth_sendRawTransaction"] == 2
+    assert env.method_counts["eth_estimateGas"] == 1
+    # The fresh, larger estimate is memoized for the next update of that size
+    env.reset_stats()
+    client.update_message(LONG)
+    assert env.method_counts["eth_estimateGas"] == 0
+
+
+def test_async_out_of_gas_re_estimates(env):
+    env.message = LONG
+
+    async def update():
+        client = AsyncHelloBaseClient(DEFAULT_CONTRACT)
+        try:
+            await client.update_message("y" * 64)
+            await client.update_message("short")
+            env.reset_stats()
+            await client.update_message("z" * 64)
+            return await client.get_message()
+        finally:
+            await get_registry().aclose()
+
+    assert asyncio.run(update()) == "z" * 64
+    assert env.method_counts["eth_sendRawTransaction"] == 2
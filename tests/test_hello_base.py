@@ -0,0 +1,61 @@
+"""HelloBaseClient against the mock node."""
+
+import pytest
+
+from python.common.batch import EmptyReturnData
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import DEFAULT_ACCOUNT, DEFAULT_AGGREGATOR, DEFAULT_CONTRACT
+
+
+def test_contract_info_is_one_batch(env):
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    env.reset_stats()
+
+    info = client.get_contract_info()
+
+    assert info["current_message"] == "Hello Base Sepolia!"
+    assert info["message_length"] == len("Hello Base Sepolia!")
+    assert info["owner"] == DEFAULT_ACCOUNT
+    assert info["is_owner"] is True
+    assert info["chain_id"] == env.chain_id
+    # eth_blockNumber, then one batch (plus eth_chainId for the lazy chain check)
+    assert env.method_counts["eth_call"] == 4
+    assert env.round_trips <= 3
+
+
+def test_update_message_emits_event(env):
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+
+    client.update_message("Hello from the tests")
+
+    assert client.get_message() == "Hello from the tests"
+    events = client.get_events(use_index=False)
+    assert [e["args"]["newMessage"] for e in events] == ["Hello from the tests"]
+
+
+def test_read_many_batch_and_aggregator(env, monkeypatch):
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    functions = client.contract.functions
+    calls = [functions.getMessage(), functions.getOwner(), functions.isOwner(DEFAULT_ACCOUNT)]
+
+    expected = ["Hello Base Sepolia!", DEFAULT_ACCOUNT, True]
+    assert client.read_many(calls) == expected
+
+    monkeypatch.setenv("READ_AGGREGATOR_ADDRESS", DEFAULT_AGGREGATOR)
+    env.reset_stats()
+    assert client.read_many(calls) == expected
+    assert env.method_counts["eth_call"] == 1
+
+
+@pytest.mark.parametrize("aggregator", [None, DEFAULT_AGGREGATOR])
+def test_read_many_without_code_at_target(env, monkeypatch, aggregator):
+    if aggregator:
+        monkeypatch.setenv("READ_AGGREGATOR_ADDRESS", aggregator)
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    # The same ABI bound to an address with no contract deployed
+    missing = client.w3.eth.contract(address=DEFAULT_ACCOUNT, abi=client.contract.abi)
+    calls = [client.contract.functions.getMessage(), missing.functions.getMessage()]
+
+    with pytest.raises(EmptyReturnData, match="getMessage"):
+        client.read_many(calls)
+    assert client.read_many(calls, allow_failure=True) == ["Hello Base Sepolia!", None]
@@ -0,0 +1,68 @@
+"""Tests for the unlock agent's socket safety checks."""
+
+import os
+import threading
+
+import pytest
+
+from python.common import keyagent
+
+pytestmark = pytest.mark.skipif(not keyagent.agent_available(), reason="needs Unix sockets")
+
+KEY = "0x" + "11" * 32
+ADDRESS = "0x" + "ab" * 20
+
+
+@pytest.fixture
+def sock(tmp_path, monkeypatch):
+    path = tmp_path / "agent" / "key-agent.sock"
+    monkeypatch.setenv("KEY_AGENT_SOCK", str(path))
+    return path
+
+
+def test_agent_round_trip_in_a_private_directory(sock):
+    agent = threading.Thread(target=keyagent.serve, daemon=True)
+    agent.start()
+    try:
+        for _ in range(100):
+            if keyagent._request({"op": "add", "address": ADDRESS, "key": KEY, "ttl": 60}):
+                break
+            agent.join(0.05)
+        assert keyagent.fetch_key(ADDRESS.upper()[2:]) == KEY
+        assert oct(sock.parent.stat().st_mode & 0o777) == "0o700"
+    finally:
+        assert keyagent.stop_agent()
+        agent.join(5)
+    assert not sock.exists()
+
+
+def test_refuses_a_directory_open_to_others(sock):
+    sock.parent.mkdir(mode=0o755)
+    os.chmod(sock.parent, 0o755)
+
+    with pytest.raises(RuntimeError, match="mode 755"):
+        keyagent.serve()
+    # Not ours to fix up
+    assert sock.parent.stat().st_mode & 0o777 == 0o755
+
+
+def test_refuses_a_symlinked_directory(sock, tmp_path):
+    target = tmp_path / "elsewhere"
+    target.mkdir(mode=0o700)
+    sock.parent.symlink_to(target)
+
+    with pytest.raises(RuntimeError, match="not a directory"):
+        keyagent.serve()
+
+
+def test_client_refuses_a_socket_it_cannot_trust(sock):
+    sock.parent.mkdir(mode=0o700)
+    sock.symlink_to("/dev/null")
+
+    with pytest.raises(RuntimeError, match="not a socket"):
+        keyagent.fetch_key(ADDRESS)
+
+
+def test_no_agent_means_no_key(sock):
+    assert keyagent.fetch_key(ADDRESS) is None
+    assert keyagent.agent_status() is None
@@ -0,0 +1,71 @@
+"""Chunked getLogs scanning against the mock node."""
+
+import pytest
+
+from python.common.logs import LogScanner, is_range_error
+from python.common.rpc import get_web3
+from python.tools.mock_node import DEFAULT_CONTRACT
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "query returned more than 10000 results",
+        "Log response size exceeded. You can make eth_getLogs requests with up to a 2K block range",
+        "eth_getLogs is limited to a 10,000 range",
+        "exceed maximum block range: 50000",
+    ],
+)
+def test_range_errors_split(message):
+    assert is_range_error(ValueError({"code": -32005, "message": message}))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "rate limit exceeded",
+        "daily request count exceeded, request rate limited",
+        "Your app has exceeded its compute units per second capacity",
+        "execution reverted",
+    ],
+)
+def test_other_errors_do_not_split(message):
+    assert not is_range_error(ValueError({"code": -32005, "message": message}))
+
+
+def _limit_range(node, max_blocks, message):
+    """Make the node reject getLogs ranges wider than ``max_blocks`` with ``message``."""
+    get_logs = node.rpc_eth_getLogs
+
+    def limited(criteria):
+        span = node._block_arg(criteria["toBlock"]) - node._block_arg(criteria["fromBlock"])
+        if span >= max_blocks:
+            raise ValueError(message)
+        return get_logs(criteria)
+
+    node.rpc_eth_getLogs = limited
+
+
+def test_scanner_splits_rejected_ranges(env):
+    for i in range(3):
+        env.emit_message_updated(f"message {i}")
+        env.mine(40)
+    _limit_range(env, 16, "block range is too wide")
+    scanner = LogScanner(get_web3(), chunk_size=128)
+
+    logs = scanner.get_logs(address=DEFAULT_CONTRACT, from_block=0)
+
+    assert len(logs) == 3
+    assert scanner.chunk_size <= 16
+
+
+def test_scanner_does_not_split_on_rate_limits(env):
+    env.mine(100)
+    _limit_range(env, 0, "rate limit exceeded")
+    scanner = LogScanner(get_web3(), chunk_size=128, max_workers=1)
+    env.reset_stats()
+
+    with pytest.raises(ValueError):
+        scanner.get_logs(address=DEFAULT_CONTRACT, from_block=0)
+
+    assert env.method_counts["eth_getLogs"] == 1
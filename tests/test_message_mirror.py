@@ -0,0 +1,77 @@
+"""MessageMirror against the mock node, reorgs included."""
+
+import time
+
+import pytest
+
+from python.stage0.hello_base import HelloBaseClient
+from python.stage0.message_mirror import MessageMirror
+from python.tools.mock_node import DEFAULT_CONTRACT
+
+INITIAL = "Hello Base Sepolia!"
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def mirror(env):
+    mirror = MessageMirror(HelloBaseClient(DEFAULT_CONTRACT), block_time=0.05)
+    yield mirror
+    mirror.stop(5)
+
+
+def polled(node):
+    """Wait until the watcher has looked at the node once more."""
+    seen = node.method_counts["eth_getLogs"]
+    wait_for(lambda: node.method_counts["eth_getLogs"] > seen)
+
+
+def test_follows_updates(env, mirror):
+    mirror.start()
+    env.emit_message_updated("one")
+    wait_for(lambda: mirror.get_message() == "one")
+
+    assert mirror.get_message_length() == 3
+    assert mirror.last_updater == env.owner
+    assert mirror.updates == 1
+
+
+def test_tip_reorg_drops_a_mirrored_update(env, mirror):
+    mirror.start()
+    env.emit_message_updated("orphaned")
+    wait_for(lambda: mirror.get_message() == "orphaned")
+
+    # The tip is replaced by a sibling without the update; the height stays the same
+    env.reorg(1)
+    wait_for(lambda: mirror.get_message() == INITIAL)
+    assert mirror.resyncs == 2
+
+
+def test_reorg_of_the_synced_block(env, mirror):
+    env.emit_message_updated("orphaned")
+    mirror.start()
+    assert mirror.get_message() == "orphaned"
+    polled(env)
+
+    env.reorg(1)
+    wait_for(lambda: mirror.get_message() == INITIAL)
+
+
+def test_resync_reads_at_the_block_it_reports(env, mirror):
+    block_number = env.rpc_eth_blockNumber
+
+    def head_moves_on():
+        head = block_number()
+        env.emit_message_updated("newer")
+        return head
+
+    env.rpc_eth_blockNumber = head_moves_on
+    mirror.resync()
+
+    assert (mirror.block_number, mirror.get_message()) == (1, INITIAL)
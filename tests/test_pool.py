@@ -0,0 +1,261 @@
+"""EndpointPool hedging, circuit breakers and pinning against mock nodes."""
+
+import asyncio
+import itertools
+import json
+import time
+
+import pytest
+import requests
+
+from python.common.event_index import EventIndex
+from python.common.logs import AsyncLogScanner, LogScanner
+from python.common.pool import EndpointPool, pinned
+from python.common.rpc import get_registry
+from python.stage0.async_hello_base import AsyncHelloBaseClient
+from python.stage0.hello_base import HelloBaseClient
+from python.tools.mock_node import DEFAULT_CONTRACT, MockNode
+
+BLOCK_NUMBER = json.dumps(
+    {"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber", "params": []}
+).encode()
+
+
+@pytest.fixture
+def nodes():
+    with MockNode() as a, MockNode() as b:
+        yield a, b
+
+
+@pytest.fixture
+def session():
+    with requests.Session() as session:
+        yield session
+
+
+def post(pool, session, idempotent=None):
+    return json.loads(pool.post(session, BLOCK_NUMBER, timeout=5, idempotent=idempotent))
+
+
+def test_slow_read_is_hedged(nodes, session):
+    slow, fast = nodes
+    slow.slow_rate, slow.slow_latency = 1.0, 0.5
+    pool = EndpointPool([slow.url, fast.url], hedge_delay=0.05, explore=0)
+    slow_endpoint, fast_endpoint = pool.endpoints
+
+    start = time.perf_counter()
+    assert post(pool, session)["result"] == "0x1"
+    assert time.perf_counter() - start < 0.4
+    assert (fast_endpoint.hedges, fast_endpoint.hedge_wins) == (1, 1)
+    pool.close()
+
+
+def test_transactions_are_not_hedged(nodes, session):
+    slow, fast = nodes
+    slow.slow_rate, slow.slow_latency = 1.0, 0.3
+    pool = EndpointPool([slow.url, fast.url], hedge_delay=0.05, explore=0)
+
+    start = time.perf_counter()
+    post(pool, session, idempotent=False)
+    assert time.perf_counter() - start >= 0.3
+    assert fast.round_trips == 0
+    pool.close()
+
+
+def test_breaker_trips_and_fails_over(nodes, session):
+    broken, healthy = nodes
+    broken.error_rate = 1.0
+    pool = EndpointPool([broken.url, healthy.url], failure_threshold=2, explore=0)
+
+    for _ in range(4):
+        assert post(pool, session)["result"] == "0x1"
+    # Two failures opened the breaker; later requests skipped the broken node
+    assert broken.failures == 2
+    assert pool.endpoints[0].breaker.state == "open"
+    pool.close()
+
+
+def test_half_open_endpoint_is_not_used_up_by_ranking(nodes, session):
+    tripped, other = nodes
+    tripped.latency = 0.05
+    pool = EndpointPool([tripped.url, other.url], reset_timeout=0.1, hedge=False, explore=0)
+    tripped_endpoint, other_endpoint = pool.endpoints
+    post(pool, session)  # both unmeasured: the first in order is measured first
+    post(pool, session)
+    assert tripped_endpoint.score() > other_endpoint.score()
+
+    for _ in range(3):
+        tripped_endpoint.record(0.0, ok=False)
+    time.sleep(0.15)
+    assert tripped_endpoint.breaker.state == "half-open"
+
+    # Routed to the faster endpoint; ranking must leave the trial slot alone
+    for _ in range(3):
+        post(pool, session)
+    assert tripped.round_trips == 1
+
+    # The other endpoint fails: the half-open one takes the trial and recovers
+    other.error_rate = 1.0
+    assert post(pool, session)["result"] == "0x1"
+    assert tripped_endpoint.breaker.state == "closed"
+    pool.close()
+
+
+def test_pinned_requests_stay_on_one_endpoint(nodes, session):
+    a, b = nodes
+    pool = EndpointPool([a.url, b.url], explore=0)
+    with pinned():
+        post(pool, session)
+        # b now ranks first, but the flow stays where it started
+        pool.endpoints[0].latency = 1.0
+        for _ in range(3):
+            post(pool, session)
+    assert (a.round_trips, b.round_trips) == (4, 0)
+
+    post(pool, session)
+    assert b.round_trips == 1
+    pool.close()
+
+
+def test_pin_moves_when_its_endpoint_fails(nodes, session):
+    a, b = nodes
+    pool = EndpointPool([a.url, b.url], explore=0, hedge=False)
+    with pinned():
+        post(pool, session)
+        assert (a.round_trips, b.round_trips) == (1, 0)
+        a.error_rate = 1.0
+        post(pool, session)
+        a.error_rate = 0.0
+        post(pool, session)
+    assert (a.round_trips, b.round_trips) == (1, 2)
+    pool.close()
+
+
+@pytest.fixture
+def lagging(monkeypatch, tmp_path, owner):
+    """BASE_SEPOLIA_RPC set to a pool of a node at block 40 and one lagging at block 20."""
+    with MockNode(block_number=40) as ahead, MockNode(block_number=20) as behind:
+        for node in (ahead, behind):
+            for _ in range(3):
+                node.emit_message_updated("update")
+        url = f"{ahead.url},{behind.url}"
+        monkeypatch.setenv("BASE_SEPOLIA_RPC", url)
+        monkeypatch.setenv("CHAIN_ID", str(ahead.chain_id))
+        monkeypatch.setenv("PRIVATE_KEY", owner.key.hex())
+        monkeypatch.setenv("BASE_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setenv("CHAIN_ID_TTL", "0")
+        for name in ("BASE_MAINNET_RPC", "KEYSTORE_PATH", "READ_AGGREGATOR_ADDRESS"):
+            monkeypatch.delenv(name, raising=False)
+
+        registry = get_registry()
+        pool = registry.pool(url)
+        turns = itertools.count()
+
+        def round_robin():
+            # Every request starts at another endpoint, so an unpinned flow mixes them
+            shift = next(turns) % 2
+            return pool.endpoints[shift:] + pool.endpoints[:shift]
+
+        pool.ranked = round_robin
+        yield registry, url, (ahead, behind)
+        registry.clear()
+
+
+def served_by_one_node(nodes, *methods):
+    """The node that answered every call of ``methods``, or None if they were mixed."""
+    used = [node for node in nodes if any(node.method_counts[m] for m in methods)]
+    return used[0] if len(used) == 1 else None
+
+
+def reset(nodes):
+    for node in nodes:
+        node.reset_stats()
+
+
+def test_log_scan_is_pinned(lagging):
+    registry, url, nodes = lagging
+    w3 = registry.get_web3(url)
+    reset(nodes)
+
+    logs = LogScanner(w3, chunk_size=8, max_chunk_size=8).get_logs(from_block=0)
+
+    node = served_by_one_node(nodes, "eth_blockNumber", "eth_getLogs")
+    assert node is not None and node.method_counts["eth_getLogs"] >= 2
+    assert len(logs) == 3
+
+
+def test_async_log_scan_is_pinned(lagging):
+    registry, url, nodes = lagging
+
+    async def scan():
+        try:
+            w3 = registry.get_async_web3(url)
+            await w3.eth.chain_id
+            reset(nodes)
+            scanner = AsyncLogScanner(w3, chunk_size=8, max_chunk_size=8)
+            return await scanner.get_logs(from_block=0)
+        finally:
+            await registry.aclose()
+
+    assert len(asyncio.run(scan())) == 3
+    node = served_by_one_node(nodes, "eth_blockNumber", "eth_getLogs")
+    assert node is not None and node.method_counts["eth_getLogs"] >= 2
+
+
+def test_event_index_sync_is_pinned(lagging, tmp_path):
+    registry, url, nodes = lagging
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    client.rpc
+    client._log_scanner = LogScanner(client.w3, chunk_size=8, max_chunk_size=8)
+    client._event_index = EventIndex(str(tmp_path / "events.sqlite"))
+    reset(nodes)
+
+    synced = client.sync_events()
+
+    node = served_by_one_node(nodes, "eth_blockNumber", "eth_getLogs")
+    assert node is not None
+    # The index may only claim blocks the scanning node actually had
+    assert synced == node.block_number
+    assert client.count_events(to_block=synced) == 3
+
+
+def test_contract_info_is_pinned(lagging):
+    registry, url, nodes = lagging
+    client = HelloBaseClient(DEFAULT_CONTRACT)
+    client.rpc
+    reset(nodes)
+
+    client.get_contract_info()
+
+    assert served_by_one_node(nodes, "eth_blockNumber", "eth_call", "eth_getBalance")
+
+
+def test_async_contract_info_is_pinned(lagging):
+    registry, url, nodes = lagging
+
+    async def info():
+        try:
+            client = AsyncHelloBaseClient(DEFAULT_CONTRACT)
+            await client.get_rpc()
+            reset(nodes)
+            return await client.get_contract_info()
+        finally:
+            await registry.aclose()
+
+    assert asyncio.run(info())["current_message"] == "update"
+    assert served_by_one_node(nodes, "eth_blockNumber", "eth_call", "eth_getBalance")
+
+
+def test_cached_read_on_a_lagging_endpoint(lagging):
+    registry, url, (ahead, behind) = lagging
+    client = HelloBaseClient(DEFAULT_CONTRACT, cache_reads=True)
+    client.rpc
+    pool = registry.pool(url)
+    pool.ranked = lambda: [pool.endpoints[1], pool.endpoints[0]]
+    # The cache learned the head of the node that is ahead
+    client.read_cache.observe_block(ahead.block_number)
+
+    assert client.get_message() == "update"
+    assert client.read_cache.stats()["latest_block"] == behind.block_number
+    assert client.get_message() == "update"
+    assert client.read_cache.hits == 1
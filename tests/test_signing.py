@@ -0,0 +1,65 @@
+"""Tests for bulk signing and verification."""
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from python.common.signing import SignatureVerifier, sign_stream
+
+RECORDS = [{"message": "0xhello"}, {"message": "0x68656c6c6f"}, {"message": "plain"}]
+
+
+def recover(text=None, hexstr=None, signature=None):
+    return Account.recover_message(encode_defunct(text=text, hexstr=hexstr), signature=signature)
+
+
+def test_0x_text_is_signed_as_text_by_default(owner):
+    results = list(sign_stream(RECORDS, owner.key, workers=1))
+
+    assert [r.get("error") for r in results] == [None, None, None]
+    for record, result in zip(RECORDS, results):
+        assert recover(text=record["message"], signature=result["signature"]) == owner.address
+
+
+def test_hex_mode_signs_bytes_and_reports_bad_records(owner):
+    results = list(sign_stream(RECORDS, owner.key, workers=1, hex_messages=True))
+
+    assert "signature" not in results[0] and "hex" in results[0]["error"]
+    assert recover(hexstr="0x68656c6c6f", signature=results[1]["signature"]) == owner.address
+    assert recover(text="hello", signature=results[1]["signature"]) == owner.address
+    assert "error" in results[2]
+
+
+def test_bad_record_does_not_stop_the_pool(owner):
+    records = [{"message": f"m{i}"} for i in range(10)]
+    records[3] = {"other": "no message field"}
+
+    results = list(sign_stream(records, owner.key, workers=2, chunk_size=2))
+
+    assert len(results) == 10
+    assert [i for i, r in enumerate(results) if "error" in r] == [3]
+    assert results[3]["other"] == "no message field"
+
+
+def test_verifier_uses_the_same_hex_flag(owner):
+    signed = list(sign_stream(RECORDS[1:], owner.key, workers=1, hex_messages=True))
+
+    as_text = SignatureVerifier(expected=owner.address, workers=1)
+    as_hex = SignatureVerifier(expected=owner.address, workers=1, hex_messages=True)
+
+    assert len(list(as_text.verify(signed[:1]))) == 1
+    assert list(as_hex.verify(signed[:1])) == []
+
+
+def test_verifier_reports_bad_records_without_expected(owner):
+    good = list(sign_stream(RECORDS[2:], owner.key, workers=1))[0]
+    good["signer"] = owner.address
+    records = ["abc", {**good, "signature": "0x" + "00" * 65}, good, {"message": "x"}]
+    verifier = SignatureVerifier(workers=1)
+
+    results = list(verifier.verify(records))
+
+    assert [r.get("message") for r in results] == ["abc", "plain", "x"]
+    assert all("error" in r and "recovered" not in r for r in results)
+    assert (verifier.checked, verifier.errors, verifier.mismatches) == (4, 3, 0)
+    # Only the good record's recovery is cached
+    assert len(verifier._cache) == 1
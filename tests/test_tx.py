@@ -0,0 +1,58 @@
+"""TxPipeline submission against the mock node."""
+
+import pytest
+
+from python.common.rpc import get_web3
+from python.common.tx import TxPipeline
+
+RECIPIENT = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+TRANSFER = {"to": RECIPIENT, "value": 1, "gas": 21_000}
+
+
+@pytest.fixture
+def pipeline(env, owner):
+    with TxPipeline(get_web3(), owner, chain_id=env.chain_id) as pipeline:
+        yield pipeline
+
+
+def resend_after_accepting(node, error=None):
+    """Make every send reach the node, then fail like a re-send to another endpoint would."""
+    send = node.rpc_eth_sendRawTransaction
+
+    def resent(raw):
+        send(raw)
+        if error:
+            raise ValueError(error)
+        return send(raw)  # "already known"
+
+    node.rpc_eth_sendRawTransaction = resent
+
+
+def test_already_known_counts_as_sent(env, pipeline):
+    resend_after_accepting(env)
+
+    handle = pipeline.submit(TRANSFER)
+
+    assert list(env.transactions) == [handle.tx_hash]
+    assert handle.nonce == 0
+    assert handle.receipt(timeout=10).status == 1
+
+
+def test_nonce_too_low_for_own_bytes_counts_as_sent(env, pipeline):
+    resend_after_accepting(env, "nonce too low: next nonce 1, tx nonce 0")
+
+    handle = pipeline.submit(TRANSFER)
+
+    assert list(env.transactions) == [handle.tx_hash]
+    assert handle.receipt(timeout=10).status == 1
+
+
+def test_nonce_conflict_is_re_signed(env, pipeline, owner):
+    pipeline.submit(TRANSFER)
+    # Another process used the next nonce with the same key
+    env.nonces[owner.address.lower()] += 1
+
+    handle = pipeline.submit(TRANSFER)
+
+    assert handle.nonce == 2
+    assert len(env.transactions) == 2
@@ -0,0 +1,51 @@
+"""Reorg handling of the LogWatcher against the mock node."""
+
+from python.common.rpc import get_web3
+from python.common.watch import LogWatcher
+from python.tools.mock_node import DEFAULT_CONTRACT
+
+
+def poll(watcher):
+    """Process the node's current head once; (block, removed) of every yielded log."""
+    head = watcher.w3.eth.get_block("latest")
+    return [(log["blockNumber"], log["removed"]) for log in watcher._advance(head)]
+
+
+def test_tip_replaced_at_same_height(env):
+    watcher = LogWatcher(get_web3(), address=DEFAULT_CONTRACT)
+    assert poll(watcher) == []
+    env.emit_message_updated("orphaned")
+    assert poll(watcher) == [(2, False)]
+
+    # Block 2 is replaced by a sibling without the log; the head stays at 2
+    env.reorg(1)
+    assert poll(watcher) == [(2, True)]
+
+    env.emit_message_updated("canonical")
+    assert poll(watcher) == [(3, False)]
+
+
+def test_deeper_reorg(env):
+    watcher = LogWatcher(get_web3(), address=DEFAULT_CONTRACT)
+    watcher.last_block = 1
+    env.emit_message_updated("a")
+    env.emit_message_updated("b")
+    env.mine()
+    assert poll(watcher) == [(2, False), (3, False)]
+
+    env.reorg(3)
+    env.mine()
+    assert poll(watcher) == [(3, True), (2, True)]
+    assert poll(watcher) == []
+
+
+def test_missing_block_counts_as_reorged(env):
+    watcher = LogWatcher(get_web3(), address=DEFAULT_CONTRACT)
+    watcher.last_block = 1
+    env.mine(5)
+    poll(watcher)
+    # The node lost its newer blocks: get_block raises BlockNotFound for them
+    env.block_number = 3
+    env.reorg(1)
+    assert poll(watcher) == []
+    assert watcher.last_block == 3